@@ -7,7 +7,8 @@ from urllib.parse import quote_plus
 
 from fmro_auto.adapters.base import ScrapedJob, WebAdapter
 from fmro_auto.core.config import settings
-from fmro_auto.core.scrape_utils import normalize_location, random_delay, safe_text
+from fmro_auto.core.rate_limit import rate_limiter
+from fmro_auto.core.scrape_utils import normalize_location, safe_text
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +46,7 @@ class LiepinAdapter(WebAdapter):
             url = SEARCH_URL.format(keyword=quote_plus(keyword), page=page_num)
             logger.info("Fetching Liepin page %d: %s", page_num, url)
 
+            rate_limiter.wait(url)
             try:
                 page = StealthyFetcher.fetch(url, headless=settings.browser_headless)
             except Exception as e:
@@ -70,8 +72,6 @@ class LiepinAdapter(WebAdapter):
                 logger.info("No next page button found, stopping.")
                 break
 
-            random_delay(settings.scrape_delay_seconds, settings.scrape_delay_seconds + 2)
-
         logger.info("Liepin scrape complete: %d jobs found", len(jobs))
         return jobs
 
@@ -21,7 +21,9 @@ class Settings(BaseSettings):
     # Scraping
     search_keywords: list[str] = ["机器人", "robotics"]
     scrape_max_pages: int = 3
-    scrape_delay_seconds: float = 2.0
+    scrape_delay_seconds: float = 2.0  # minimum gap between requests to one host
+    scrape_rate_per_second: float | None = 0.5
+    scrape_rate_burst: int = 1
 
     # General
     log_level: str = "INFO"
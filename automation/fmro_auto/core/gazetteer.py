@@ -0,0 +1,436 @@
+"""Chinese city gazetteer: find the first city mentioned in a piece of text.
+
+A verbatim copy lives in ``automation/fmro_auto/core/gazetteer.py`` (the automation
+image does not ship ``fmro_pc``); keep the two files identical.
+"""
+
+from __future__ import annotations
+
+# One prefecture-level city (or municipality / SAR) per line:
+#     canonical name | other names of the city | places inside it
+# "<canonical>市" is added automatically; indented lines continue the places of the city
+# above. Places are districts (with their suffix, so bare words do not match),
+# county-level cities and well-known tech parks, listed for the main tech hubs only.
+_CITY_DATA = """
+北京|京城|东城区 西城区 朝阳区 丰台区 石景山区 海淀区 门头沟区 房山区 通州区 顺义区 昌平区
+    大兴区 怀柔区 平谷区 密云区 延庆区 中关村 望京 西二旗 上地 亦庄 五道口
+上海|沪 申城|黄浦区 徐汇区 长宁区 静安区 普陀区 虹口区 杨浦区 闵行区 宝山区 嘉定区 浦东新区 浦东
+    金山区 松江区 青浦区 奉贤区 崇明区 张江 漕河泾 临港
+天津||和平区 南开区 红桥区 东丽区 西青区 津南区 北辰区 武清区 宝坻区 滨海新区 宁河区 静海区 蓟州区
+重庆||渝中区 南岸区 九龙坡区 沙坪坝区 大渡口区 渝北区 巴南区 北碚区 万州区 涪陵区 永川区 江津区
+    合川区 璧山区 江北区
+香港||
+澳门||
+石家庄||长安区 桥西区 新华区 裕华区
+唐山||
+秦皇岛||
+邯郸||
+邢台||
+保定||雄安新区 雄安
+张家口||
+承德||
+沧州||
+廊坊||燕郊
+衡水||
+太原||小店区 迎泽区 杏花岭区 万柏林区
+大同||
+阳泉||
+长治||
+晋城||
+朔州||
+晋中||
+运城||
+忻州||
+临汾||
+吕梁||
+呼和浩特||新城区 赛罕区
+包头||青山区
+乌海||
+赤峰||
+通辽||
+鄂尔多斯||
+呼伦贝尔||
+巴彦淖尔||
+乌兰察布||
+兴安盟||
+锡林郭勒盟|锡林郭勒|
+阿拉善盟|阿拉善|
+沈阳||和平区 沈河区 大东区 皇姑区 浑南区 于洪区
+大连||中山区 西岗区 沙河口区 甘井子区 旅顺口区 金州区
+鞍山||
+抚顺||
+本溪||
+丹东||
+锦州||
+营口||
+阜新||
+辽阳||
+盘锦||
+铁岭||
+朝阳||
+葫芦岛||
+长春||朝阳区 南关区 宽城区 绿园区 净月
+吉林||
+四平||
+辽源||
+通化||
+白山||
+松原||
+白城||
+延边|延边朝鲜族自治州|
+哈尔滨||道里区 南岗区 道外区 香坊区 松北区
+齐齐哈尔||
+鸡西||
+鹤岗||
+双鸭山||宝山区
+大庆||
+伊春||
+佳木斯||
+七台河||
+牡丹江||
+黑河||
+绥化||
+大兴安岭地区||
+南京||玄武区 秦淮区 建邺区 鼓楼区 浦口区 栖霞区 雨花台区 江宁区 六合区 溧水区 高淳区
+无锡||梁溪区 锡山区 惠山区 滨湖区 新吴区 江阴 宜兴
+徐州||鼓楼区
+常州||天宁区 钟楼区 新北区 武进区 金坛区 溧阳
+苏州||姑苏区 虎丘区 吴中区 相城区 吴江区 苏州工业园区 昆山 常熟 张家港 太仓
+南通||通州区
+连云港||
+淮安||
+盐城||
+扬州||
+镇江||
+泰州||
+宿迁||
+杭州|杭城|上城区 拱墅区 西湖区 滨江区 萧山区 余杭区 临平区 钱塘区 富阳区 临安区 未来科技城
+宁波||海曙区 江北区 北仑区 镇海区 鄞州区 奉化区 慈溪 余姚
+温州||
+嘉兴||
+湖州||
+绍兴||
+金华||义乌
+衢州||
+舟山||普陀区
+台州||
+丽水||
+合肥||瑶海区 庐阳区 蜀山区 包河区 肥西 肥东 长丰 庐江
+芜湖||
+蚌埠||
+淮南||
+马鞍山||
+淮北||
+铜陵||
+安庆||
+黄山||
+滁州||
+阜阳||
+宿州||
+六安||
+亳州||
+池州||
+宣城||
+福州||鼓楼区 台江区 仓山区 晋安区 马尾区 长乐区
+厦门||思明区 湖里区 集美区 海沧区 同安区 翔安区
+莆田||
+三明||
+泉州||晋江
+漳州||
+南平||
+龙岩||
+宁德||
+南昌||东湖区 西湖区 青山湖区 红谷滩区
+景德镇||
+萍乡||
+九江||
+新余||
+鹰潭||
+赣州||
+吉安||
+宜春||
+抚州||
+上饶||
+济南||历下区 槐荫区 天桥区 历城区 长清区 章丘区
+青岛||市南区 市北区 黄岛区 崂山区 李沧区 城阳区 即墨区
+淄博||
+枣庄||
+东营||
+烟台||
+潍坊||
+济宁||
+泰安||
+威海||
+日照||
+临沂||
+德州||
+聊城||
+滨州||
+菏泽||
+郑州||二七区 金水区 惠济区 管城回族区 郑东新区
+开封||鼓楼区
+洛阳||
+平顶山||
+安阳||
+鹤壁||
+新乡||
+焦作||
+濮阳||
+许昌||
+漯河||
+三门峡||
+南阳||
+商丘||
+信阳||
+周口||
+驻马店||
+武汉||江岸区 江汉区 硚口区 汉阳区 武昌区 青山区 洪山区 东西湖区 汉南区 蔡甸区 江夏区 黄陂区
+    新洲区 光谷
+黄石||
+十堰||
+宜昌||
+襄阳||
+鄂州||
+荆门||
+孝感||
+荆州||
+黄冈||
+咸宁||
+随州||
+恩施|恩施土家族苗族自治州|
+长沙||芙蓉区 天心区 岳麓区 开福区 雨花区 望城区
+株洲||
+湘潭||
+衡阳||
+邵阳||
+岳阳||
+常德||
+张家界||
+益阳||
+郴州||
+永州||
+怀化||
+娄底||
+湘西|湘西土家族苗族自治州|
+广州|羊城|越秀区 荔湾区 海珠区 天河区 白云区 黄埔区 番禺区 花都区 南沙区 从化区 增城区
+韶关||
+深圳|鹏城|福田区 罗湖区 南山区 盐田区 宝安区 龙岗区 龙华区 坪山区 光明区 大鹏新区 前海
+珠海||香洲区 斗门区 金湾区 横琴
+汕头||
+佛山||禅城区 南海区 顺德区 三水区 高明区
+江门||
+湛江||
+茂名||
+肇庆||
+惠州||
+梅州||
+汕尾||
+河源||
+阳江||
+清远||
+东莞||松山湖
+中山||
+潮州||
+揭阳||
+云浮||
+南宁||
+柳州||
+桂林||
+梧州||
+北海||
+防城港||
+钦州||
+贵港||
+玉林||
+百色||
+贺州||
+河池||
+来宾||
+崇左||
+海口||龙华区
+三亚||
+三沙||
+儋州||
+成都|蓉城|锦江区 青羊区 金牛区 武侯区 成华区 龙泉驿区 青白江区 新都区 温江区 双流区 郫都区
+    新津区 天府新区
+自贡||
+攀枝花||
+泸州||
+德阳||
+绵阳||
+广元||
+遂宁||
+内江||
+乐山||
+南充||
+眉山||
+宜宾||
+广安||
+达州||
+雅安||
+巴中||
+资阳||
+阿坝|阿坝藏族羌族自治州|
+甘孜|甘孜藏族自治州|
+凉山|凉山彝族自治州|
+贵阳||白云区 观山湖区
+六盘水||
+遵义||
+安顺||
+毕节||
+铜仁||
+黔西南|黔西南布依族苗族自治州|
+黔东南|黔东南苗族侗族自治州|
+黔南|黔南布依族苗族自治州|
+昆明||五华区 盘龙区 官渡区 西山区 呈贡区
+曲靖||
+玉溪||
+保山||
+昭通||
+丽江||
+普洱||
+临沧||
+楚雄|楚雄彝族自治州|
+红河|红河哈尼族彝族自治州|
+文山|文山壮族苗族自治州|
+西双版纳|西双版纳傣族自治州|
+大理|大理白族自治州|
+德宏|德宏傣族景颇族自治州|
+怒江|怒江傈僳族自治州|
+迪庆|迪庆藏族自治州|
+拉萨||
+日喀则||
+昌都||
+林芝||
+山南||
+那曲||
+阿里地区||
+西安||碑林区 莲湖区 灞桥区 未央区 雁塔区 阎良区 临潼区 长安区 高陵区 鄠邑区 新城区
+铜川||
+宝鸡||
+咸阳||
+渭南||
+延安||
+汉中||
+榆林||
+安康||
+商洛||
+兰州||
+嘉峪关||
+金昌||
+白银||
+天水||
+武威||
+张掖||
+平凉||
+酒泉||
+庆阳||
+定西||
+陇南||
+临夏|临夏回族自治州|
+甘南|甘南藏族自治州|
+西宁||
+海东||
+海北藏族自治州|海北州|
+黄南藏族自治州|黄南州|
+海南藏族自治州|海南州|
+果洛藏族自治州|果洛州|
+玉树藏族自治州|玉树州|
+海西蒙古族藏族自治州|海西州|
+银川||
+石嘴山||
+吴忠||
+固原||
+中卫||
+乌鲁木齐||
+克拉玛依||
+吐鲁番||
+哈密||
+昌吉|昌吉回族自治州|
+博尔塔拉|博尔塔拉蒙古自治州|
+巴音郭楞|巴音郭楞蒙古自治州|
+阿克苏||
+克孜勒苏|克孜勒苏柯尔克孜自治州|
+喀什||
+和田||
+伊犁|伊犁哈萨克自治州|
+塔城||
+阿勒泰||
+"""
+
+# Tokens that contain a city name without placing the job in that city. They are
+# consumed by the scan so the shorter city name inside them never matches.
+_NOT_CITIES = (
+    "吉林省",
+    "吉林大学",
+    "中山大学",
+    "中山路",
+    "南京路",
+    "北京路",
+    "大理石",
+)
+
+_END = ""
+
+
+def _build() -> tuple[dict[str, str], dict]:
+    names: dict[str, str] = {}
+    places: dict[str, set[str]] = {}
+    canonical = ""
+    for line in _CITY_DATA.strip().splitlines():
+        inside = line
+        if not line.startswith(" "):
+            canonical, aliases, inside = line.split("|")
+            for name in (canonical, f"{canonical}市", *aliases.split()):
+                names[name] = canonical
+        for place in inside.split():
+            places.setdefault(place, set()).add(canonical)
+
+    tokens: dict[str, str | None] = {name: None for name in _NOT_CITIES}
+    for place, cities in places.items():
+        # A district name shared by several cities (鼓楼区, 朝阳区 ...) says nothing.
+        tokens[place] = next(iter(cities)) if len(cities) == 1 else None
+    tokens.update(names)
+
+    trie: dict = {}
+    for token, city in tokens.items():
+        node = trie
+        for char in token:
+            node = node.setdefault(char, {})
+        node[_END] = city
+    return names, trie
+
+
+_NAMES, _TRIE = _build()
+CITY_NAMES = tuple(dict.fromkeys(_NAMES.values()))
+
+
+def canonical_city(name: str | None) -> str | None:
+    """The canonical city for an exact city name or alias ("北京市", "沪"), else ``None``."""
+    if not name:
+        return None
+    return _NAMES.get(name.strip())
+
+
+def find_city(text: str | None) -> str | None:
+    """The canonical city of the leftmost (then longest) gazetteer token in ``text``."""
+    if not text:
+        return None
+    index, length = 0, len(text)
+    while index < length:
+        node = _TRIE.get(text[index])
+        if node is None:
+            index += 1
+            continue
+        matched_end, matched_city = 0, None
+        end = index + 1
+        while True:
+            if _END in node:
+                matched_end, matched_city = end, node[_END]
+            if end >= length or (node := node.get(text[end])) is None:
+                break
+            end += 1
+        if matched_end and matched_city is not None:
+            return matched_city
+        index = matched_end or index + 1
+    return None
@@ -0,0 +1,102 @@
+"""Per-host token-bucket rate limiting shared by all web adapters."""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+from fmro_auto.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RatePolicy:
+    """Token-bucket settings for one host. ``None`` rate means no token limit."""
+
+    requests_per_second: float | None = None
+    burst: int = 1
+    min_interval_seconds: float = 0.0
+
+
+class _TokenBucket:
+    def __init__(self, policy: RatePolicy, now: float) -> None:
+        self.policy = policy
+        self.tokens = float(max(policy.burst, 1))
+        self.updated = now
+        self.next_allowed = now
+
+    def reserve(self, now: float) -> float:
+        rate = self.policy.requests_per_second
+        wait = 0.0
+        if rate:
+            capacity = float(max(self.policy.burst, 1))
+            self.tokens = min(capacity, self.tokens + (now - self.updated) * rate)
+            self.updated = now
+            if self.tokens < 1:
+                wait = (1 - self.tokens) / rate
+            self.tokens -= 1
+        wait = max(wait, self.next_allowed - now)
+        self.next_allowed = now + wait + self.policy.min_interval_seconds
+        return wait
+
+
+def _host_of(url: str) -> str:
+    host = urlsplit(url).netloc.lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+class HostRateLimiter:
+    """Throttle requests per host.
+
+    Hosts without an explicit policy use *default_policy*; pass ``RatePolicy()`` to
+    let unconfigured hosts run unthrottled.
+    """
+
+    def __init__(
+        self,
+        default_policy: RatePolicy | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.default_policy = default_policy or RatePolicy()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._policies: dict[str, RatePolicy] = {}
+        self._buckets: dict[str, _TokenBucket] = {}
+
+    def configure(self, host: str, policy: RatePolicy) -> None:
+        host = _host_of(host) if "://" in host else host.lower()
+        with self._lock:
+            self._policies[host] = policy
+            self._buckets.pop(host, None)
+
+    def reserve(self, url: str) -> float:
+        """Claim the next request slot for *url*'s host and return the delay to honour."""
+        host = _host_of(url)
+        with self._lock:
+            bucket = self._buckets.get(host)
+            now = self._clock()
+            if bucket is None:
+                policy = self._policies.get(host, self.default_policy)
+                bucket = _TokenBucket(policy, now)
+                self._buckets[host] = bucket
+            return bucket.reserve(now)
+
+    def wait(self, url: str) -> float:
+        delay = self.reserve(url)
+        if delay > 0:
+            logger.debug("Rate limit: sleeping %.1fs before %s", delay, url)
+            time.sleep(delay)
+        return delay
+
+
+rate_limiter = HostRateLimiter(
+    RatePolicy(
+        requests_per_second=settings.scrape_rate_per_second,
+        burst=settings.scrape_rate_burst,
+        min_interval_seconds=settings.scrape_delay_seconds,
+    )
+)
@@ -6,6 +6,8 @@ import random
 import re
 import time
 
+from fmro_auto.core.gazetteer import canonical_city, find_city
+
 logger = logging.getLogger(__name__)
 
 
@@ -26,10 +28,22 @@ def normalize_location(raw: str) -> str:
         "北京市" -> "北京"
         "  上海  " -> "上海"
         "广州市·天河区" -> "广州·天河"
+        "沪-浦东" -> "上海·浦东"
+        "南山区" -> "深圳·南山"
+
+    City aliases are replaced by the gazetteer's canonical name; a location that only
+    names a district or county-level city gets its city prepended.
     """
     parts = re.split(r"[·\-/]", raw.strip())
     cleaned = [_CITY_SUFFIX.sub("", p.strip()) for p in parts if p.strip()]
-    return "·".join(cleaned) if cleaned else raw.strip()
+    if not cleaned:
+        return raw.strip()
+    city = canonical_city(cleaned[0])
+    if city is not None:
+        cleaned[0] = city
+    elif (city := find_city(raw)) is not None and not cleaned[0].startswith(city):
+        cleaned.insert(0, city)
+    return "·".join(cleaned)
 
 
 def safe_text(element: object, selector: str, default: str = "") -> str:
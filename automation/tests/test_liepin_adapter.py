@@ -60,8 +60,8 @@ class TestParseCard:
 
 class TestLiepinAdapterScrape:
     @patch("scrapling.fetchers.StealthyFetcher")
-    @patch("fmro_auto.adapters.liepin.random_delay")
-    def test_scrape_returns_jobs(self, mock_delay, mock_fetcher):
+    @patch("fmro_auto.adapters.liepin.rate_limiter")
+    def test_scrape_returns_jobs(self, mock_limiter, mock_fetcher):
         """Verify scrape orchestration with mocked fetcher."""
         # Setup mock page with one card
         mock_card = MagicMock()
@@ -0,0 +1,32 @@
+"""Unit tests for the per-host token-bucket rate limiter."""
+from fmro_auto.core.rate_limit import HostRateLimiter, RatePolicy
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestHostRateLimiter:
+    def test_burst_then_steady_rate(self):
+        clock = FakeClock()
+        limiter = HostRateLimiter(RatePolicy(requests_per_second=1.0, burst=2), clock=clock)
+        delays = [limiter.reserve("https://www.liepin.com/zhaopin/") for _ in range(4)]
+        assert delays == [0.0, 0.0, 1.0, 2.0]
+
+    def test_min_interval_applies_per_host(self):
+        clock = FakeClock()
+        limiter = HostRateLimiter(RatePolicy(min_interval_seconds=2.0), clock=clock)
+        assert limiter.reserve("https://a.example/1") == 0.0
+        assert limiter.reserve("https://a.example/2") == 2.0
+        assert limiter.reserve("https://b.example/1") == 0.0
+
+    def test_configured_host_overrides_default(self):
+        clock = FakeClock()
+        limiter = HostRateLimiter(RatePolicy(min_interval_seconds=5.0), clock=clock)
+        limiter.configure("careers.example.com", RatePolicy())
+        assert limiter.reserve("https://careers.example.com/a") == 0.0
+        assert limiter.reserve("https://careers.example.com/b") == 0.0
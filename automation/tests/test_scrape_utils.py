@@ -26,6 +26,16 @@ class TestNormalizeLocation:
     def test_english_city(self):
         assert normalize_location("Mountain View") == "Mountain View"
 
+    def test_city_alias(self):
+        assert normalize_location("沪-浦东") == "上海·浦东"
+
+    def test_district_gets_city(self):
+        assert normalize_location("南山区") == "深圳·南山"
+        assert normalize_location("昆山") == "苏州·昆山"
+
+    def test_ambiguous_district_left_alone(self):
+        assert normalize_location("鼓楼区") == "鼓楼"
+
 
 class TestSafeText:
     def test_extracts_text(self):
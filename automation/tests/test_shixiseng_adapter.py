@@ -45,8 +45,8 @@ class TestParseCard:
 
 class TestShixisengAdapterScrape:
     @patch("scrapling.fetchers.StealthyFetcher")
-    @patch("fmro_auto.adapters.shixiseng.random_delay")
-    def test_scrape_basic_flow(self, mock_delay, mock_fetcher):
+    @patch("fmro_auto.adapters.shixiseng.rate_limiter")
+    def test_scrape_basic_flow(self, mock_limiter, mock_fetcher):
         mock_card = MagicMock()
         def css_fn(selector):
             result = MagicMock()
@@ -0,0 +1 @@
+"""Offline crawl benchmarks. Run with ``python -m benchmarks.run_bench``."""
@@ -0,0 +1,127 @@
+"""Micro-benchmark: shared anchor index vs. per-parser soup walks on a 5k-anchor page.
+
+    python -m benchmarks.anchor_index --anchors 5000 --repeat 5
+
+The "soup walk" column replays what the parsers did before ``FetchedPage.anchors``:
+``find_all("a")`` plus two ``parent.get_text`` calls per matching anchor. Soup
+construction is excluded from both columns.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+from urllib.parse import urljoin
+
+from fmro_pc.config import SourceConfig
+from fmro_pc.crawl.fetcher import FetchedPage
+from fmro_pc.parsers._common import clean_text, infer_city, looks_like_job_title
+from fmro_pc.parsers.registry import get_parser
+
+PARSERS = ("boss_zhipin", "liepin", "shixiseng", "generic_html")
+LINK_MARKERS = {"boss_zhipin": "/job_detail/", "liepin": "/job/", "shixiseng": "/intern/"}
+CITIES = ("上海", "北京", "深圳", "杭州")
+
+
+def listing_html(anchors: int) -> str:
+    """A listing of job cards (job link + company link), cycling through link shapes."""
+    markers = list(LINK_MARKERS.values())
+    cards = []
+    for index in range(anchors // 2):
+        marker = markers[index % len(markers)]
+        cards.append(
+            f'<li class="job-card"><div class="info">'
+            f'<a href="{marker}{index}.html" title="机器人算法工程师 {index}">'
+            f"<span>机器人算法工程师 {index}</span></a>"
+            f'<a href="/company/{index % 50}.html">智元机器人 {index % 50}</a>'
+            f"<span>{CITIES[index % len(CITIES)]}·浦东</span><span>20-40K·14薪</span>"
+            f"<p>负责 SLAM 与运动控制算法研发，熟悉 C++/Python。</p></div></li>"
+        )
+    return f"<html><body><ul class='job-list'>{''.join(cards)}</ul></body></html>"
+
+
+def _soup_walk(page: FetchedPage, marker: str) -> int:
+    found = 0
+    for anchor in page.soup.find_all("a", href=True):
+        href = anchor.get("href", "").strip()
+        if not href or (marker and marker not in href):
+            continue
+        title = clean_text(anchor.get("title")) or clean_text(anchor.get_text(" ", strip=True))
+        if marker and not looks_like_job_title(title):
+            continue
+        urljoin(page.url, href)
+        clean_text(anchor.parent.get_text(" ", strip=True))
+        infer_city(anchor.parent.get_text(" ", strip=True))
+        found += 1
+    return found
+
+
+def _page(html: str) -> FetchedPage:
+    page = FetchedPage(url="https://bench.example/list", html=html, status_code=200)
+    page.soup  # noqa: B018 - build the tree outside the timed section
+    return page
+
+
+def _best_of(repeat: int, html: str, func: Callable[[FetchedPage], object]) -> float:
+    """Best time of ``func`` over ``repeat`` fresh pages, so index builds are counted."""
+    best = float("inf")
+    for _ in range(repeat):
+        page = _page(html)
+        started = time.perf_counter()
+        func(page)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def _source(name: str) -> SourceConfig:
+    return SourceConfig(
+        key=f"bench_{name}",
+        company_name="Bench",
+        platform=name,
+        parser=name,
+        entry_urls=["https://bench.example/list"],
+    )
+
+
+def _walk_all(page: FetchedPage) -> None:
+    for name in PARSERS:
+        _soup_walk(page, LINK_MARKERS.get(name, ""))
+
+
+def _parse_all(page: FetchedPage) -> None:
+    for name in PARSERS:
+        get_parser(name).parse(page, _source(name))
+
+
+def run(anchors: int, repeat: int) -> list[tuple[str, float, float]]:
+    html = listing_html(anchors)
+    rows = []
+    for name in PARSERS:
+        marker = LINK_MARKERS.get(name, "")
+        parser, source = get_parser(name), _source(name)
+        walk = _best_of(repeat, html, lambda page, marker=marker: _soup_walk(page, marker))
+        indexed = _best_of(
+            repeat, html, lambda page, parser=parser, source=source: parser.parse(page, source)
+        )
+        rows.append((name, walk, indexed))
+    # Several consumers of one page share a single index build.
+    rows.append(("all four", _best_of(repeat, html, _walk_all), _best_of(repeat, html, _parse_all)))
+    return rows
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--anchors", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    print(f"{args.anchors} anchors, best of {args.repeat}")
+    print(f"  {'parser':<14} {'soup walk s':>12} {'anchor index s':>15} {'speedup':>8}")
+    for name, walk, indexed in run(args.anchors, args.repeat):
+        print(f"  {name:<14} {walk:>12.3f} {indexed:>15.3f} {walk / indexed:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,174 @@
+"""End-to-end crawl throughput benchmark against local HTML fixtures.
+
+    python -m benchmarks.run_bench --engines static,scrapling,auto --latency-ms 50
+    python -m benchmarks.run_bench --write-baseline
+
+Each engine runs in a fresh process (so peak RSS is per engine) against a temporary
+SQLite DB, and results are compared with ``benchmarks/baseline.json`` when present.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from benchmarks.server import FixtureServer, fixture_families
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline.json"
+DEFAULT_ENGINES = ("static", "scrapling", "auto")
+# Fixture families are named after their parser; the platform drives tags and warnings.
+PLATFORMS = {"boss_zhipin": "boss_zhipin", "liepin": "liepin", "shixiseng": "shixiseng"}
+# Metrics where a larger number is better; used to label deltas against the baseline.
+HIGHER_IS_BETTER = {"pages_per_second", "jobs_per_second"}
+
+
+def _config_payload(server: FixtureServer, pages_per_source: int) -> dict[str, Any]:
+    sources = []
+    for family in fixture_families():
+        sources.append(
+            {
+                "key": f"bench_{family}",
+                "company_name": f"Bench {family}",
+                "platform": PLATFORMS.get(family, "career_page"),
+                "parser": family,
+                "mode": "static",
+                "entry_urls": [server.url(family, page) for page in range(pages_per_source)],
+            }
+        )
+    return {"sources": sources}
+
+
+def _peak_rss_mb() -> float | None:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux, bytes on macOS.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _run_engine(engine: str, payload: dict[str, Any], options: dict[str, Any]) -> dict[str, Any]:
+    from fmro_pc.config import CompaniesConfig
+    from fmro_pc.crawl.runner import run_crawl
+    from fmro_pc.database import init_db, session_scope
+
+    config = CompaniesConfig.model_validate(payload)
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "bench.db"
+        init_db(db_path)
+        started = time.perf_counter()
+        with session_scope(db_path) as session:
+            summary = run_crawl(session, config, engine=engine, **options)
+        elapsed = time.perf_counter() - started
+
+    profile = summary.profile
+    p50 = profile.latency_percentile(50)
+    p95 = profile.latency_percentile(95)
+    return {
+        "engine": engine,
+        "seconds": round(elapsed, 3),
+        "pages": summary.total_pages_fetched,
+        "jobs": summary.total_jobs_extracted,
+        "failures": summary.total_failures,
+        "pages_per_second": round(summary.total_pages_fetched / elapsed, 2),
+        "jobs_per_second": round(summary.total_jobs_extracted / elapsed, 2),
+        "p50_ms": round(p50, 2) if p50 is not None else None,
+        "p95_ms": round(p95, 2) if p95 is not None else None,
+        "peak_rss_mb": round(rss, 1) if (rss := _peak_rss_mb()) is not None else None,
+    }
+
+
+def run_bench(
+    engines: list[str],
+    *,
+    pages_per_source: int,
+    latency_ms: float,
+    options: dict[str, Any],
+) -> list[dict[str, Any]]:
+    results = []
+    context = multiprocessing.get_context("spawn")
+    with FixtureServer(latency_ms=latency_ms) as server:
+        payload = _config_payload(server, pages_per_source)
+        for engine in engines:
+            with context.Pool(1) as pool:
+                results.append(pool.apply(_run_engine, (engine, payload, options)))
+    return results
+
+
+def _format_delta(metric: str, value: float | None, baseline: float | None) -> str:
+    if value is None or not baseline:
+        return ""
+    change = (value - baseline) / baseline * 100
+    better = change > 0 if metric in HIGHER_IS_BETTER else change < 0
+    return f" ({change:+.0f}%{' better' if better else ''})"
+
+
+def print_report(results: list[dict[str, Any]], baseline: dict[str, Any] | None) -> None:
+    metrics = ["pages_per_second", "jobs_per_second", "p50_ms", "p95_ms", "peak_rss_mb"]
+    baseline_rows = {row["engine"]: row for row in (baseline or {}).get("results", [])}
+    for row in results:
+        print(
+            f"[{row['engine']}] {row['pages']} pages, {row['jobs']} jobs, "
+            f"{row['failures']} failures in {row['seconds']}s"
+        )
+        reference = baseline_rows.get(row["engine"], {})
+        for metric in metrics:
+            value = row[metric]
+            shown = "-" if value is None else value
+            print(f"  {metric:<17} {shown}{_format_delta(metric, value, reference.get(metric))}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--engines", default=",".join(DEFAULT_ENGINES))
+    parser.add_argument("--pages-per-source", type=int, default=25)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--max-per-host", type=int, default=4)
+    parser.add_argument("--parse-workers", type=int, default=1)
+    parser.add_argument("--parse-processes", type=int, default=0)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--write-baseline", action="store_true")
+    parser.add_argument("--json", type=Path, help="Also write the results to this file")
+    args = parser.parse_args(argv)
+
+    settings = {
+        "pages_per_source": args.pages_per_source,
+        "latency_ms": args.latency_ms,
+        "options": {
+            "workers": args.workers,
+            "max_per_host": args.max_per_host,
+            "parse_workers": args.parse_workers,
+            "parse_processes": args.parse_processes,
+        },
+    }
+    results = run_bench([name.strip() for name in args.engines.split(",")], **settings)
+
+    baseline = None
+    if args.baseline.exists() and not args.write_baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        if baseline.get("settings") != settings:
+            print(f"note: {args.baseline} was recorded with different settings")
+    print_report(results, baseline)
+
+    document = json.dumps({"settings": settings, "results": results}, indent=2) + "\n"
+    if args.write_baseline:
+        args.baseline.write_text(document, encoding="utf-8")
+        print(f"Baseline written to {args.baseline}")
+    if args.json:
+        args.json.write_text(document, encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+# Fixtures use this token in job links so every served page yields distinct jobs.
+PAGE_TOKEN = "__PAGE__"
+
+
+def fixture_families() -> list[str]:
+    return sorted(path.stem for path in FIXTURES_DIR.glob("*.html"))
+
+
+class FixtureServer:
+    """Serves ``fixtures/<family>.html`` at ``/<family>/<page>`` with an artificial delay."""
+
+    def __init__(self, latency_ms: float = 0.0) -> None:
+        self.latency_ms = latency_ms
+        self._fixtures = {
+            family: (FIXTURES_DIR / f"{family}.html").read_text(encoding="utf-8")
+            for family in fixture_families()
+        }
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def url(self, family: str, page: int) -> str:
+        return f"{self.base_url}/{family}/{page}"
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:  # noqa: N802
+                family, _, page = self.path.strip("/").partition("/")
+                html = server._fixtures.get(family)
+                if html is None or not page:
+                    self.send_response(404)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                if server.latency_ms > 0:
+                    time.sleep(server.latency_ms / 1000)
+                body = html.replace(PAGE_TOKEN, page).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args) -> None:  # noqa: A002
+                return
+
+        return Handler
+
+    def __enter__(self) -> FixtureServer:
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._server.shutdown()
+        self._server.server_close()
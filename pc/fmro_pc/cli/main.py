@@ -1,19 +1,24 @@
 from __future__ import annotations
 
+import json
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import Literal
 
 import typer
 import yaml
 from pydantic import ValidationError
+from sqlalchemy.exc import OperationalError
 
 from fmro_pc.config import CompaniesConfig, load_companies_config
 from fmro_pc.crawl.live_browser import crawl_live
+from fmro_pc.crawl.profile import format_profile_table
 from fmro_pc.crawl.runner import run_crawl
-from fmro_pc.database import init_db, resolve_db_path, session_scope
+from fmro_pc.database import init_db, read_only_session, resolve_db_path, session_scope
 from fmro_pc.parsers.registry import PARSER_REGISTRY, get_parser
 from fmro_pc.services.export import export_csv, export_markdown
 from fmro_pc.services.jobs import mark_applied, query_jobs, set_bookmark, set_note
+from fmro_pc.storage.repository import load_breaker_records
 
 app = typer.Typer(help="FMRO PC crawler", no_args_is_help=True)
 
@@ -58,6 +63,7 @@ def db_init(
 def sources_list(
     config: Path = typer.Option(Path("companies.yaml"), "--config", help="Path to companies.yaml"),
     all_sources: bool = typer.Option(False, "--all", help="Include disabled sources"),
+    db: Path = typer.Option(None, "--db", help="SQLite database path (for cool-down state)"),
 ) -> None:
     cfg = _load_config_or_exit(config)
     sources = cfg.sources if all_sources else [source for source in cfg.sources if source.enabled]
@@ -66,11 +72,30 @@ def sources_list(
         typer.echo("No sources found.")
         return
 
-    typer.echo("KEY                   ENABLED  PLATFORM      MODE     PARSER         URLS")
+    # A listing must not create or migrate the database; cool-downs are shown if it exists.
+    now = datetime.now(UTC)
+    cooldowns: dict[str, list[str]] = {}
+    with read_only_session(db) as session:
+        try:
+            records = load_breaker_records(session) if session is not None else []
+        except OperationalError:
+            # Database from before the breaker table existed.
+            records = []
+        for record in records:
+            if record.is_open(now):
+                cooldowns.setdefault(record.source_key, []).append(
+                    f"{record.host} until {record.open_until:%m-%d %H:%M} UTC "
+                    f"(x{record.trips}, {record.last_reason})"
+                )
+
+    typer.echo(
+        "KEY                   ENABLED  PLATFORM      MODE     PARSER         URLS  COOL-DOWN"
+    )
     for source in sources:
         typer.echo(
             f"{source.key:20} {str(source.enabled):7}  "
-            f"{source.platform:12} {source.mode:8} {source.parser:14} {len(source.entry_urls)}"
+            f"{source.platform:12} {source.mode:8} {source.parser:14} "
+            f"{len(source.entry_urls):<5} {'; '.join(cooldowns.get(source.key, [])) or '-'}"
         )
 
 
@@ -109,10 +134,44 @@ def crawl_run(
     dynamic: bool = typer.Option(
         False, "--dynamic", help="Force dynamic fetch mode for all sources"
     ),
-    engine: Literal["auto", "scrapling", "static"] = typer.Option(
+    engine: Literal["auto", "scrapling", "static", "async"] = typer.Option(
         "auto",
         "--engine",
-        help="Static fetch engine when not dynamic: auto|scrapling|static",
+        help="Static fetch engine when not dynamic: auto|scrapling|static|async",
+    ),
+    workers: int = typer.Option(1, "--workers", min=1, help="Number of fetch threads"),
+    max_per_host: int = typer.Option(
+        2, "--max-per-host", min=1, help="Max concurrent fetches against one host"
+    ),
+    parse_workers: int = typer.Option(1, "--parse-workers", min=1, help="Number of parse threads"),
+    parse_processes: int = typer.Option(
+        0,
+        "--parse-processes",
+        min=0,
+        help="Parse in this many worker processes instead of threads (0 = off)",
+    ),
+    normalize_workers: int = typer.Option(
+        1, "--normalize-workers", min=1, help="Number of normalize threads"
+    ),
+    queue_size: int = typer.Option(
+        16, "--queue-size", min=1, help="Max pages buffered between pipeline stages"
+    ),
+    browsers: int = typer.Option(
+        1, "--browsers", min=1, help="Browsers kept alive for dynamic sources"
+    ),
+    soup_backend: Literal["auto", "lxml", "html.parser"] = typer.Option(
+        "auto",
+        "--soup-backend",
+        help="HTML tree builder for parsers: auto (lxml if installed)|lxml|html.parser",
+    ),
+    drop_html: bool = typer.Option(
+        False, "--drop-html", help="Free each page's raw HTML once its parse tree is built"
+    ),
+    profile: bool = typer.Option(
+        False, "--profile", help="Print per-stage wall/CPU time and byte counters"
+    ),
+    profile_json: Path | None = typer.Option(
+        None, "--profile-json", help="Write the per-stage profile to this JSON file"
     ),
 ) -> None:
     cfg = _load_config_or_exit(config)
@@ -126,37 +185,84 @@ def crawl_run(
             limit=limit,
             force_dynamic=dynamic,
             engine=engine,
+            workers=workers,
+            max_per_host=max_per_host,
+            parse_workers=parse_workers,
+            parse_processes=parse_processes,
+            normalize_workers=normalize_workers,
+            queue_size=queue_size,
+            browsers=browsers,
+            soup_backend=soup_backend,
+            keep_html=not drop_html,
         )
 
     typer.echo("Crawl run complete")
     typer.echo(f"- sources scanned: {summary.source_count}")
     typer.echo(f"- pages fetched: {summary.total_pages_fetched}")
+    typer.echo(f"- pages not modified: {summary.total_pages_not_modified}")
+    typer.echo(f"- pages unchanged: {summary.total_pages_unchanged}")
+    typer.echo(f"- pages skipped (circuit breaker): {summary.total_pages_skipped}")
     typer.echo(f"- jobs extracted: {summary.total_jobs_extracted}")
     typer.echo(f"- jobs normalized: {summary.total_jobs_normalized}")
     typer.echo(f"- jobs inserted: {summary.total_jobs_inserted}")
     typer.echo(f"- jobs updated: {summary.total_jobs_updated}")
     typer.echo(f"- jobs deactivated: {summary.total_jobs_deactivated}")
+    typer.echo(
+        f"- requests blocked: {summary.total_requests_blocked} "
+        f"(~{summary.total_bytes_saved // 1024} KB saved)"
+    )
+    typer.echo(
+        f"- retries: {summary.total_retries} (+{summary.total_retry_seconds:.1f}s spent retrying)"
+    )
     typer.echo(f"- failures: {summary.total_failures}")
 
     for source_summary in summary.sources:
         typer.echo(
-            f"  [{source_summary.source_key}] pages={source_summary.pages_fetched} "
+            f"  [{source_summary.source_key}] engine={source_summary.engine_label} "
+            f"pages={source_summary.pages_fetched} "
+            f"not_modified={source_summary.pages_not_modified} "
+            f"unchanged={source_summary.pages_unchanged} "
+            f"skipped={source_summary.pages_skipped} "
             f"extracted={source_summary.jobs_extracted} "
             f"normalized={source_summary.jobs_normalized} "
             f"inserted={source_summary.upsert.inserted} updated={source_summary.upsert.updated} "
             f"deactivated={source_summary.upsert.deactivated} "
-            f"dupes={source_summary.upsert.duplicates_skipped}"
+            f"dupes={source_summary.upsert.duplicates_skipped} "
+            f"blocked={source_summary.requests_blocked} "
+            f"retries={source_summary.retries}"
         )
         for error in source_summary.errors:
             typer.echo(f"    ! {error}")
 
+    if profile:
+        typer.echo("Profile")
+        rows = [(item.source_key, item.profile) for item in summary.sources]
+        rows.append(("total", summary.profile))
+        for line in format_profile_table(rows):
+            typer.echo(line)
+
+    if profile_json is not None:
+        payload = {
+            "total": summary.profile.to_dict(),
+            "sources": {item.source_key: item.profile.to_dict() for item in summary.sources},
+        }
+        profile_json.parent.mkdir(parents=True, exist_ok=True)
+        profile_json.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        typer.echo(f"Profile written to {profile_json}")
+
 
 @crawl_app.command("live")
 def crawl_live_command(
     config: Path = typer.Option(Path("companies.yaml"), "--config", help="Path to companies.yaml"),
     db: Path = typer.Option(None, "--db", help="SQLite database path"),
     source: str | None = typer.Option(None, "--source", help="Single source key to crawl"),
-    max_scroll_rounds: int = typer.Option(8, "--scroll-rounds", min=1, max=30),
+    max_scroll_rounds: int = typer.Option(
+        30,
+        "--scroll-rounds",
+        min=1,
+        max=100,
+        help="Max scroll rounds; stops earlier once the job list stops growing",
+    ),
     session_dir: Path = typer.Option(
         Path("data/sessions"),
         "--session-dir",
@@ -186,7 +292,8 @@ def crawl_live_command(
         typer.echo(
             f"  [{result.source_key}] extracted={result.extracted} normalized={result.normalized} "
             f"inserted={result.upsert.inserted} updated={result.upsert.updated} "
-            f"deactivated={result.upsert.deactivated} dupes={result.upsert.duplicates_skipped}"
+            f"deactivated={result.upsert.deactivated} dupes={result.upsert.duplicates_skipped} "
+            f"blocked={result.requests_blocked} (~{result.bytes_saved // 1024} KB saved)"
         )
         for error in result.errors[:8]:
             typer.echo(f"    ! {error}")
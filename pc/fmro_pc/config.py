@@ -1,11 +1,116 @@
 from __future__ import annotations
 
 import json
+import re
 from pathlib import Path
 from typing import Literal
 
+import soupsieve
 import yaml
-from pydantic import BaseModel, Field, ValidationError, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    ValidationError,
+    field_validator,
+    model_validator,
+)
+
+
+class RateLimitConfig(BaseModel):
+    """Per-host politeness settings; the defaults mean "no throttling"."""
+
+    requests_per_second: float | None = Field(default=None, gt=0)
+    burst: int = Field(default=1, ge=1)
+    min_interval_seconds: float = Field(default=0.0, ge=0)
+
+
+class RetryConfig(BaseModel):
+    """Retries for transient fetch failures (network errors, 429 and 5xx responses)."""
+
+    max_attempts: int = Field(default=3, ge=1)
+    base_delay_seconds: float = Field(default=1.0, ge=0)
+    max_delay_seconds: float = Field(default=30.0, ge=0)
+    retry_statuses: list[int] = Field(default_factory=lambda: [429, 500, 502, 503, 504])
+
+
+RESOURCE_TYPES = {
+    "stylesheet",
+    "image",
+    "media",
+    "font",
+    "script",
+    "texttrack",
+    "xhr",
+    "fetch",
+    "eventsource",
+    "websocket",
+    "manifest",
+    "other",
+}
+
+
+class ResourcePolicyConfig(BaseModel):
+    """Subresources that dynamic fetches skip; the page document itself is never blocked."""
+
+    block_resource_types: list[str] = Field(default_factory=lambda: ["image", "media", "font"])
+    block_domains: list[str] = Field(default_factory=list)
+    block_url_patterns: list[str] = Field(default_factory=list)
+
+    @field_validator("block_resource_types")
+    @classmethod
+    def validate_resource_types(cls, values: list[str]) -> list[str]:
+        normalized = [value.strip().lower() for value in values if value.strip()]
+        unknown = sorted(set(normalized) - RESOURCE_TYPES)
+        if unknown:
+            supported = ", ".join(sorted(RESOURCE_TYPES))
+            raise ValueError(f"unknown resource types {unknown}. Supported: {supported}")
+        return normalized
+
+    @field_validator("block_domains")
+    @classmethod
+    def validate_domains(cls, values: list[str]) -> list[str]:
+        return [value.strip().lower().lstrip(".") for value in values if value.strip()]
+
+    @field_validator("block_url_patterns")
+    @classmethod
+    def validate_url_patterns(cls, values: list[str]) -> list[str]:
+        for value in values:
+            try:
+                re.compile(value)
+            except re.error as exc:
+                raise ValueError(f"invalid URL pattern {value!r}: {exc}") from exc
+        return values
+
+
+class SelectorConfig(BaseModel):
+    """CSS selectors for the ``selectors`` parser; all but ``card`` are relative to a card."""
+
+    # Frozen so the compiled form can be cached per selector block.
+    model_config = ConfigDict(frozen=True)
+
+    card: str
+    title: str | None = None
+    link: str | None = None
+    company: str | None = None
+    location: str | None = None
+    salary: str | None = None
+    # Matched against the whole page; followed up to ``crawl_depth`` pages per entry URL.
+    next_page: str | None = None
+
+    @field_validator("card", "title", "link", "company", "location", "salary", "next_page")
+    @classmethod
+    def validate_selector(cls, value: str | None) -> str | None:
+        if value is None:
+            return None
+        selector = value.strip()
+        if not selector:
+            raise ValueError("selector cannot be blank")
+        try:
+            soupsieve.compile(selector)
+        except soupsieve.SelectorSyntaxError as exc:
+            raise ValueError(f"invalid CSS selector {selector!r}: {exc}") from exc
+        return selector
 
 
 class SourceConfig(BaseModel):
@@ -21,6 +126,17 @@ class SourceConfig(BaseModel):
     city_allowlist: list[str] = Field(default_factory=list)
     request_headers: dict[str, str] = Field(default_factory=dict)
     crawl_depth: int = Field(default=1, ge=1)
+    # Decoded bytes an HTTP engine reads per page before giving up on it.
+    max_page_bytes: int = Field(default=5_000_000, ge=1)
+    rate_limit: RateLimitConfig = Field(default_factory=RateLimitConfig)
+    retry: RetryConfig = Field(default_factory=RetryConfig)
+    resource_policy: ResourcePolicyConfig = Field(default_factory=ResourcePolicyConfig)
+    # Card selectors for the "selectors" parser.
+    selectors: SelectorConfig | None = None
+    # Dynamic fetches parse the platform's job-list API responses when a JSON parser exists.
+    capture_api_json: bool = True
+    # Read JSON-LD / __NEXT_DATA__ / __INITIAL_STATE__ job data before parsing the DOM.
+    embedded_data: bool = True
     notes: str | None = None
 
     @field_validator("key", "company_name", "platform", "parser")
@@ -57,6 +173,12 @@ class SourceConfig(BaseModel):
             normalized[k] = v
         return normalized
 
+    @model_validator(mode="after")
+    def validate_selectors(self) -> SourceConfig:
+        if self.parser == "selectors" and self.selectors is None:
+            raise ValueError("parser 'selectors' needs a selectors block")
+        return self
+
 
 class CompaniesConfig(BaseModel):
     sources: list[SourceConfig] = Field(default_factory=list)
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from urllib.parse import urljoin, urlsplit
+
+from bs4 import BeautifulSoup
+from bs4.element import Tag
+
+# Anchor attributes parsers fall back on when the visible text is obfuscated.
+TITLE_ATTRS = ("title", "aria-label", "data-title", "data-name")
+# Elements that usually wrap one job card in a listing.
+CARD_TAGS = frozenset({"li", "tr", "article", "dd"})
+CARD_CLASS_HINTS = ("card", "item", "job")
+# ...but not the list that holds all the cards.
+LIST_CLASS_HINTS = ("list", "wrap", "container")
+# How far above the anchor's parent to look for the card element.
+CARD_MAX_DEPTH = 3
+
+
+def _collapse(text: str) -> str:
+    return " ".join(text.split())
+
+
+def _is_card(tag: Tag) -> bool:
+    if tag.name in CARD_TAGS:
+        return True
+    classes = " ".join(tag.get("class") or ()).lower()
+    if any(hint in classes for hint in LIST_CLASS_HINTS):
+        return False
+    return any(hint in classes for hint in CARD_CLASS_HINTS)
+
+
+def _card_of(parent: Tag) -> Tag:
+    node: Tag | None = parent
+    for _ in range(CARD_MAX_DEPTH + 1):
+        if node is None or node.name == "[document]":
+            break
+        if _is_card(node):
+            return node
+        node = node.parent
+    return parent
+
+
+def _wraps_only(card: Tag, parent: Tag) -> bool:
+    """Whether ``card``'s text is exactly ``parent``'s (single-child wrappers only)."""
+    node = card
+    while node is not parent:
+        children = [
+            child
+            for child in node.children
+            if isinstance(child, Tag) or (isinstance(child, str) and child.strip())
+        ]
+        if len(children) != 1 or not isinstance(children[0], Tag):
+            return False
+        node = children[0]
+    return True
+
+
+def _url_resolver(base_url: str):
+    """``urljoin`` against one base, with fast paths for the common href shapes."""
+    parts = urlsplit(base_url)
+    origin = f"{parts.scheme}://{parts.netloc}"
+
+    def resolve(href: str) -> str:
+        if href.startswith(("http://", "https://")):
+            return href
+        if href.startswith("/") and not href.startswith("//") and "/." not in href:
+            return origin + href
+        return urljoin(base_url, href)
+
+    return resolve
+
+
+class _TextCache:
+    """Whitespace-collapsed ``get_text`` per element, shared by every anchor of a page."""
+
+    __slots__ = ("_texts",)
+
+    def __init__(self) -> None:
+        self._texts: dict[int, str] = {}
+
+    def text_of(self, tag: Tag | None) -> str:
+        if tag is None:
+            return ""
+        text = self._texts.get(id(tag))
+        if text is None:
+            text = self._texts[id(tag)] = _collapse(tag.get_text(" ", strip=True))
+        return text
+
+    def card_text_of(self, parent: Tag | None) -> str:
+        if parent is None:
+            return ""
+        card = _card_of(parent)
+        if card is not parent and id(card) not in self._texts and _wraps_only(card, parent):
+            self._texts[id(card)] = self.text_of(parent)
+        return self.text_of(card)
+
+
+class AnchorRecord:
+    """One ``<a href>`` of a page: href, resolved URL and title attributes.
+
+    ``text``, ``parent_text`` and ``card_text`` are extracted on first read and cached
+    per element for the whole page, so anchors sharing a parent or card (and every
+    parser reading the same page) pay for each subtree's text once.
+    """
+
+    __slots__ = ("href", "url", "title_attrs", "_tag", "_cache")
+
+    def __init__(
+        self,
+        href: str,
+        url: str,
+        title_attrs: tuple[tuple[str, str], ...],
+        tag: Tag,
+        cache: _TextCache,
+    ) -> None:
+        self.href = href
+        self.url = url
+        self.title_attrs = title_attrs
+        self._tag = tag
+        self._cache = cache
+
+    def attr(self, name: str) -> str:
+        for key, value in self.title_attrs:
+            if key == name:
+                return value
+        return ""
+
+    @property
+    def text(self) -> str:
+        return self._cache.text_of(self._tag)
+
+    @property
+    def parent_text(self) -> str:
+        return self._cache.text_of(self._tag.parent)
+
+    @property
+    def card_text(self) -> str:
+        return self._cache.card_text_of(self._tag.parent)
+
+    def __repr__(self) -> str:
+        return f"AnchorRecord(href={self.href!r}, url={self.url!r})"
+
+
+def build_anchor_index(soup: BeautifulSoup, base_url: str) -> list[AnchorRecord]:
+    """One pass over the page's ``<a href>`` elements, in document order."""
+    cache = _TextCache()
+    resolve = _url_resolver(base_url)
+    records: list[AnchorRecord] = []
+    # Plain find_all("a") plus an attrs check is much cheaper than find_all(href=True).
+    for anchor in soup.find_all("a"):
+        href = anchor.attrs.get("href")
+        if not isinstance(href, str) or not (href := href.strip()):
+            continue
+        title_attrs = tuple(
+            (name, value.strip())
+            for name in TITLE_ATTRS
+            if isinstance(value := anchor.attrs.get(name), str) and value.strip()
+        )
+        records.append(AnchorRecord(href, resolve(href), title_attrs, anchor, cache))
+    return records
@@ -1,71 +1,313 @@
 from __future__ import annotations
 
-import time
+import os
+import queue
+import threading
+from concurrent.futures import Future
+from contextlib import ExitStack
+from dataclasses import dataclass
+from pathlib import Path
 
-from bs4 import BeautifulSoup
+from fmro_pc.crawl.fetcher import FetchedPage, FetchError, raise_for_status
+from fmro_pc.crawl.resource_policy import ResourcePolicy, RouteBlocker
+from fmro_pc.crawl.scroll import scroll_until_stable
+from fmro_pc.crawl.throttle import HostRateLimiter
+from fmro_pc.crawl.xhr_capture import ResponseCapture
 
-from fmro_pc.crawl.fetcher import FetchedPage
+# How often (in pages) a browser worker re-checks the RSS of its process tree.
+RSS_CHECK_EVERY = 10
+
+
+def _process_table() -> tuple[dict[int, int], dict[int, int]] | None:
+    """``(parent pid, resident bytes)`` per process from ``/proc``, or ``None`` without it."""
+    proc = Path("/proc")
+    if not proc.is_dir():
+        return None
+    page_size = os.sysconf("SC_PAGE_SIZE")
+
+    parents: dict[int, int] = {}
+    resident: dict[int, int] = {}
+    for entry in proc.iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            stat = (entry / "stat").read_text()
+            statm = (entry / "statm").read_text()
+        except OSError:
+            continue
+        # The command name may contain spaces; fields after it are positional.
+        fields = stat.rsplit(")", 1)[1].split()
+        pid = int(entry.name)
+        parents[pid] = int(fields[1])
+        resident[pid] = int(statm.split()[1]) * page_size
+    return parents, resident
+
+
+def process_tree_rss_mb(root_pid: int | None = None) -> float | None:
+    """RSS of every descendant of ``root_pid`` (browser, renderers, driver), in MiB.
+
+    Reads ``/proc``; returns ``None`` where that is not available.
+    """
+    table = _process_table()
+    if table is None:
+        return None
+    parents, resident = table
+    root_pid = root_pid or os.getpid()
+
+    total = 0
+    for pid in resident:
+        ancestor = parents.get(pid)
+        while ancestor and ancestor != root_pid:
+            ancestor = parents.get(ancestor)
+        if ancestor == root_pid:
+            total += resident[pid]
+    return total / (1024 * 1024)
+
+
+def playwright_driver_pids() -> set[int]:
+    """PIDs of the Playwright driver processes this process has started."""
+    table = _process_table()
+    if table is None:
+        return set()
+    parents, _ = table
+    me = os.getpid()
+    pids: set[int] = set()
+    for pid, parent in parents.items():
+        if parent != me:
+            continue
+        try:
+            cmdline = Path(f"/proc/{pid}/cmdline").read_bytes()
+        except OSError:
+            continue
+        if b"run-driver" in cmdline:
+            pids.add(pid)
+    return pids
+
+
+# Browser workers start their drivers one at a time so each can tell which one is its own.
+_DRIVER_START_LOCK = threading.Lock()
+
+
+@dataclass
+class _BrowserJob:
+    url: str
+    headers: dict[str, str] | None
+    resource_policy: ResourcePolicy | None
+    scroll_selector: str
+    capture_url_patterns: tuple[str, ...]
+    session_key: str | None
+    future: Future[FetchedPage]
+
+    @property
+    def context_key(self) -> tuple[str | None, tuple[tuple[str, str], ...]]:
+        """Jobs share a browser context (cookies, storage) only when this matches."""
+        return self.session_key, tuple(sorted((self.headers or {}).items()))
 
 
 class PlaywrightFetcher:
-    """Optional dynamic page fetcher.
+    """Optional dynamic page fetcher backed by a pool of long-lived browsers.
+
+    Playwright's sync API is bound to the thread that started it, so each of the
+    ``pool_size`` browsers lives on its own worker thread and ``fetch`` (callable from
+    any crawl thread) hands URLs to them. A worker launches Chromium once and reuses one
+    context/page for up to ``pages_per_context`` consecutive pages with the same
+    ``session_key`` (the source) and headers; any other job gets a fresh context, so
+    cookies and storage never cross sources. It relaunches the browser when its own
+    process tree grows past ``max_rss_mb`` (a per-browser budget; other workers'
+    browsers and parse processes do not count). Requests matching the caller's
+    ``ResourcePolicy`` are aborted through route interception, and JSON responses
+    matching ``capture_url_patterns`` are kept on the returned page.
 
     This module intentionally keeps the dependency optional.
     Install with: `pip install .[dynamic]`
     """
 
-    def __init__(self, timeout_ms: int = 20_000, scroll_rounds: int = 4) -> None:
+    def __init__(
+        self,
+        timeout_ms: int = 20_000,
+        max_scroll_rounds: int = 30,
+        max_scroll_seconds: float = 15.0,
+        rate_limiter: HostRateLimiter | None = None,
+        pool_size: int = 1,
+        pages_per_context: int = 50,
+        max_rss_mb: float | None = 1500.0,
+    ) -> None:
         self.timeout_ms = timeout_ms
-        self.scroll_rounds = scroll_rounds
+        self.max_scroll_rounds = max_scroll_rounds
+        self.max_scroll_seconds = max_scroll_seconds
+        self.pool_size = pool_size
+        self.pages_per_context = pages_per_context
+        self.max_rss_mb = max_rss_mb
+        self._rate_limiter = rate_limiter
+        self._jobs: queue.Queue[_BrowserJob | None] = queue.Queue()
+        self._workers: list[threading.Thread] = []
+        self._lock = threading.Lock()
 
-    def _auto_scroll(self, page) -> None:
-        for _ in range(self.scroll_rounds):
-            page.mouse.wheel(0, 4000)
-            page.wait_for_timeout(800)
+    def _ensure_workers(self) -> None:
+        with self._lock:
+            if self._workers:
+                return
+            for index in range(self.pool_size):
+                worker = threading.Thread(
+                    target=self._work,
+                    name=f"fmro-browser-{index}",
+                    daemon=True,
+                )
+                worker.start()
+                self._workers.append(worker)
 
-    def fetch(self, url: str, headers: dict[str, str] | None = None) -> FetchedPage:
+    def fetch(
+        self,
+        url: str,
+        headers: dict[str, str] | None = None,
+        *,
+        resource_policy: ResourcePolicy | None = None,
+        scroll_selector: str = "a[href]",
+        capture_url_patterns: tuple[str, ...] = (),
+        session_key: str | None = None,
+    ) -> FetchedPage:
         try:
-            from playwright.sync_api import sync_playwright
+            import playwright.sync_api  # noqa: F401
         except ImportError as exc:
             raise RuntimeError(
                 "Playwright is not installed. Install optional dependency with `.[dynamic]`."
             ) from exc
 
-        with sync_playwright() as playwright:
-            browser = playwright.chromium.launch(headless=True)
-            context = browser.new_context(extra_http_headers=headers or None)
-            page = context.new_page()
+        self._ensure_workers()
+        future: Future[FetchedPage] = Future()
+        self._jobs.put(
+            _BrowserJob(
+                url,
+                headers,
+                resource_policy,
+                scroll_selector,
+                capture_url_patterns,
+                session_key,
+                future,
+            )
+        )
+        return future.result()
+
+    def _work(self) -> None:
+        from playwright.sync_api import sync_playwright
+
+        try:
+            with ExitStack() as stack:
+                with _DRIVER_START_LOCK:
+                    started = playwright_driver_pids()
+                    playwright = stack.enter_context(sync_playwright())
+                    drivers = playwright_driver_pids() - started
+                self._serve(playwright, drivers)
+        except Exception as exc:  # noqa: BLE001
+            # The driver itself failed; fail whatever this worker picks up from now on.
+            while (job := self._jobs.get()) is not None:
+                job.future.set_exception(RuntimeError(f"browser worker failed: {exc}"))
+
+    def _serve(self, playwright, drivers: set[int]) -> None:
+        browser = None
+        context = None
+        page = None
+        blocker = RouteBlocker()
+        capture = ResponseCapture()
+        served = 0
+        context_key = None
+        try:
+            while (job := self._jobs.get()) is not None:
+                future = job.future
+                if not future.set_running_or_notify_cancel():
+                    continue
 
-            response = None
-            last_exc = None
-            for _ in range(2):
                 try:
-                    response = page.goto(
-                        url,
-                        wait_until="domcontentloaded",
-                        timeout=self.timeout_ms,
-                    )
-                    self._auto_scroll(page)
-                    page.wait_for_load_state("networkidle", timeout=self.timeout_ms)
-                    last_exc = None
-                    break
+                    if browser is not None and (
+                        not browser.is_connected() or self._should_relaunch(served, drivers)
+                    ):
+                        self._quietly_close(browser)
+                        browser = context = page = None
+                    if browser is None:
+                        browser = playwright.chromium.launch(headless=True)
+                    if context is not None and (
+                        served >= self.pages_per_context or context_key != job.context_key
+                    ):
+                        self._quietly_close(context)
+                        context = page = None
+                    if context is None:
+                        context = browser.new_context()
+                        context_key = job.context_key
+                        blocker.install(context)
+                        page = context.new_page()
+                        capture.install(page)
+                        served = 0
+                    page.set_extra_http_headers(job.headers or {})
+                    blocker.reset(job.resource_policy)
+                    capture.reset(job.url, job.capture_url_patterns)
+                    result = self._load(page, job.url, job.scroll_selector)
+                    result.captured_json = capture.take()
+                    result.requests_blocked = blocker.stats.requests_blocked
+                    result.bytes_saved = blocker.stats.bytes_saved
+                    served += 1
                 except Exception as exc:  # noqa: BLE001
-                    last_exc = exc
-                    time.sleep(1)
+                    # Start the next URL from a clean context.
+                    if context is not None:
+                        self._quietly_close(context)
+                        context = page = None
+                    future.set_exception(exc)
+                    continue
+                future.set_result(result)
+        finally:
+            if browser is not None:
+                self._quietly_close(browser)
+
+    @staticmethod
+    def _quietly_close(resource) -> None:
+        try:
+            resource.close()
+        except Exception:  # noqa: BLE001
+            pass
 
-            if last_exc is not None:
-                browser.close()
-                raise RuntimeError(f"dynamic fetch retry failed: {last_exc}")
+    def _should_relaunch(self, served: int, drivers: set[int]) -> bool:
+        """Whether this worker's own browser (its driver's process tree) is over budget."""
+        if self.max_rss_mb is None or not drivers or served == 0 or served % RSS_CHECK_EVERY:
+            return False
+        return sum(process_tree_rss_mb(pid) or 0.0 for pid in drivers) > self.max_rss_mb
 
-            html = page.content()
-            final_url = page.url
-            status_code = response.status if response else 200
-            browser.close()
+    def _load(self, page, url: str, scroll_selector: str) -> FetchedPage:
+        # One attempt per call; retries belong to the crawl's RetryPolicy.
+        if self._rate_limiter is not None:
+            self._rate_limiter.wait(url)
+        try:
+            response = page.goto(url, wait_until="domcontentloaded", timeout=self.timeout_ms)
+            # No networkidle wait: long-polling pages never settle. The scroller
+            # returns once the list stops growing.
+            scroll_until_stable(
+                page,
+                selector=scroll_selector,
+                max_rounds=self.max_scroll_rounds,
+                max_seconds=self.max_scroll_seconds,
+            )
+        except Exception as exc:
+            raise FetchError(f"playwright failed to load {url}: {exc}") from exc
 
+        status_code = response.status if response else 200
+        retry_after = (getattr(response, "headers", None) or {}).get("retry-after")
+        raise_for_status(url, status_code, "playwright", retry_after)
+        html = page.content()
         return FetchedPage(
-            url=final_url,
+            url=page.url,
             html=html,
-            soup=BeautifulSoup(html, "html.parser"),
             status_code=status_code,
             dynamic=True,
         )
+
+    def close(self) -> None:
+        with self._lock:
+            workers, self._workers = self._workers, []
+        for _ in workers:
+            self._jobs.put(None)
+        for worker in workers:
+            worker.join()
+
+    def __enter__(self) -> PlaywrightFetcher:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import codecs
+import logging
+import re
+import threading
+
+logger = logging.getLogger(__name__)
+
+# How far into the body to look for ``<meta charset>`` and to trial-decode.
+META_SNIFF_BYTES = 4096
+TRIAL_DECODE_BYTES = 16_384
+# Tried in order when nothing is declared; gb18030 is a superset of gb2312/gbk.
+FALLBACK_ENCODINGS = ("utf-8", "gb18030", "big5")
+
+_CONTENT_TYPE_CHARSET = re.compile(r"charset\s*=\s*[\"']?([\w.:-]+)", re.IGNORECASE)
+_META_CHARSET = re.compile(
+    rb"<meta[^>]+charset\s*=\s*[\"']?\s*([\w.:-]+)",
+    re.IGNORECASE,
+)
+_NON_ASCII = re.compile(rb"[\x80-\xff]")
+# Legacy Chinese labels that are safer decoded as their superset.
+_SUPERSETS = {"gb2312": "gb18030", "gbk": "gb18030", "ascii": "utf-8", "latin-1": "cp1252"}
+
+
+def normalize_encoding(name: str | None) -> str | None:
+    """Canonical Python codec name for a declared charset, or ``None`` if unknown."""
+    if not name:
+        return None
+    try:
+        canonical = codecs.lookup(name.strip()).name
+    except LookupError:
+        return None
+    canonical = {"iso8859-1": "latin-1", "us-ascii": "ascii"}.get(canonical, canonical)
+    return _SUPERSETS.get(canonical, canonical)
+
+
+def charset_from_content_type(content_type: str | None) -> str | None:
+    match = _CONTENT_TYPE_CHARSET.search(content_type or "")
+    return normalize_encoding(match.group(1)) if match else None
+
+
+def charset_from_meta(body: bytes) -> str | None:
+    match = _META_CHARSET.search(body[:META_SNIFF_BYTES])
+    return normalize_encoding(match.group(1).decode("ascii", "ignore")) if match else None
+
+
+def first_non_ascii(data: bytes, start: int = 0) -> int:
+    """Index of the first byte >= 0x80 at or after ``start``, or -1 if there is none."""
+    match = _NON_ASCII.search(data, start)
+    return match.start() if match else -1
+
+
+def decodes_cleanly(prefix: bytes, encoding: str) -> bool:
+    """Whether ``prefix`` is valid ``encoding``, tolerating a character cut at the end."""
+    decoder = codecs.getincrementaldecoder(encoding)()
+    try:
+        decoder.decode(prefix, final=False)
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+class CharsetDetector:
+    """Picks a body's encoding without trial-decoding whole documents.
+
+    Order: HTTP ``Content-Type`` charset, ``<meta charset>`` in the first few KB, the
+    encoding last seen for the same host, then trial decodes of a small sample. Each
+    candidate is checked against that sample, so a wrong declaration falls through.
+
+    The sample starts at the first non-ASCII byte: every candidate decodes an ASCII run
+    (a large inline ``<script>`` head, say), so it says nothing about the encoding. A
+    guess made from an all-ASCII body is returned but not remembered for the host.
+    """
+
+    def __init__(self) -> None:
+        self._by_host: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def cached(self, host: str) -> str | None:
+        with self._lock:
+            return self._by_host.get(host)
+
+    def detect(self, body: bytes, *, host: str = "", content_type: str | None = None) -> str:
+        start = first_non_ascii(body)
+        sample = body[max(start, 0) : max(start, 0) + TRIAL_DECODE_BYTES]
+        candidates = [
+            ("header", charset_from_content_type(content_type)),
+            ("meta", charset_from_meta(body)),
+            ("host-cache", self.cached(host) if host else None),
+            *(("trial", encoding) for encoding in FALLBACK_ENCODINGS),
+        ]
+        chosen, reason = "utf-8", "default"
+        for source, encoding in candidates:
+            if encoding and decodes_cleanly(sample, encoding):
+                chosen, reason = encoding, source
+                break
+        if host and (start >= 0 or reason in ("header", "meta")):
+            with self._lock:
+                self._by_host[host] = chosen
+        logger.debug("decoding %s as %s (%s)", host or "<unknown host>", chosen, reason)
+        return chosen
+
+    def decode(self, body: bytes, *, host: str = "", content_type: str | None = None) -> str:
+        encoding = self.detect(body, host=host, content_type=content_type)
+        return body.decode(encoding, errors="replace")
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+# Responses that mean the site is pushing back, not that the URL is broken.
+BLOCK_STATUS_CODES = frozenset({403, 429})
+# Consecutive blocked responses (captcha pages or BLOCK_STATUS_CODES) that open the breaker.
+TRIP_AFTER_BLOCKS = 3
+# Cool-down after the first trip; doubles with every trip in a row, up to MAX_COOLDOWN.
+BASE_COOLDOWN = timedelta(minutes=30)
+MAX_COOLDOWN = timedelta(days=2)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC)
+
+
+def cooldown_for(trips: int) -> timedelta:
+    # Clamp the exponent so a long losing streak cannot overflow timedelta.
+    return min(BASE_COOLDOWN * 2 ** min(max(trips - 1, 0), 16), MAX_COOLDOWN)
+
+
+@dataclass
+class BreakerRecord:
+    source_key: str
+    host: str
+    trips: int = 0
+    open_until: datetime | None = None
+    last_reason: str | None = None
+    last_tripped_at: datetime | None = None
+
+    def is_open(self, now: datetime) -> bool:
+        return self.open_until is not None and now < self.open_until
+
+
+class CircuitBreaker:
+    """Stops crawling a source/host after repeated anti-bot blocks.
+
+    ``TRIP_AFTER_BLOCKS`` blocked responses in a row open the breaker: the rest of the
+    source is skipped for this run and for a cool-down that doubles with each
+    consecutive trip. A successful page after the cool-down resets the backoff.
+    Shared by all crawl worker threads; persisted through the storage layer.
+    """
+
+    def __init__(
+        self,
+        records: list[BreakerRecord] | None = None,
+        trip_after: int = TRIP_AFTER_BLOCKS,
+    ) -> None:
+        self.trip_after = trip_after
+        self._lock = threading.Lock()
+        self._records: dict[tuple[str, str], BreakerRecord] = {}
+        self._strikes: dict[tuple[str, str], int] = {}
+        self._dirty: set[tuple[str, str]] = set()
+        for record in records or []:
+            self._records[(record.source_key, record.host)] = record
+
+    def open_record(self, source_key: str, host: str) -> BreakerRecord | None:
+        """The record if the breaker for ``source_key``/``host`` is open, else ``None``."""
+        with self._lock:
+            record = self._records.get((source_key, host))
+        return record if record is not None and record.is_open(_utcnow()) else None
+
+    def record_block(self, source_key: str, host: str, reason: str) -> BreakerRecord | None:
+        """Count a blocked response; returns the record when this block trips the breaker."""
+        key = (source_key, host)
+        now = _utcnow()
+        with self._lock:
+            record = self._records.get(key)
+            if record is not None and record.is_open(now):
+                return None
+            strikes = self._strikes.get(key, 0) + 1
+            self._strikes[key] = strikes
+            if strikes < self.trip_after:
+                return None
+            if record is None:
+                record = self._records[key] = BreakerRecord(source_key=source_key, host=host)
+            record.trips += 1
+            record.open_until = now + cooldown_for(record.trips)
+            record.last_reason = reason
+            record.last_tripped_at = now
+            self._strikes[key] = 0
+            self._dirty.add(key)
+            return record
+
+    def record_success(self, source_key: str, host: str) -> None:
+        key = (source_key, host)
+        with self._lock:
+            self._strikes.pop(key, None)
+            record = self._records.get(key)
+            if record is not None and record.trips:
+                record.trips = 0
+                record.open_until = None
+                self._dirty.add(key)
+
+    def changed_records(self) -> list[BreakerRecord]:
+        with self._lock:
+            return [self._records[key] for key in sorted(self._dirty)]
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import hashlib
+import re
+
+# Parts of a page that change on every request without the job list changing.
+_VOLATILE_BLOCKS = re.compile(
+    r"<(script|style|noscript|template)\b[^>]*>.*?</\1\s*>|<!--.*?-->",
+    re.IGNORECASE | re.DOTALL,
+)
+# ...except scripts carrying structured job data, which the embedded parser reads.
+_DATA_SCRIPT = re.compile(r"application/ld\+json|__NEXT_DATA__|__INITIAL_STATE__", re.IGNORECASE)
+_CSRF_TAGS = re.compile(
+    r"<(?:meta|input)\b[^>]*(?:csrf|xsrf|authenticity_token|__requestverificationtoken|nonce)"
+    r"[^>]*>",
+    re.IGNORECASE,
+)
+_VOLATILE_ATTRS = re.compile(
+    r"\s(?:nonce|data-reactid|data-v-[\w-]*|data-timestamp|data-ts)(?:=(?:\"[^\"]*\"|'[^']*'|\S+))?",
+    re.IGNORECASE,
+)
+_TIMESTAMPS = re.compile(
+    r"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}(?::\d{2})?(?:\.\d+)?(?:Z|[+-]\d{2}:?\d{2})?"
+    r"|\b\d{2}:\d{2}:\d{2}\b"
+)
+# Epoch seconds/ms only after a cache-buster query param or a *time / *stamp key: bare
+# 10/13-digit numbers are often job IDs (Liepin's /job/19xxxxxxxx) and must stay.
+_EPOCHS = re.compile(
+    r"((?:[?&;](?:_|t|ts|time|timestamp)=)"
+    r"|(?:[\"']?\w*(?:[Tt]ime|[Ss]tamp|_ts)[\"']?\s*[:=]\s*[\"']?))"
+    r"1\d{9}(?:\d{3})?\b"
+)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _drop_volatile(match: re.Match[str]) -> str:
+    block = match.group()
+    if (match.group(1) or "").lower() == "script" and _DATA_SCRIPT.search(block):
+        return block
+    return " "
+
+
+def normalize_for_hash(html: str) -> str:
+    text = _VOLATILE_BLOCKS.sub(_drop_volatile, html)
+    text = _CSRF_TAGS.sub(" ", text)
+    text = _VOLATILE_ATTRS.sub("", text)
+    text = _TIMESTAMPS.sub("", text)
+    text = _EPOCHS.sub(r"\1", text)
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def page_content_hash(html: str) -> str:
+    """Hash of the page with scripts (bar job data), timestamps and CSRF tokens stripped."""
+    return hashlib.sha256(normalize_for_hash(html).encode("utf-8")).hexdigest()
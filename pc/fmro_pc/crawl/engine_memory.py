@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+# An engine that failed this many times in a row (per source/host) is tried last.
+DEMOTE_AFTER_FAILURES = 3
+# Demotion expires so an engine that was broken (e.g. a missing browser) gets probed again.
+DEMOTION_TTL = timedelta(days=7)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC)
+
+
+@dataclass
+class EngineRecord:
+    source_key: str
+    host: str
+    engine: str
+    attempts: int = 0
+    successes: int = 0
+    failures: int = 0
+    blocks: int = 0
+    consecutive_failures: int = 0
+    total_latency_ms: float = 0.0
+    last_success_at: datetime | None = None
+    last_used_at: datetime | None = None
+
+    @property
+    def success_rate(self) -> float:
+        return self.successes / self.attempts if self.attempts else 0.0
+
+    @property
+    def block_rate(self) -> float:
+        return self.blocks / self.attempts if self.attempts else 0.0
+
+    @property
+    def avg_latency_ms(self) -> float:
+        return self.total_latency_ms / self.successes if self.successes else 0.0
+
+    def is_demoted(self, now: datetime) -> bool:
+        if self.consecutive_failures < DEMOTE_AFTER_FAILURES:
+            return False
+        if self.last_used_at is None:
+            return True
+        return now - self.last_used_at < DEMOTION_TTL
+
+
+class EngineSelector:
+    """Remembers which fetch engine works for each source/host and orders the fallback chain.
+
+    Shared by all crawl worker threads; persisted through the storage layer between runs.
+    """
+
+    def __init__(self, records: list[EngineRecord] | None = None) -> None:
+        self._lock = threading.Lock()
+        self._records: dict[tuple[str, str, str], EngineRecord] = {}
+        self._dirty: set[tuple[str, str, str]] = set()
+        for record in records or []:
+            self._records[(record.source_key, record.host, record.engine)] = record
+
+    def order(self, source_key: str, host: str, candidates: list[str]) -> list[str]:
+        """``candidates`` with demoted engines last.
+
+        The first candidate is the configured engine and keeps its place until it is
+        demoted: a fallback that "succeeded" may only have fetched a JS shell with no jobs.
+        Among the fallbacks, the most recently successful one goes first.
+        """
+        now = _utcnow()
+        with self._lock:
+            records = {name: self._records.get((source_key, host, name)) for name in candidates}
+
+        def demoted(name: str) -> bool:
+            record = records[name]
+            return bool(record and record.is_demoted(now))
+
+        pinned = candidates[0] if candidates and not demoted(candidates[0]) else None
+        proven = [
+            (record.last_success_at, name)
+            for name, record in records.items()
+            if record is not None
+            and record.last_success_at is not None
+            and name != pinned
+            and not demoted(name)
+        ]
+        preferred = max(proven)[1] if proven else None
+
+        def rank(name: str) -> tuple[bool, bool, bool, int]:
+            return (demoted(name), name != pinned, name != preferred, candidates.index(name))
+
+        return sorted(candidates, key=rank)
+
+    def _record(self, source_key: str, host: str, engine: str) -> EngineRecord:
+        key = (source_key, host, engine)
+        record = self._records.get(key)
+        if record is None:
+            record = EngineRecord(source_key=source_key, host=host, engine=engine)
+            self._records[key] = record
+        self._dirty.add(key)
+        return record
+
+    def record_success(
+        self, source_key: str, host: str, engine: str, latency_ms: float | None = None
+    ) -> None:
+        now = _utcnow()
+        with self._lock:
+            record = self._record(source_key, host, engine)
+            record.attempts += 1
+            record.successes += 1
+            record.consecutive_failures = 0
+            record.total_latency_ms += latency_ms or 0.0
+            record.last_success_at = now
+            record.last_used_at = now
+
+    def record_failure(self, source_key: str, host: str, engine: str) -> None:
+        with self._lock:
+            record = self._record(source_key, host, engine)
+            record.attempts += 1
+            record.failures += 1
+            record.consecutive_failures += 1
+            record.last_used_at = _utcnow()
+
+    def record_block(self, source_key: str, host: str, engine: str) -> None:
+        """The engine got a response, but it was a captcha/verification page."""
+        with self._lock:
+            record = self._record(source_key, host, engine)
+            record.attempts += 1
+            record.blocks += 1
+            record.consecutive_failures += 1
+            record.last_used_at = _utcnow()
+
+    def changed_records(self) -> list[EngineRecord]:
+        with self._lock:
+            return [self._records[key] for key in sorted(self._dirty)]
@@ -1,111 +1,418 @@
 from __future__ import annotations
 
-import warnings
-from dataclasses import dataclass
+import asyncio
+import codecs
+import importlib.util
+import threading
+from collections.abc import Coroutine
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import Any, TypeVar
 
 import httpx
 from bs4 import BeautifulSoup
 
+from fmro_pc.crawl.anchors import AnchorRecord, build_anchor_index
+from fmro_pc.crawl.charset import TRIAL_DECODE_BYTES, CharsetDetector, first_non_ascii
+from fmro_pc.crawl.throttle import HostRateLimiter, host_of
+
+
+@dataclass
+class CapturedResponse:
+    """A JSON API response the browser received while rendering ``page_url``."""
+
+    url: str
+    page_url: str
+    payload: Any
+
+
+SOUP_BACKENDS = ("auto", "lxml", "html.parser")
+
+
+def resolve_soup_backend(backend: str = "auto") -> str:
+    """BeautifulSoup tree builder for ``backend``; ``auto`` prefers lxml when installed."""
+    if backend not in SOUP_BACKENDS:
+        raise ValueError(f"soup backend must be one of: {', '.join(SOUP_BACKENDS)}")
+    if backend == "auto":
+        return "lxml" if importlib.util.find_spec("lxml") is not None else "html.parser"
+    return backend
+
 
 @dataclass
 class FetchedPage:
+    """A fetched page. ``soup`` is parsed from ``html`` on first access only.
+
+    With ``keep_html=False`` the raw HTML is released once the soup is built.
+    ``anchors`` is the page's link table, built from the soup once and shared by parsers.
+    """
+
     url: str
     html: str
-    soup: BeautifulSoup
     status_code: int
     dynamic: bool = False
+    etag: str | None = None
+    last_modified: str | None = None
+    bytes_downloaded: int | None = None
+    elapsed_ms: float | None = None
+    requests_blocked: int = 0
+    bytes_saved: int = 0
+    encoding: str | None = None
+    captured_json: list[CapturedResponse] = field(default_factory=list)
+    soup_backend: str = "auto"
+    keep_html: bool = True
+    _soup: BeautifulSoup | None = field(default=None, init=False, repr=False, compare=False)
+    _anchors: list[AnchorRecord] | None = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def soup(self) -> BeautifulSoup:
+        if self._soup is None:
+            self._soup = BeautifulSoup(self.html, resolve_soup_backend(self.soup_backend))
+            if not self.keep_html:
+                self.html = ""
+        return self._soup
+
+    @property
+    def anchors(self) -> list[AnchorRecord]:
+        if self._anchors is None:
+            self._anchors = build_anchor_index(self.soup, self.url)
+        return self._anchors
+
+    @property
+    def not_modified(self) -> bool:
+        return self.status_code == 304
+
+    @classmethod
+    def not_modified_for(cls, url: str) -> FetchedPage:
+        return cls(url=url, html="", status_code=304)
+
+
+T = TypeVar("T")
+
+DEFAULT_USER_AGENT = (
+    "FMRO-PC/0.1 (+https://github.com/; static crawler for personal company source ingestion)"
+)
+
+
+# Media types worth parsing. Anything else (PDFs, images, script bundles) is rejected
+# from the response headers, before the body is read.
+HTML_CONTENT_TYPES = frozenset({"text/html", "application/xhtml+xml", "text/plain"})
+
+
+class FetchError(RuntimeError):
+    """A failed fetch. ``status_code`` is ``None`` for network errors (no response).
+
+    ``retry_after`` holds the server's ``Retry-After`` in seconds when it sent one.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        status_code: int | None = None,
+        retry_after: float | None = None,
+    ) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+def parse_retry_after(value: str | None, now: datetime | None = None) -> float | None:
+    """Seconds to wait from a ``Retry-After`` header (delta-seconds or an HTTP date)."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        moment = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=UTC)
+    return max((moment - (now or datetime.now(UTC))).total_seconds(), 0.0)
+
+
+def raise_for_status(
+    url: str, status_code: int, engine: str, retry_after: str | None = None
+) -> None:
+    if status_code >= 400:
+        raise FetchError(
+            f"{engine} returned status {status_code} for {url}",
+            status_code,
+            parse_retry_after(retry_after),
+        )
+
+
+class UnsupportedPageError(RuntimeError):
+    """The response is not a page we parse: not HTML, or larger than the byte cap.
+
+    Other engines would download the same thing, so the runner does not fall back.
+    """
+
+
+def check_content_type(url: str, content_type: str | None) -> None:
+    media_type = (content_type or "").split(";", 1)[0].strip().lower()
+    if media_type and media_type not in HTML_CONTENT_TYPES:
+        raise UnsupportedPageError(f"{url} is {media_type}, not HTML")
+
+
+def _too_large(url: str, max_bytes: int) -> UnsupportedPageError:
+    return UnsupportedPageError(f"{url} is larger than the {max_bytes:,} byte cap")
+
+
+class _StreamedBody:
+    """Decodes a body chunk by chunk as it arrives, enforcing ``max_bytes``.
+
+    Bytes are held back until ``TRIAL_DECODE_BYTES`` past the first non-ASCII byte
+    (or the end of the body) have arrived, so charset detection sees the ``<meta
+    charset>`` tag and real non-ASCII text rather than an ASCII script head; after that
+    every chunk goes straight through an incremental decoder.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        content_type: str | None,
+        charsets: CharsetDetector,
+        max_bytes: int | None,
+    ) -> None:
+        self.url = url
+        self.content_type = content_type
+        self.max_bytes = max_bytes
+        self.encoding: str | None = None
+        self.size = 0
+        self._charsets = charsets
+        self._pending = bytearray()
+        self._first_non_ascii = -1
+        self._decoder: codecs.IncrementalDecoder | None = None
+        self._parts: list[str] = []
+
+    def feed(self, chunk: bytes) -> None:
+        self.size += len(chunk)
+        if self.max_bytes is not None and self.size > self.max_bytes:
+            raise _too_large(self.url, self.max_bytes)
+        if self._decoder is not None:
+            self._parts.append(self._decoder.decode(chunk))
+            return
+        self._pending += chunk
+        if self._first_non_ascii < 0 and not chunk.isascii():
+            self._first_non_ascii = first_non_ascii(self._pending, len(self._pending) - len(chunk))
+        if (
+            self._first_non_ascii >= 0
+            and len(self._pending) - self._first_non_ascii >= TRIAL_DECODE_BYTES
+        ):
+            self._start_decoding()
+
+    def _start_decoding(self) -> codecs.IncrementalDecoder:
+        head = bytes(self._pending)
+        self._pending.clear()
+        self.encoding = self._charsets.detect(
+            head, host=host_of(self.url), content_type=self.content_type
+        )
+        self._decoder = codecs.getincrementaldecoder(self.encoding)(errors="replace")
+        self._parts.append(self._decoder.decode(head))
+        return self._decoder
+
+    def text(self) -> str:
+        decoder = self._decoder or self._start_decoding()
+        self._parts.append(decoder.decode(b"", final=True))
+        return "".join(self._parts)
+
+
+def _start_body(
+    response: httpx.Response, charsets: CharsetDetector, max_bytes: int | None
+) -> _StreamedBody | None:
+    """Check a streamed response's status and headers; ``None`` means 304."""
+    if response.status_code == 304:
+        return None
+    url = str(response.url)
+    raise_for_status(url, response.status_code, "httpx", response.headers.get("retry-after"))
+    content_type = response.headers.get("content-type")
+    check_content_type(url, content_type)
+    # Content-Length counts encoded bytes, which never exceed the decoded size by much.
+    declared = response.headers.get("content-length", "")
+    if max_bytes is not None and declared.isdigit() and int(declared) > max_bytes:
+        raise _too_large(url, max_bytes)
+    return _StreamedBody(url, content_type, charsets, max_bytes)
+
+
+def _page_from_stream(response: httpx.Response, body: _StreamedBody | None) -> FetchedPage:
+    # ``elapsed`` is only available once the stream is closed.
+    if body is None:
+        return FetchedPage.not_modified_for(str(response.url))
+    html = body.text()
+    return FetchedPage(
+        url=str(response.url),
+        html=html,
+        status_code=response.status_code,
+        dynamic=False,
+        etag=response.headers.get("etag"),
+        last_modified=response.headers.get("last-modified"),
+        bytes_downloaded=response.num_bytes_downloaded,
+        elapsed_ms=response.elapsed.total_seconds() * 1000,
+        encoding=body.encoding,
+    )
+
+
+def http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
 
 
 class ScraplingFetcher:
-    def __init__(self) -> None:
+    """Scrapling (curl-cffi) fetcher that keeps one warm session per host.
+
+    curl-cffi sessions are not thread-safe, so every crawl thread gets its own
+    per-host sessions; consecutive requests from a thread to a site then reuse the
+    connection and TLS session. Sessions are closed by ``close`` / the context manager.
+    """
+
+    def __init__(
+        self,
+        timeout_seconds: float = 30.0,
+        rate_limiter: HostRateLimiter | None = None,
+    ) -> None:
+        self._timeout_seconds = timeout_seconds
+        self._rate_limiter = rate_limiter
         self._default_headers = {
             "User-Agent": (
                 "FMRO-PC/0.1 (+https://github.com/;"
                 " scrapling crawler for personal company source ingestion)"
             )
         }
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._managers: list[Any] = []
+        self._charsets = CharsetDetector()
 
-    def _decode_body(self, body: bytes | str, encoding: str | None) -> str:
-        if isinstance(body, str):
-            return body
-
-        candidates = [encoding, "utf-8", "gb18030", "gbk", "big5"]
-        for enc in candidates:
-            if not enc:
-                continue
+    def _session(self, url: str):
+        sessions: dict[str, Any] | None = getattr(self._local, "sessions", None)
+        if sessions is None:
+            sessions = self._local.sessions = {}
+        host = host_of(url)
+        session = sessions.get(host)
+        if session is None:
             try:
-                return body.decode(enc)
-            except Exception:
-                continue
+                from scrapling.fetchers import FetcherSession
+            except ImportError as exc:
+                raise RuntimeError(
+                    "Scrapling is not available. "
+                    "Install dependencies with `uv sync --extra dynamic`."
+                ) from exc
 
-        return body.decode("utf-8", errors="replace")
-
-    def fetch(self, url: str, headers: dict[str, str] | None = None) -> FetchedPage:
-        try:
-            from scrapling import Fetcher
-        except ImportError as exc:
-            raise RuntimeError(
-                "Scrapling is not available. Install dependencies with `uv sync --extra dynamic`."
-            ) from exc
+            # One attempt per call; retries belong to the crawl's RetryPolicy.
+            manager = FetcherSession(
+                timeout=self._timeout_seconds, follow_redirects=True, retries=1
+            )
+            session = sessions[host] = manager.__enter__()
+            with self._lock:
+                self._managers.append(manager)
+        return session
 
+    def fetch(
+        self,
+        url: str,
+        headers: dict[str, str] | None = None,
+        *,
+        max_bytes: int | None = None,
+    ) -> FetchedPage:
+        session = self._session(url)
         request_headers = dict(self._default_headers)
         if headers:
             request_headers.update(headers)
 
-        warnings.filterwarnings(
-            "ignore",
-            message=".*This logic is deprecated now, and have no effect.*",
-        )
-        fetcher = Fetcher()
-        response = fetcher.get(url, headers=request_headers, follow_redirects=True)
+        if self._rate_limiter is not None:
+            self._rate_limiter.wait(url)
+        try:
+            response = session.get(url, headers=request_headers)
+        except Exception as exc:
+            raise FetchError(f"scrapling request failed for {url}: {exc}") from exc
         status_code = int(getattr(response, "status", 0) or 0)
-        if status_code >= 400:
-            raise RuntimeError(f"scrapling returned status {status_code} for {url}")
+        if status_code == 304:
+            return FetchedPage.not_modified_for(url)
 
+        final_url = str(getattr(response, "url", url))
+        response_headers = {
+            str(key).lower(): str(value)
+            for key, value in (getattr(response, "headers", None) or {}).items()
+        }
+        raise_for_status(url, status_code, "scrapling", response_headers.get("retry-after"))
+        # curl-cffi buffers the whole (br/zstd/gzip-decoded) body, so the checks come after.
+        check_content_type(final_url, response_headers.get("content-type"))
         body = getattr(response, "body", b"")
-        encoding = getattr(response, "encoding", None)
-        html = self._decode_body(body, encoding)
+        if max_bytes is not None and len(body) > max_bytes:
+            raise _too_large(final_url, max_bytes)
+        if isinstance(body, str):
+            html, encoding = body, None
+        else:
+            encoding = self._charsets.detect(
+                body,
+                host=host_of(final_url),
+                content_type=response_headers.get("content-type"),
+            )
+            html = body.decode(encoding, errors="replace")
 
-        final_url = str(getattr(response, "url", url))
-        soup = BeautifulSoup(html, "html.parser")
         return FetchedPage(
             url=final_url,
             html=html,
-            soup=soup,
             status_code=status_code or 200,
             dynamic=False,
+            etag=response_headers.get("etag"),
+            last_modified=response_headers.get("last-modified"),
+            bytes_downloaded=len(body) if isinstance(body, bytes) else None,
+            encoding=encoding,
         )
 
+    def close(self) -> None:
+        with self._lock:
+            managers, self._managers = self._managers, []
+        for manager in managers:
+            manager.__exit__(None, None, None)
+        # Sessions cached on other threads' locals are closed now; drop this thread's map.
+        self._local = threading.local()
+
+    def __enter__(self) -> ScraplingFetcher:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
 
 class StaticFetcher:
-    def __init__(self, timeout_seconds: float = 20.0) -> None:
-        self._default_headers = {
-            "User-Agent": (
-                "FMRO-PC/0.1 (+https://github.com/;"
-                " static crawler for personal company source ingestion)"
-            )
-        }
+    def __init__(
+        self,
+        timeout_seconds: float = 20.0,
+        rate_limiter: HostRateLimiter | None = None,
+    ) -> None:
+        self._rate_limiter = rate_limiter
+        self._default_headers = {"User-Agent": DEFAULT_USER_AGENT}
+        self._charsets = CharsetDetector()
         self._client = httpx.Client(
             timeout=timeout_seconds,
             follow_redirects=True,
             headers=self._default_headers,
         )
 
-    def fetch(self, url: str, headers: dict[str, str] | None = None) -> FetchedPage:
+    def fetch(
+        self,
+        url: str,
+        headers: dict[str, str] | None = None,
+        *,
+        max_bytes: int | None = None,
+    ) -> FetchedPage:
         request_headers = dict(self._default_headers)
         if headers:
             request_headers.update(headers)
-        response = self._client.get(url, headers=request_headers)
-        response.raise_for_status()
-        html = response.text
-        soup = BeautifulSoup(html, "html.parser")
-        return FetchedPage(
-            url=str(response.url),
-            html=html,
-            soup=soup,
-            status_code=response.status_code,
-            dynamic=False,
-        )
+        if self._rate_limiter is not None:
+            self._rate_limiter.wait(url)
+        try:
+            with self._client.stream("GET", url, headers=request_headers) as response:
+                body = _start_body(response, self._charsets, max_bytes)
+                if body is not None:
+                    for chunk in response.iter_bytes():
+                        body.feed(chunk)
+        except httpx.TransportError as exc:
+            raise FetchError(f"httpx request failed for {url}: {exc!r}") from exc
+        return _page_from_stream(response, body)
 
     def close(self) -> None:
         self._client.close()
@@ -115,3 +422,125 @@ class StaticFetcher:
 
     def __exit__(self, exc_type, exc, tb) -> None:
         self.close()
+
+
+class AsyncStaticFetcher:
+    """Fetches batches of URLs concurrently over one pooled ``httpx.AsyncClient``.
+
+    The client lives on a private event-loop thread, so callers stay synchronous and
+    every source (and every crawl worker thread) shares the same warm keep-alive
+    connections. HTTP/2 is used when the ``h2`` package is installed.
+    """
+
+    def __init__(
+        self,
+        timeout_seconds: float = 20.0,
+        max_per_host: int = 4,
+        max_connections: int = 32,
+        rate_limiter: HostRateLimiter | None = None,
+    ) -> None:
+        self._rate_limiter = rate_limiter
+        self._default_headers = {"User-Agent": DEFAULT_USER_AGENT}
+        self._charsets = CharsetDetector()
+        self._max_per_host = max_per_host
+        self._host_semaphores: dict[str, asyncio.Semaphore] = {}
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever,
+            name="fmro-async-fetch",
+            daemon=True,
+        )
+        self._thread.start()
+        self._client = self._run(
+            self._open_client(timeout_seconds=timeout_seconds, max_connections=max_connections)
+        )
+
+    async def _open_client(
+        self, *, timeout_seconds: float, max_connections: int
+    ) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            timeout=timeout_seconds,
+            follow_redirects=True,
+            headers=self._default_headers,
+            http2=http2_available(),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+        )
+
+    def _run(self, coro: Coroutine[Any, Any, T]) -> T:
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def _semaphore(self, url: str) -> asyncio.Semaphore:
+        host = httpx.URL(url).host
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self._max_per_host)
+            self._host_semaphores[host] = semaphore
+        return semaphore
+
+    async def _fetch_one(
+        self, url: str, headers: dict[str, str], max_bytes: int | None
+    ) -> FetchedPage:
+        async with self._semaphore(url):
+            if self._rate_limiter is not None:
+                await asyncio.sleep(self._rate_limiter.reserve(url))
+            try:
+                async with self._client.stream("GET", url, headers=headers) as response:
+                    body = _start_body(response, self._charsets, max_bytes)
+                    if body is not None:
+                        async for chunk in response.aiter_bytes():
+                            body.feed(chunk)
+            except httpx.TransportError as exc:
+                raise FetchError(f"httpx request failed for {url}: {exc!r}") from exc
+        return _page_from_stream(response, body)
+
+    async def _fetch_all(
+        self, requests: list[tuple[str, dict[str, str]]], max_bytes: int | None
+    ) -> list[FetchedPage | BaseException]:
+        tasks = [self._fetch_one(url, headers, max_bytes) for url, headers in requests]
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    def fetch_many(
+        self,
+        urls: list[str],
+        headers: dict[str, str] | None = None,
+        *,
+        per_url_headers: dict[str, dict[str, str]] | None = None,
+        max_bytes: int | None = None,
+    ) -> list[FetchedPage | BaseException]:
+        """Fetch all ``urls`` concurrently; failures are returned in place, not raised."""
+        request_headers = dict(self._default_headers)
+        if headers:
+            request_headers.update(headers)
+        requests = [
+            (url, {**request_headers, **(per_url_headers or {}).get(url, {})}) for url in urls
+        ]
+        return self._run(self._fetch_all(requests, max_bytes))
+
+    def fetch(
+        self,
+        url: str,
+        headers: dict[str, str] | None = None,
+        *,
+        max_bytes: int | None = None,
+    ) -> FetchedPage:
+        result = self.fetch_many([url], headers=headers, max_bytes=max_bytes)[0]
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+    def close(self) -> None:
+        if self._loop.is_closed():
+            return
+        self._run(self._client.aclose())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def __enter__(self) -> AsyncStaticFetcher:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
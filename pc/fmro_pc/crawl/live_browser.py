@@ -6,7 +6,12 @@ from urllib.parse import urljoin
 
 from fmro_pc.config import CompaniesConfig, SourceConfig, select_sources
 from fmro_pc.crawl.normalize import matches_source_filters, normalize_job
+from fmro_pc.crawl.resource_policy import ResourcePolicy, RouteBlocker
+from fmro_pc.crawl.scroll import list_item_selector, scroll_until_stable
+from fmro_pc.crawl.throttle import build_rate_limiter
+from fmro_pc.crawl.xhr_capture import ResponseCapture
 from fmro_pc.parsers.base import ParsedJob
+from fmro_pc.parsers.json_api import capture_patterns, parse_captured_json
 from fmro_pc.storage.repository import UpsertStats, upsert_jobs
 
 
@@ -17,6 +22,8 @@ class LiveSourceResult:
     normalized: int
     upsert: UpsertStats
     errors: list[str]
+    requests_blocked: int = 0
+    bytes_saved: int = 0
 
 
 def _safe_eval_rows(page, script: str) -> list[dict]:
@@ -209,7 +216,7 @@ def crawl_live(
     config: CompaniesConfig,
     *,
     source_key: str | None = None,
-    max_scroll_rounds: int = 8,
+    max_scroll_rounds: int = 30,
     session_dir: str | Path = "data/sessions",
     force_login: bool = False,
 ) -> list[LiveSourceResult]:
@@ -220,6 +227,7 @@ def crawl_live(
 
     sources = select_sources(config, source_key=source_key, only_enabled=True)
     results: list[LiveSourceResult] = []
+    rate_limiter = build_rate_limiter(sources)
 
     session_root = Path(session_dir)
     session_root.mkdir(parents=True, exist_ok=True)
@@ -236,6 +244,7 @@ def crawl_live(
             storage_state = str(state_path) if state_path.exists() and not force_login else None
             context = browser.new_context(storage_state=storage_state)
             page = context.new_page()
+            blocker = RouteBlocker()
 
             try:
                 seed_url = source.entry_urls[0]
@@ -250,18 +259,37 @@ def crawl_live(
                     context.storage_state(path=str(state_path))
                     errors.append(f"session saved: {state_path}")
 
+                # Only after login: captcha and login widgets need their images and scripts.
+                blocker.install(context)
+                blocker.reset(ResourcePolicy.from_config(source.resource_policy))
+                capture = ResponseCapture()
+                capture.install(page)
+                patterns = capture_patterns(source.parser) if source.capture_api_json else ()
+
                 for url in source.entry_urls:
+                    rate_limiter.wait(url)
+                    capture.reset(url, patterns)
                     try:
                         page.goto(url, wait_until="domcontentloaded", timeout=30000)
                     except Exception as exc:  # noqa: BLE001
                         errors.append(f"goto failed for {url}: {exc}")
                         continue
 
-                    for _ in range(max_scroll_rounds):
-                        page.mouse.wheel(0, 4500)
-                        page.wait_for_timeout(700)
+                    scroll_until_stable(
+                        page,
+                        selector=list_item_selector(source.parser),
+                        max_rounds=max_scroll_rounds,
+                    )
 
-                    batch = _extract_jobs_for_source(page, source)
+                    # The list API payloads carry posted dates and salaries; the DOM
+                    # extraction is the fallback when nothing usable was captured.
+                    try:
+                        batch = parse_captured_json(capture.take(), source)
+                    except Exception as exc:  # noqa: BLE001
+                        errors.append(f"captured JSON parse failed for {url}: {exc}")
+                        batch = []
+                    if not batch:
+                        batch = _extract_jobs_for_source(page, source)
                     all_extracted.extend(batch)
                     if not batch:
                         title = page.title()
@@ -293,6 +321,8 @@ def crawl_live(
                     normalized=len(normalized),
                     upsert=upsert,
                     errors=errors,
+                    requests_blocked=blocker.stats.requests_blocked,
+                    bytes_saved=blocker.stats.bytes_saved,
                 )
             )
 
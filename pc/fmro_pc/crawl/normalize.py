@@ -58,9 +58,10 @@ def normalize_job(parsed: ParsedJob, source: SourceConfig) -> NormalizedJob:
 
     final_apply_url = apply_url or source_url or ""
     final_source_url = source_url or final_apply_url
+    company_name = _clean_text(parsed.company_name) or source.company_name
 
     fingerprint = build_fingerprint(
-        company_name=source.company_name,
+        company_name=company_name,
         title=title,
         apply_url=apply_url,
         location=parsed.location,
@@ -70,7 +71,7 @@ def normalize_job(parsed: ParsedJob, source: SourceConfig) -> NormalizedJob:
     return NormalizedJob(
         source_platform=source.platform,
         source_company_key=source.key,
-        company_name=source.company_name,
+        company_name=company_name,
         title=title,
         location=_clean_text(parsed.location),
         employment_type=_clean_text(parsed.employment_type),
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+
+from fmro_pc.config import SourceConfig
+
+# Bump when a parser, the normalizer or the filters change what a page yields, so cached
+# fingerprints from older code are not carried forward.
+EXTRACTION_VERSION = 1
+# Source settings that only affect how pages are fetched, not which jobs they yield.
+_FETCH_ONLY_FIELDS = {
+    "key",
+    "enabled",
+    "entry_urls",
+    "mode",
+    "request_headers",
+    "crawl_depth",
+    "max_page_bytes",
+    "rate_limit",
+    "retry",
+    "resource_policy",
+    "notes",
+}
+
+
+def extraction_digest(source: SourceConfig) -> str:
+    """Digest of everything that decides which jobs a page yields for ``source``."""
+    settings = source.model_dump(mode="json", exclude=_FETCH_ONLY_FIELDS)
+    payload = json.dumps([EXTRACTION_VERSION, settings], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass
+class CachedPage:
+    """What we remember about a listing page (entry URL or a page it links to) between runs."""
+
+    url: str
+    source_key: str
+    etag: str | None = None
+    last_modified: str | None = None
+    content_hash: str | None = None
+    fingerprints: list[str] = field(default_factory=list)
+    # extraction_digest of the source when the fingerprints were extracted.
+    config_digest: str | None = None
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from fmro_pc.config import SourceConfig
+from fmro_pc.crawl.fetcher import FetchedPage
+from fmro_pc.parsers.base import ParsedJob
+from fmro_pc.parsers.registry import get_parser
+
+# Set once per worker process by the pool initializer.
+_WORKER_SOURCES: dict[str, SourceConfig] = {}
+
+
+def _init_worker(sources: dict[str, SourceConfig]) -> None:
+    _WORKER_SOURCES.clear()
+    _WORKER_SOURCES.update(sources)
+
+
+def _parse_in_worker(
+    source_key: str, url: str, html: str, dynamic: bool, soup_backend: str
+) -> list[ParsedJob]:
+    source = _WORKER_SOURCES[source_key]
+    page = FetchedPage(
+        url=url,
+        html=html,
+        status_code=200,
+        dynamic=dynamic,
+        soup_backend=soup_backend,
+        keep_html=False,
+    )
+    return get_parser(source.parser).parse(page, source)
+
+
+class ProcessParsePool:
+    """Runs ``parser.parse`` in worker processes so big listing pages use every core.
+
+    Each source config is shipped once when a worker starts; a parse task only carries
+    the source key, URL and raw HTML, and the ``ParsedJob`` list comes back.
+    """
+
+    def __init__(self, sources: list[SourceConfig], max_workers: int) -> None:
+        # "spawn" keeps workers away from the fetch threads' locks and event loops.
+        self._executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=({source.key: source for source in sources},),
+        )
+
+    def parse(self, page: FetchedPage, source: SourceConfig) -> list[ParsedJob]:
+        future = self._executor.submit(
+            _parse_in_worker, source.key, page.url, page.html, page.dynamic, page.soup_backend
+        )
+        return future.result()
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self) -> ProcessParsePool:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
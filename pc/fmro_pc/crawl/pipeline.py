@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import queue
+import threading
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+_STOP = object()
+
+
+@dataclass
+class Stage:
+    """One pipeline step. ``func`` returns the item(s) for the next stage, or ``None``."""
+
+    name: str
+    func: Callable[[Any], Any]
+    workers: int = 1
+    fan_out: bool = False
+
+
+class _StageRunner:
+    def __init__(
+        self,
+        stage: Stage,
+        inbox: queue.Queue,
+        outbox: queue.Queue,
+        downstream_workers: int,
+        cancelled: threading.Event,
+        errors: list[BaseException],
+    ) -> None:
+        self.stage = stage
+        self.inbox = inbox
+        self.outbox = outbox
+        self.downstream_workers = downstream_workers
+        self.cancelled = cancelled
+        self.errors = errors
+        self._remaining = stage.workers
+        self._lock = threading.Lock()
+        self.threads = [
+            threading.Thread(
+                target=self._work,
+                name=f"crawl-{stage.name}-{index}",
+                daemon=True,
+            )
+            for index in range(stage.workers)
+        ]
+
+    def start(self) -> None:
+        for thread in self.threads:
+            thread.start()
+
+    def _emit(self, result: Any) -> None:
+        if result is None:
+            return
+        items = result if self.stage.fan_out else [result]
+        for item in items:
+            self.outbox.put(item)
+
+    def _work(self) -> None:
+        try:
+            while True:
+                item = self.inbox.get()
+                if item is _STOP:
+                    break
+                if self.cancelled.is_set():
+                    continue
+                try:
+                    self._emit(self.stage.func(item))
+                except BaseException as exc:  # noqa: BLE001
+                    self.errors.append(exc)
+                    self.cancelled.set()
+        finally:
+            with self._lock:
+                self._remaining -= 1
+                last = self._remaining == 0
+            if last:
+                # The last worker out tells every downstream worker to stop.
+                for _ in range(self.downstream_workers):
+                    self.outbox.put(_STOP)
+
+
+def run_pipeline(
+    items: Iterable[Any],
+    stages: list[Stage],
+    sink: Callable[[Any], None],
+    *,
+    queue_size: int = 16,
+) -> None:
+    """Push ``items`` through ``stages`` on worker threads, calling ``sink`` on this thread.
+
+    Stages are connected by bounded queues, so a slow stage applies backpressure to the
+    ones before it instead of letting fetched pages pile up in memory. ``sink`` runs on
+    the calling thread, which keeps thread-bound resources (like a DB session) there.
+    The first exception raised by a stage or by ``sink`` cancels the run and is re-raised.
+    """
+    if not stages:
+        raise ValueError("pipeline needs at least one stage")
+    if any(stage.workers < 1 for stage in stages):
+        raise ValueError("every stage needs at least one worker")
+
+    cancelled = threading.Event()
+    errors: list[BaseException] = []
+    queues = [queue.Queue(maxsize=queue_size) for _ in range(len(stages) + 1)]
+    runners = [
+        _StageRunner(
+            stage,
+            inbox=queues[index],
+            outbox=queues[index + 1],
+            downstream_workers=stages[index + 1].workers if index + 1 < len(stages) else 1,
+            cancelled=cancelled,
+            errors=errors,
+        )
+        for index, stage in enumerate(stages)
+    ]
+    for runner in runners:
+        runner.start()
+
+    def feed() -> None:
+        try:
+            for item in items:
+                if cancelled.is_set():
+                    break
+                queues[0].put(item)
+        except BaseException as exc:  # noqa: BLE001
+            errors.append(exc)
+            cancelled.set()
+        finally:
+            for _ in range(stages[0].workers):
+                queues[0].put(_STOP)
+
+    feeder = threading.Thread(target=feed, name="crawl-feed", daemon=True)
+    feeder.start()
+
+    results = queues[-1]
+    while True:
+        item = results.get()
+        if item is _STOP:
+            break
+        if cancelled.is_set():
+            continue
+        try:
+            sink(item)
+        except BaseException as exc:  # noqa: BLE001
+            errors.append(exc)
+            cancelled.set()
+
+    feeder.join()
+    for runner in runners:
+        for thread in runner.threads:
+            thread.join()
+
+    if errors:
+        raise errors[0]
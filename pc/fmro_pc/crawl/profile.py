@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import math
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass
+class StageTiming:
+    calls: int = 0
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+
+    def add(self, other: StageTiming) -> None:
+        self.calls += other.calls
+        self.wall_seconds += other.wall_seconds
+        self.cpu_seconds += other.cpu_seconds
+
+
+@dataclass
+class CrawlProfile:
+    """Wall/CPU time per crawl stage plus byte counters, for one source or a whole run.
+
+    CPU time is ``time.thread_time`` of the thread running the stage, so work done in
+    other threads or processes (the async fetch loop, process-pool parsing) shows up as
+    wall time only.
+    """
+
+    stages: dict[str, StageTiming] = field(default_factory=dict)
+    bytes_downloaded: int = 0
+    html_bytes: int = 0
+    url_latencies_ms: list[float] = field(default_factory=list)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        wall_started = time.perf_counter()
+        cpu_started = time.thread_time()
+        try:
+            yield
+        finally:
+            timing = self.stages.setdefault(name, StageTiming())
+            timing.calls += 1
+            timing.wall_seconds += time.perf_counter() - wall_started
+            timing.cpu_seconds += time.thread_time() - cpu_started
+
+    def merge(self, other: CrawlProfile) -> None:
+        for name, timing in other.stages.items():
+            self.stages.setdefault(name, StageTiming()).add(timing)
+        self.bytes_downloaded += other.bytes_downloaded
+        self.html_bytes += other.html_bytes
+        self.url_latencies_ms.extend(other.url_latencies_ms)
+
+    def latency_percentile(self, percentile: float) -> float | None:
+        """Nearest-rank percentile of per-URL fetch latency, or ``None`` without samples."""
+        if not self.url_latencies_ms:
+            return None
+        ordered = sorted(self.url_latencies_ms)
+        rank = max(1, math.ceil(percentile / 100 * len(ordered)))
+        return ordered[rank - 1]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "bytes_downloaded": self.bytes_downloaded,
+            "html_bytes": self.html_bytes,
+            "url_latency_ms": {
+                "count": len(self.url_latencies_ms),
+                "p50": self.latency_percentile(50),
+                "p95": self.latency_percentile(95),
+            },
+            "stages": {
+                name: {
+                    "calls": timing.calls,
+                    "wall_seconds": round(timing.wall_seconds, 6),
+                    "cpu_seconds": round(timing.cpu_seconds, 6),
+                }
+                for name, timing in sorted(self.stages.items())
+            },
+        }
+
+
+def format_profile_table(rows: list[tuple[str, CrawlProfile]]) -> list[str]:
+    """Render one block per (label, profile) as fixed-width text lines."""
+    lines: list[str] = []
+    for label, profile in rows:
+        lines.append(
+            f"[{label}] downloaded={profile.bytes_downloaded:,}B html={profile.html_bytes:,}B"
+        )
+        lines.append(f"  {'stage':<18} {'calls':>7} {'wall s':>10} {'cpu s':>10}")
+        for name, timing in sorted(
+            profile.stages.items(), key=lambda item: item[1].wall_seconds, reverse=True
+        ):
+            lines.append(
+                f"  {name:<18} {timing.calls:>7} "
+                f"{timing.wall_seconds:>10.3f} {timing.cpu_seconds:>10.3f}"
+            )
+    return lines
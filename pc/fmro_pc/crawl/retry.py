@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import random
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import TypeVar
+
+from fmro_pc.config import RetryConfig
+from fmro_pc.crawl.fetcher import FetchError
+
+T = TypeVar("T")
+
+
+@dataclass
+class RetryStats:
+    retries: int = 0
+    # Backoff sleeps plus the time spent on attempts after the first.
+    extra_seconds: float = 0.0
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """When and how long to retry a GET fetch.
+
+    Network errors (``FetchError`` without a status) and ``retry_statuses`` are retried
+    up to ``max_attempts`` in total with full-jitter exponential backoff. A
+    ``Retry-After`` from the server replaces the backoff; if it asks for longer than
+    ``max_delay_seconds`` we give up instead of sleeping. Only wrap idempotent GETs.
+    """
+
+    max_attempts: int = 3
+    base_delay_seconds: float = 1.0
+    max_delay_seconds: float = 30.0
+    retry_statuses: frozenset[int] = field(
+        default_factory=lambda: frozenset({429, 500, 502, 503, 504})
+    )
+
+    @classmethod
+    def from_config(cls, config: RetryConfig) -> RetryPolicy:
+        return cls(
+            max_attempts=config.max_attempts,
+            base_delay_seconds=config.base_delay_seconds,
+            max_delay_seconds=config.max_delay_seconds,
+            retry_statuses=frozenset(config.retry_statuses),
+        )
+
+    def is_retryable(self, exc: BaseException) -> bool:
+        if not isinstance(exc, FetchError):
+            return False
+        return exc.status_code is None or exc.status_code in self.retry_statuses
+
+    def delay(self, retry: int, exc: BaseException) -> float | None:
+        """Seconds before retry number ``retry`` (1-based), or ``None`` to give up."""
+        retry_after = getattr(exc, "retry_after", None)
+        if retry_after is not None:
+            return retry_after if retry_after <= self.max_delay_seconds else None
+        ceiling = min(self.max_delay_seconds, self.base_delay_seconds * 2 ** (retry - 1))
+        return random.uniform(0, ceiling)
+
+    def call(
+        self,
+        func: Callable[[], T],
+        stats: RetryStats,
+        *,
+        first_error: BaseException | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> T:
+        """Run ``func`` until it succeeds or the policy gives up (re-raising the error).
+
+        ``first_error`` is the failure of an attempt already made elsewhere (e.g. a
+        batched async fetch); it counts against ``max_attempts``.
+        """
+        attempts = 0 if first_error is None else 1
+        error = first_error
+        while True:
+            if error is not None:
+                delay = self.delay(attempts, error)
+                if attempts >= self.max_attempts or not self.is_retryable(error) or delay is None:
+                    raise error
+                stats.retries += 1
+                stats.extra_seconds += delay
+                sleep(delay)
+            started = time.perf_counter()
+            try:
+                return func()
+            except Exception as exc:  # noqa: BLE001
+                error = exc
+            finally:
+                attempts += 1
+                if attempts > 1:
+                    stats.extra_seconds += time.perf_counter() - started
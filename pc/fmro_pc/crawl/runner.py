@@ -1,16 +1,52 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import time
+from contextlib import ExitStack
+from dataclasses import dataclass, field, replace
+from functools import partial
 
 from sqlmodel import Session
 
 from fmro_pc.config import CompaniesConfig, SourceConfig, select_sources
 from fmro_pc.crawl.browser import PlaywrightFetcher
-from fmro_pc.crawl.fetcher import ScraplingFetcher, StaticFetcher
-from fmro_pc.crawl.normalize import matches_source_filters, normalize_job
+from fmro_pc.crawl.circuit_breaker import BLOCK_STATUS_CODES, CircuitBreaker
+from fmro_pc.crawl.content_hash import page_content_hash
+from fmro_pc.crawl.engine_memory import EngineSelector
+from fmro_pc.crawl.fetcher import (
+    AsyncStaticFetcher,
+    FetchedPage,
+    FetchError,
+    ScraplingFetcher,
+    StaticFetcher,
+    UnsupportedPageError,
+    resolve_soup_backend,
+)
+from fmro_pc.crawl.normalize import NormalizedJob, matches_source_filters, normalize_job
+from fmro_pc.crawl.page_cache import CachedPage, extraction_digest
+from fmro_pc.crawl.parse_pool import ProcessParsePool
+from fmro_pc.crawl.pipeline import Stage, run_pipeline
+from fmro_pc.crawl.profile import CrawlProfile
+from fmro_pc.crawl.resource_policy import ResourcePolicy
+from fmro_pc.crawl.retry import RetryPolicy, RetryStats
+from fmro_pc.crawl.scroll import list_item_selector
+from fmro_pc.crawl.throttle import HostConcurrencyLimiter, build_rate_limiter, host_of
+from fmro_pc.parsers.base import ParsedJob
+from fmro_pc.parsers.embedded import parse_embedded_jobs
+from fmro_pc.parsers.json_api import capture_patterns, parse_captured_json
 from fmro_pc.parsers.registry import get_parser
-from fmro_pc.storage.repository import UpsertStats, upsert_jobs
-
+from fmro_pc.parsers.selector import next_page_url
+from fmro_pc.storage.repository import (
+    UpsertStats,
+    load_breaker_records,
+    load_cached_pages,
+    load_engine_records,
+    save_breaker_records,
+    save_cached_pages,
+    save_engine_records,
+    upsert_jobs,
+)
+
+ENGINES = ("auto", "scrapling", "static", "async")
 RISK_PLATFORMS = {"boss_zhipin", "liepin", "shixiseng"}
 BLOCK_HINTS = [
     "验证码",
@@ -28,12 +64,30 @@ BLOCK_HINTS = [
 class SourceRunSummary:
     source_key: str
     pages_fetched: int = 0
+    pages_not_modified: int = 0
+    pages_unchanged: int = 0
+    pages_skipped: int = 0
     parse_failures: int = 0
     jobs_extracted: int = 0
     jobs_normalized: int = 0
     jobs_filtered_out: int = 0
+    requests_blocked: int = 0
+    bytes_saved: int = 0
+    retries: int = 0
+    retry_seconds: float = 0.0
     upsert: UpsertStats = field(default_factory=UpsertStats)
+    engines: dict[str, int] = field(default_factory=dict)
     errors: list[str] = field(default_factory=list)
+    profile: CrawlProfile = field(default_factory=CrawlProfile)
+
+    @property
+    def engine_label(self) -> str:
+        """Engines that produced pages, e.g. ``static`` or ``dynamic:1,static:3``."""
+        if not self.engines:
+            return "-"
+        if len(self.engines) == 1:
+            return next(iter(self.engines))
+        return ",".join(f"{name}:{count}" for name, count in sorted(self.engines.items()))
 
 
 @dataclass
@@ -45,6 +99,18 @@ class CrawlSummary:
     def total_pages_fetched(self) -> int:
         return sum(item.pages_fetched for item in self.sources)
 
+    @property
+    def total_pages_not_modified(self) -> int:
+        return sum(item.pages_not_modified for item in self.sources)
+
+    @property
+    def total_pages_unchanged(self) -> int:
+        return sum(item.pages_unchanged for item in self.sources)
+
+    @property
+    def total_pages_skipped(self) -> int:
+        return sum(item.pages_skipped for item in self.sources)
+
     @property
     def total_jobs_extracted(self) -> int:
         return sum(item.jobs_extracted for item in self.sources)
@@ -65,10 +131,33 @@ class CrawlSummary:
     def total_jobs_deactivated(self) -> int:
         return sum(item.upsert.deactivated for item in self.sources)
 
+    @property
+    def total_requests_blocked(self) -> int:
+        return sum(item.requests_blocked for item in self.sources)
+
+    @property
+    def total_bytes_saved(self) -> int:
+        return sum(item.bytes_saved for item in self.sources)
+
+    @property
+    def total_retries(self) -> int:
+        return sum(item.retries for item in self.sources)
+
+    @property
+    def total_retry_seconds(self) -> float:
+        return sum(item.retry_seconds for item in self.sources)
+
     @property
     def total_failures(self) -> int:
         return sum(item.parse_failures + len(item.errors) for item in self.sources)
 
+    @property
+    def profile(self) -> CrawlProfile:
+        total = CrawlProfile()
+        for item in self.sources:
+            total.merge(item.profile)
+        return total
+
 
 def _should_use_dynamic(source: SourceConfig, force_dynamic: bool) -> bool:
     if force_dynamic:
@@ -86,6 +175,500 @@ def _has_cookie_header(source: SourceConfig) -> bool:
     return any(key.lower() == "cookie" and value.strip() for key, value in headers.items())
 
 
+@dataclass
+class _CrawlTools:
+    dynamic_fetcher: PlaywrightFetcher
+    scrapling_fetcher: ScraplingFetcher
+    static_fetcher: StaticFetcher
+    host_limiter: HostConcurrencyLimiter
+    engine_selector: EngineSelector
+    page_cache: dict[str, CachedPage]
+    breaker: CircuitBreaker = field(default_factory=CircuitBreaker)
+    async_fetcher: AsyncStaticFetcher | None = None
+    parse_pool: ProcessParsePool | None = None
+    resource_policies: dict[str, ResourcePolicy] = field(default_factory=dict)
+    retry_policies: dict[str, RetryPolicy] = field(default_factory=dict)
+    config_digests: dict[str, str] = field(default_factory=dict)
+    soup_backend: str = "auto"
+    keep_html: bool = True
+
+
+def _pages_per_entry(source: SourceConfig) -> int:
+    """Listing pages fetched per entry URL: ``crawl_depth`` when a next-page link is set."""
+    if source.selectors is not None and source.selectors.next_page:
+        return source.crawl_depth
+    return 1
+
+
+def _cached_page(tools: _CrawlTools, source: SourceConfig, url: str) -> CachedPage | None:
+    """The cache entry for ``url``, unless it was extracted under other source settings."""
+    cached = tools.page_cache.get(url)
+    if cached is None or cached.config_digest != tools.config_digests.get(source.key):
+        return None
+    return cached
+
+
+def _conditional_headers(tools: _CrawlTools, source: SourceConfig, url: str) -> dict[str, str]:
+    if _pages_per_entry(source) > 1:
+        # A 304 has no body to find the next-page link in; the content hash still applies.
+        return {}
+    cached = _cached_page(tools, source, url)
+    return cached.conditional_headers() if cached is not None else {}
+
+
+def _engine_chain(source: SourceConfig, *, force_dynamic: bool, engine: str) -> list[str]:
+    chain = ["dynamic"] if _should_use_dynamic(source, force_dynamic) else []
+    if engine == "auto":
+        chain.extend(["scrapling", "static"])
+    else:
+        chain.append(engine)
+    return chain
+
+
+@dataclass
+class _FetchResult:
+    page: FetchedPage
+    engine: str
+    latency_ms: float | None = None
+
+
+def _record_block(
+    tools: _CrawlTools, source: SourceConfig, summary: SourceRunSummary, url: str, reason: str
+) -> None:
+    record = tools.breaker.record_block(source.key, host_of(url), reason)
+    if record is not None:
+        summary.errors.append(
+            f"circuit breaker opened for {record.host} after {tools.breaker.trip_after} "
+            f"blocks ({reason}); skipping until {record.open_until:%Y-%m-%d %H:%M} UTC"
+        )
+
+
+def _fetch_page(
+    url: str,
+    source: SourceConfig,
+    summary: SourceRunSummary,
+    tools: _CrawlTools,
+    *,
+    chain: list[str],
+    prefetched: FetchedPage | BaseException | None = None,
+) -> _FetchResult | None:
+    host = host_of(url)
+
+    if tools.breaker.open_record(source.key, host) is not None:
+        summary.pages_skipped += 1
+        return None
+    if isinstance(prefetched, FetchedPage):
+        return _FetchResult(page=prefetched, engine="async", latency_ms=prefetched.elapsed_ms)
+
+    conditional = _conditional_headers(tools, source, url)
+    fetchers = {
+        "dynamic": tools.dynamic_fetcher,
+        "scrapling": tools.scrapling_fetcher,
+        "static": tools.static_fetcher,
+        "async": tools.async_fetcher,
+    }
+    if prefetched is not None:
+        # The batched async attempt failed; it counts as the first try of the async engine.
+        order = ["async"]
+    else:
+        order = tools.engine_selector.order(source.key, host, chain)
+    headers = source.request_headers or None
+    retry_policy = tools.retry_policies.get(source.key) or RetryPolicy()
+    blocked_status: int | None = None
+
+    with tools.host_limiter.slot(url):
+        for position, name in enumerate(order):
+            request_headers = headers
+            options = {}
+            if name == "dynamic":
+                options["resource_policy"] = tools.resource_policies.get(source.key)
+                options["scroll_selector"] = list_item_selector(source.parser)
+                options["session_key"] = source.key
+                if source.capture_api_json:
+                    options["capture_url_patterns"] = capture_patterns(source.parser)
+            else:
+                options["max_bytes"] = source.max_page_bytes
+                # Browsers would send validators for every subresource, so only HTTP engines.
+                if conditional:
+                    request_headers = {**(headers or {}), **conditional}
+            started = time.perf_counter()
+            retry_stats = RetryStats()
+            try:
+                with summary.profile.stage(f"fetch:{name}"):
+                    page = retry_policy.call(
+                        partial(fetchers[name].fetch, url, headers=request_headers, **options),
+                        retry_stats,
+                        first_error=prefetched if position == 0 else None,
+                    )
+            except UnsupportedPageError as exc:
+                summary.errors.append(f"{name} fetch skipped {url}: {exc}")
+                break
+            except Exception as exc:
+                tools.engine_selector.record_failure(source.key, host, name)
+                blocked_status = _block_status(exc) or blocked_status
+                suffix = "; falling back" if position < len(order) - 1 else ""
+                summary.errors.append(f"{name} fetch failed for {url}: {exc}{suffix}")
+                continue
+            finally:
+                summary.retries += retry_stats.retries
+                summary.retry_seconds += retry_stats.extra_seconds
+            latency_ms = (time.perf_counter() - started) * 1000
+            return _FetchResult(page=page, engine=name, latency_ms=latency_ms)
+
+    summary.parse_failures += 1
+    if len(order) > 1:
+        summary.errors.append(f"no fetch engine succeeded for {url}")
+    if blocked_status is not None:
+        _record_block(tools, source, summary, url, f"HTTP {blocked_status}")
+    return None
+
+
+def _block_status(exc: BaseException) -> int | None:
+    if isinstance(exc, FetchError) and exc.status_code in BLOCK_STATUS_CODES:
+        return exc.status_code
+    return None
+
+
+@dataclass
+class _FetchJob:
+    """Input of the fetch stage: one URL, or every URL of an async-engine source."""
+
+    source: SourceConfig
+    chain: list[str]
+    urls: list[tuple[int, str]]
+
+
+@dataclass
+class _PageTask:
+    """One listing page moving through the pipeline.
+
+    Each task counts into its own ``summary``; the sink merges them in URL order, so
+    worker threads never touch shared counters.
+    """
+
+    source: SourceConfig
+    index: int
+    url: str
+    summary: SourceRunSummary
+    page: FetchedPage | None = None
+    parsed_jobs: list[ParsedJob] = field(default_factory=list)
+    jobs: list[NormalizedJob] = field(default_factory=list)
+    carried_fingerprints: set[str] = field(default_factory=set)
+    cache_update: CachedPage | None = None
+    next_url: str | None = None
+
+
+@dataclass
+class _SourceState:
+    source: SourceConfig
+    position: int
+    tasks: list[_PageTask | None]
+    pending: int
+
+
+def _fetch_jobs(
+    sources: list[SourceConfig],
+    tools: _CrawlTools,
+    *,
+    limit: int | None,
+    force_dynamic: bool,
+    engine: str,
+) -> list[_FetchJob]:
+    jobs: list[_FetchJob] = []
+    for source in sources:
+        urls = source.entry_urls[:limit] if limit and limit > 0 else source.entry_urls
+        # Each entry URL owns a block of task indexes for the pages it paginates into.
+        pages = _pages_per_entry(source)
+        indexed = [(position * pages, url) for position, url in enumerate(urls)]
+        chain = _engine_chain(source, force_dynamic=force_dynamic, engine=engine)
+        if chain == ["async"] and tools.async_fetcher is not None:
+            # All entry URLs of the source go out at once and share pooled connections.
+            jobs.append(_FetchJob(source=source, chain=chain, urls=indexed))
+        else:
+            jobs.extend(_FetchJob(source=source, chain=chain, urls=[item]) for item in indexed)
+    return jobs
+
+
+def _fetch_stage(job: _FetchJob, tools: _CrawlTools) -> list[_PageTask]:
+    source = job.source
+    tasks = [
+        _PageTask(
+            source=source,
+            index=index,
+            url=url,
+            summary=SourceRunSummary(source_key=source.key),
+        )
+        for index, url in job.urls
+    ]
+
+    prefetched: dict[str, FetchedPage | BaseException] = {}
+    urls = [
+        url for _, url in job.urls if tools.breaker.open_record(source.key, host_of(url)) is None
+    ]
+    if len(urls) > 1 and tools.async_fetcher is not None:
+        headers = source.request_headers or None
+        per_url = {url: _conditional_headers(tools, source, url) for url in urls}
+        # The batch is one wall-clock span; book it on the first URL of the source.
+        with tasks[0].summary.profile.stage("fetch:async"):
+            pages = tools.async_fetcher.fetch_many(
+                urls, headers, per_url_headers=per_url, max_bytes=source.max_page_bytes
+            )
+        prefetched = dict(zip(urls, pages, strict=True))
+
+    for task in tasks:
+        _fetch_task(task, tools, chain=job.chain, prefetched=prefetched.get(task.url))
+
+    pages = _pages_per_entry(source)
+    if pages > 1:
+        for first in list(tasks):
+            tasks.extend(_follow_pages(first, tools, chain=job.chain, pages=pages))
+    return tasks
+
+
+def _follow_pages(
+    first: _PageTask, tools: _CrawlTools, *, chain: list[str], pages: int
+) -> list[_PageTask]:
+    """Fetch the next-page links after ``first``, one page at a time.
+
+    Always returns ``pages - 1`` tasks so every entry URL fills its block of indexes;
+    pages past the end of the listing are empty tasks.
+    """
+    source = first.source
+    seen = {first.url}
+    current = first
+    followed: list[_PageTask] = []
+    for depth in range(1, pages):
+        url = current.next_url if current.next_url not in seen else None
+        task = _PageTask(
+            source=source,
+            index=first.index + depth,
+            url=url or first.url,
+            summary=SourceRunSummary(source_key=source.key),
+        )
+        if url is not None:
+            seen.add(url)
+            _fetch_task(task, tools, chain=chain, prefetched=None)
+        elif current.summary.pages_skipped:
+            # The breaker hid the rest of the listing: keep its cached pages' jobs active.
+            host = host_of(first.url)
+            for cached_url in tools.page_cache:
+                cached = _cached_page(tools, source, cached_url)
+                if (
+                    cached is not None
+                    and cached.source_key == source.key
+                    and host_of(cached_url) == host
+                ):
+                    task.carried_fingerprints.update(cached.fingerprints)
+        followed.append(task)
+        current = task
+    return followed
+
+
+def _fetch_task(
+    task: _PageTask,
+    tools: _CrawlTools,
+    *,
+    chain: list[str],
+    prefetched: FetchedPage | BaseException | None,
+) -> None:
+    source, url, summary = task.source, task.url, task.summary
+    fetched = _fetch_page(url, source, summary, tools, chain=chain, prefetched=prefetched)
+    if fetched is None:
+        cached = _cached_page(tools, source, url)
+        if summary.pages_skipped and cached is not None:
+            # Not fetched this run; keep the page's jobs active until it can be checked.
+            task.carried_fingerprints.update(cached.fingerprints)
+        return
+
+    page = fetched.page
+    summary.pages_fetched += 1
+    summary.engines[fetched.engine] = 1
+    summary.profile.bytes_downloaded += page.bytes_downloaded or 0
+    summary.profile.html_bytes += len(page.html.encode("utf-8"))
+    summary.requests_blocked += page.requests_blocked
+    summary.bytes_saved += page.bytes_saved
+    if fetched.latency_ms is not None:
+        summary.profile.url_latencies_ms.append(fetched.latency_ms)
+
+    cached = _cached_page(tools, source, url)
+    if page.not_modified and cached is not None:
+        tools.engine_selector.record_success(
+            source.key, host_of(url), fetched.engine, fetched.latency_ms
+        )
+        tools.breaker.record_success(source.key, host_of(url))
+        summary.pages_not_modified += 1
+        task.carried_fingerprints.update(cached.fingerprints)
+        return
+
+    with summary.profile.stage("block_check"):
+        blocked = _looks_like_block_page(page.html)
+    if blocked:
+        tools.engine_selector.record_block(source.key, host_of(url), fetched.engine)
+        summary.errors.append(f"blocked by anti-bot for {url} (captcha/verification detected)")
+        summary.parse_failures += 1
+        _record_block(tools, source, summary, url, "captcha page")
+        return
+
+    tools.engine_selector.record_success(
+        source.key, host_of(url), fetched.engine, fetched.latency_ms
+    )
+    tools.breaker.record_success(source.key, host_of(url))
+
+    if _pages_per_entry(source) > 1:
+        # Builds the soup here, before keep_html applies, so the parser can reuse it.
+        page.soup_backend = tools.soup_backend
+        with summary.profile.stage("next_page"):
+            task.next_url = next_page_url(page, source.selectors)
+
+    with summary.profile.stage("content_hash"):
+        content_hash = page_content_hash(page.html)
+    if cached is not None and cached.content_hash == content_hash:
+        # Same listing as last run: reuse its fingerprints instead of re-parsing.
+        summary.pages_unchanged += 1
+        task.carried_fingerprints.update(cached.fingerprints)
+        task.cache_update = replace(cached, etag=page.etag, last_modified=page.last_modified)
+        return
+
+    page.soup_backend = tools.soup_backend
+    page.keep_html = tools.keep_html
+    task.page = page
+    task.cache_update = CachedPage(
+        url=url,
+        source_key=source.key,
+        etag=page.etag,
+        last_modified=page.last_modified,
+        content_hash=content_hash,
+        config_digest=tools.config_digests.get(source.key),
+    )
+
+
+def _parse_stage(task: _PageTask, tools: _CrawlTools) -> _PageTask:
+    page = task.page
+    if page is None:
+        return task
+
+    # Release the page as soon as it is parsed; only the extracted jobs travel on.
+    task.page = None
+    if page.captured_json:
+        try:
+            with task.summary.profile.stage("parse_json"):
+                task.parsed_jobs = parse_captured_json(page.captured_json, task.source)
+        except Exception as exc:
+            # An unexpected API payload shape: report it and parse the rendered DOM instead.
+            task.summary.errors.append(f"captured JSON parse failed for {task.url}: {exc}")
+            task.parsed_jobs = []
+        if task.parsed_jobs:
+            task.summary.jobs_extracted += len(task.parsed_jobs)
+            return task
+
+    if task.source.embedded_data and page.html:
+        # Structured data is read straight from the HTML; the DOM is never built for it.
+        try:
+            with task.summary.profile.stage("parse_embedded"):
+                task.parsed_jobs = parse_embedded_jobs(page.html, page.url, task.source)
+        except Exception as exc:
+            # Malformed structured data: report it and let the DOM parser have the page.
+            task.summary.errors.append(f"embedded data parse failed for {task.url}: {exc}")
+            task.parsed_jobs = []
+        if task.parsed_jobs:
+            task.summary.jobs_extracted += len(task.parsed_jobs)
+            return task
+
+    parser = tools.parse_pool or get_parser(task.source.parser)
+    try:
+        with task.summary.profile.stage("parse"):
+            task.parsed_jobs = parser.parse(page, task.source)
+    except Exception as exc:
+        task.summary.errors.append(f"parse failed for {task.url}: {exc}")
+        task.summary.parse_failures += 1
+        task.cache_update = None
+        return task
+
+    task.summary.jobs_extracted += len(task.parsed_jobs)
+    return task
+
+
+def _normalize_stage(task: _PageTask) -> _PageTask:
+    source, summary = task.source, task.summary
+    normalized_jobs: list[NormalizedJob] = []
+    with summary.profile.stage("normalize"):
+        for parsed_job in task.parsed_jobs:
+            try:
+                normalized_jobs.append(normalize_job(parsed_job, source))
+            except ValueError:
+                summary.parse_failures += 1
+
+    with summary.profile.stage("filter"):
+        for normalized in normalized_jobs:
+            if not matches_source_filters(normalized, source):
+                summary.jobs_filtered_out += 1
+                continue
+            task.jobs.append(normalized)
+
+    task.parsed_jobs = []
+    if task.cache_update is not None and task.cache_update.content_hash is not None:
+        task.cache_update.fingerprints = [job.fingerprint for job in task.jobs]
+    return task
+
+
+def _merge_summary(target: SourceRunSummary, part: SourceRunSummary) -> None:
+    target.pages_fetched += part.pages_fetched
+    target.pages_not_modified += part.pages_not_modified
+    target.pages_unchanged += part.pages_unchanged
+    target.pages_skipped += part.pages_skipped
+    target.parse_failures += part.parse_failures
+    target.jobs_extracted += part.jobs_extracted
+    target.jobs_filtered_out += part.jobs_filtered_out
+    target.requests_blocked += part.requests_blocked
+    target.bytes_saved += part.bytes_saved
+    target.retries += part.retries
+    target.retry_seconds += part.retry_seconds
+    for name, count in part.engines.items():
+        target.engines[name] = target.engines.get(name, 0) + count
+    target.errors.extend(part.errors)
+    target.profile.merge(part.profile)
+
+
+def _store_source(session: Session, state: _SourceState) -> SourceRunSummary:
+    """Upsert one finished source. Always called from the thread that owns ``session``."""
+    source = state.source
+    source_summary = SourceRunSummary(source_key=source.key)
+    jobs: list[NormalizedJob] = []
+    carried: set[str] = set()
+    cache_updates: list[CachedPage] = []
+    for task in state.tasks:
+        if task is None:
+            continue
+        _merge_summary(source_summary, task.summary)
+        jobs.extend(task.jobs)
+        carried.update(task.carried_fingerprints)
+        if task.cache_update is not None:
+            cache_updates.append(task.cache_update)
+
+    source_summary.jobs_normalized = len(jobs)
+    source_summary.upsert = upsert_jobs(
+        session,
+        jobs,
+        source_key=source.key,
+        carried_fingerprints=carried,
+        profile=source_summary.profile,
+    )
+    with source_summary.profile.stage("page_cache"):
+        save_cached_pages(session, cache_updates)
+
+    # Pages answered with 304 or unchanged content carry their jobs without re-parsing.
+    if (
+        source.platform in RISK_PLATFORMS
+        and source_summary.jobs_extracted == 0
+        and not carried
+        and not _has_cookie_header(source)
+    ):
+        source_summary.errors.append(
+            "no jobs extracted; this platform often needs login Cookie in request_headers"
+        )
+    return source_summary
+
+
 def run_crawl(
     session: Session,
     config: CompaniesConfig,
@@ -94,106 +677,119 @@ def run_crawl(
     limit: int | None = None,
     force_dynamic: bool = False,
     engine: str = "auto",
+    workers: int = 1,
+    max_per_host: int = 2,
+    parse_workers: int = 1,
+    parse_processes: int = 0,
+    normalize_workers: int = 1,
+    queue_size: int = 16,
+    browsers: int = 1,
+    soup_backend: str = "auto",
+    keep_html: bool = True,
 ) -> CrawlSummary:
-    if engine not in {"auto", "scrapling", "static"}:
-        raise ValueError("engine must be one of: auto, scrapling, static")
+    """Crawl the selected sources through a fetch -> parse -> normalize -> upsert pipeline.
+
+    ``workers`` fetch threads, ``parse_workers`` parse threads and ``normalize_workers``
+    normalize threads are connected by queues of ``queue_size`` items, so parsing page N
+    overlaps fetching page N+1. Upserts run on the calling thread, one source at a time,
+    once all of that source's URLs are through.
+
+    With ``parse_processes`` > 0, parsing is handed to that many worker processes
+    instead of running under the GIL on the parse threads. Dynamic sources share
+    ``browsers`` long-lived Chromium instances for the whole run.
+
+    Pages are only turned into a ``soup_backend`` tree when they reach the parser;
+    ``keep_html=False`` drops the raw HTML as soon as that tree exists.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"engine must be one of: {', '.join(ENGINES)}")
+    if min(workers, parse_workers, normalize_workers, browsers) < 1:
+        raise ValueError("worker counts must be >= 1")
+    if queue_size < 1:
+        raise ValueError("queue_size must be >= 1")
+    if parse_processes < 0:
+        raise ValueError("parse_processes must be >= 0")
+    resolve_soup_backend(soup_backend)
 
     sources = select_sources(config, source_key=source_key, only_enabled=True)
-    source_summaries: list[SourceRunSummary] = []
-
-    dynamic_fetcher = PlaywrightFetcher()
-    scrapling_fetcher = ScraplingFetcher()
-    with StaticFetcher() as static_fetcher:
-        for source in sources:
-            source_summary = SourceRunSummary(source_key=source.key)
-            parser = get_parser(source.parser)
-            urls = source.entry_urls[:limit] if limit and limit > 0 else source.entry_urls
-
-            normalized_jobs = []
-            for url in urls:
-                use_dynamic = _should_use_dynamic(source, force_dynamic)
-                page = None
-
-                headers = source.request_headers or None
-
-                if use_dynamic:
-                    try:
-                        page = dynamic_fetcher.fetch(url, headers=headers)
-                    except Exception as exc:
-                        source_summary.errors.append(
-                            f"dynamic fetch failed for {url}: {exc}; falling back"
-                        )
-
-                if page is None and engine in {"auto", "scrapling"}:
-                    try:
-                        page = scrapling_fetcher.fetch(url, headers=headers)
-                    except Exception as exc:
-                        source_summary.errors.append(
-                            f"scrapling fetch failed for {url}: {exc}; falling back"
-                        )
-
-                if page is None and engine in {"auto", "static"}:
-                    try:
-                        page = static_fetcher.fetch(url, headers=headers)
-                    except Exception as exc:
-                        source_summary.errors.append(f"static fetch failed for {url}: {exc}")
-                        source_summary.parse_failures += 1
-                        continue
-
-                if page is None:
-                    source_summary.parse_failures += 1
-                    source_summary.errors.append(f"no fetch engine succeeded for {url}")
-                    continue
-
-                source_summary.pages_fetched += 1
-
-                if _looks_like_block_page(page.html):
-                    source_summary.errors.append(
-                        f"blocked by anti-bot for {url} (captcha/verification detected)"
-                    )
-                    source_summary.parse_failures += 1
-                    continue
-
-                try:
-                    parsed_jobs = parser.parse(page, source)
-                except Exception as exc:
-                    source_summary.errors.append(f"parse failed for {url}: {exc}")
-                    source_summary.parse_failures += 1
-                    continue
-
-                source_summary.jobs_extracted += len(parsed_jobs)
-                for parsed_job in parsed_jobs:
-                    try:
-                        normalized = normalize_job(parsed_job, source)
-                    except ValueError:
-                        source_summary.parse_failures += 1
-                        continue
-
-                    if not matches_source_filters(normalized, source):
-                        source_summary.jobs_filtered_out += 1
-                        continue
-
-                    normalized_jobs.append(normalized)
-
-            source_summary.jobs_normalized = len(normalized_jobs)
-            source_summary.upsert = upsert_jobs(
+    summaries: dict[int, SourceRunSummary] = {}
+
+    rate_limiter = build_rate_limiter(sources)
+
+    with ExitStack() as stack:
+        tools = _CrawlTools(
+            dynamic_fetcher=stack.enter_context(
+                PlaywrightFetcher(rate_limiter=rate_limiter, pool_size=browsers)
+            ),
+            scrapling_fetcher=stack.enter_context(ScraplingFetcher(rate_limiter=rate_limiter)),
+            static_fetcher=stack.enter_context(StaticFetcher(rate_limiter=rate_limiter)),
+            host_limiter=HostConcurrencyLimiter(max_per_host),
+            engine_selector=EngineSelector(load_engine_records(session)),
+            page_cache=load_cached_pages(
                 session,
-                normalized_jobs,
-                source_key=source.key,
+                [url for source in sources for url in source.entry_urls],
+                [source.key for source in sources if _pages_per_entry(source) > 1],
+            ),
+            breaker=CircuitBreaker(load_breaker_records(session)),
+            resource_policies={
+                source.key: ResourcePolicy.from_config(source.resource_policy) for source in sources
+            },
+            retry_policies={
+                source.key: RetryPolicy.from_config(source.retry) for source in sources
+            },
+            config_digests={source.key: extraction_digest(source) for source in sources},
+            soup_backend=soup_backend,
+            keep_html=keep_html,
+        )
+        if engine == "async":
+            tools.async_fetcher = stack.enter_context(
+                AsyncStaticFetcher(max_per_host=max_per_host, rate_limiter=rate_limiter)
             )
-
-            if (
-                source.platform in RISK_PLATFORMS
-                and source_summary.jobs_extracted == 0
-                and not _has_cookie_header(source)
-            ):
-                source_summary.errors.append(
-                    "no jobs extracted; this platform often needs login Cookie in request_headers"
-                )
-
-            source_summaries.append(source_summary)
+        if parse_processes > 0:
+            tools.parse_pool = stack.enter_context(ProcessParsePool(sources, parse_processes))
+            # Each parse thread waits on one process at a time; keep every process busy.
+            parse_workers = max(parse_workers, parse_processes)
+
+        fetch_jobs = _fetch_jobs(
+            sources, tools, limit=limit, force_dynamic=force_dynamic, engine=engine
+        )
+        states: dict[str, _SourceState] = {}
+        for position, source in enumerate(sources):
+            count = sum(len(job.urls) for job in fetch_jobs if job.source is source)
+            count *= _pages_per_entry(source)
+            states[source.key] = _SourceState(
+                source=source, position=position, tasks=[None] * count, pending=count
+            )
+            if count == 0:
+                summaries[position] = _store_source(session, states[source.key])
+
+        def sink(task: _PageTask) -> None:
+            state = states[task.source.key]
+            state.tasks[task.index] = task
+            state.pending -= 1
+            if state.pending == 0:
+                summaries[state.position] = _store_source(session, state)
+
+        run_pipeline(
+            fetch_jobs,
+            [
+                Stage(
+                    "fetch",
+                    lambda job: _fetch_stage(job, tools),
+                    workers=workers,
+                    fan_out=True,
+                ),
+                Stage("parse", lambda task: _parse_stage(task, tools), workers=parse_workers),
+                Stage("normalize", _normalize_stage, workers=normalize_workers),
+            ],
+            sink,
+            queue_size=queue_size,
+        )
+
+        save_engine_records(session, tools.engine_selector.changed_records())
+        save_breaker_records(session, tools.breaker.changed_records())
 
     return CrawlSummary(
         source_count=len(sources),
-        sources=source_summaries,
+        sources=[summaries[position] for position in sorted(summaries)],
     )
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import time
+
+# Scrolls to the bottom, then resolves as soon as a MutationObserver sees the number of
+# matching elements grow, or after ``waitMs`` if nothing new shows up.
+_SCROLL_ROUND_JS = """
+async ({selector, waitMs}) => {
+  const count = () => document.querySelectorAll(selector).length;
+  const before = count();
+  window.scrollTo(0, document.documentElement.scrollHeight || document.body.scrollHeight);
+  await new Promise((resolve) => {
+    let observer = null;
+    const done = () => {
+      if (observer) observer.disconnect();
+      clearTimeout(timer);
+      resolve();
+    };
+    const timer = setTimeout(done, waitMs);
+    observer = new MutationObserver(() => {
+      if (count() > before) done();
+    });
+    observer.observe(document.body || document.documentElement, {
+      childList: true,
+      subtree: true,
+    });
+  });
+  return count();
+}
+"""
+
+
+def scroll_until_stable(
+    page,
+    *,
+    selector: str = "a[href]",
+    max_rounds: int = 30,
+    stable_rounds: int = 2,
+    round_wait_ms: int = 500,
+    confirm_wait_ms: int = 150,
+    max_seconds: float = 15.0,
+) -> int:
+    """Scroll an infinite list until ``stable_rounds`` scrolls add no ``selector`` matches.
+
+    A round waits up to ``round_wait_ms`` for new items; once a round added none, the
+    rounds confirming that wait only ``confirm_wait_ms``, so a short page is done in
+    well under a second. Stops early on ``max_rounds`` or ``max_seconds``. Returns the
+    final match count.
+    """
+    deadline = time.monotonic() + max_seconds
+    best = page.evaluate("(selector) => document.querySelectorAll(selector).length", selector)
+    stable = 0
+    for _ in range(max_rounds):
+        wait_ms = confirm_wait_ms if stable else round_wait_ms
+        count = page.evaluate(_SCROLL_ROUND_JS, {"selector": selector, "waitMs": wait_ms})
+        if count > best:
+            best = count
+            stable = 0
+        else:
+            stable += 1
+        if stable >= stable_rounds or time.monotonic() >= deadline:
+            break
+    return best
+
+
+# Elements that grow as a job list loads more, keyed by parser name.
+LIST_ITEM_SELECTORS = {
+    "boss_zhipin": 'a[href*="/job_detail/"]',
+    "liepin": 'a[href*="/job/"]',
+    "shixiseng": 'a[href*="/intern/"]',
+}
+
+
+def list_item_selector(parser: str) -> str:
+    return LIST_ITEM_SELECTORS.get(parser, "a[href]")
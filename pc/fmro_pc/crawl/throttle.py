@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+from fmro_pc.config import SourceConfig
+
+
+def host_of(url: str) -> str:
+    host = urlsplit(url).netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    return host
+
+
+class HostConcurrencyLimiter:
+    """Caps how many fetches may hit the same host at once across worker threads."""
+
+    def __init__(self, max_per_host: int = 2) -> None:
+        if max_per_host < 1:
+            raise ValueError("max_per_host must be >= 1")
+        self.max_per_host = max_per_host
+        self._lock = threading.Lock()
+        self._semaphores: dict[str, threading.BoundedSemaphore] = {}
+
+    def _semaphore(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            semaphore = self._semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.max_per_host)
+                self._semaphores[host] = semaphore
+            return semaphore
+
+    @contextmanager
+    def slot(self, url: str) -> Iterator[None]:
+        semaphore = self._semaphore(host_of(url))
+        with semaphore:
+            yield
+
+
+@dataclass(frozen=True)
+class RatePolicy:
+    """Token-bucket settings for one host. ``None`` rate means no token limit."""
+
+    requests_per_second: float | None = None
+    burst: int = 1
+    min_interval_seconds: float = 0.0
+
+    @property
+    def unlimited(self) -> bool:
+        return self.requests_per_second is None and self.min_interval_seconds <= 0
+
+    def is_stricter_than(self, other: RatePolicy) -> bool:
+        own_rate = self.requests_per_second or float("inf")
+        other_rate = other.requests_per_second or float("inf")
+        if own_rate != other_rate:
+            return own_rate < other_rate
+        return self.min_interval_seconds > other.min_interval_seconds
+
+
+class _TokenBucket:
+    def __init__(self, policy: RatePolicy, now: float) -> None:
+        self.policy = policy
+        self.tokens = float(max(policy.burst, 1))
+        self.updated = now
+        self.next_allowed = now
+
+    def reserve(self, now: float) -> float:
+        rate = self.policy.requests_per_second
+        capacity = float(max(self.policy.burst, 1))
+        wait = 0.0
+
+        if rate:
+            self.tokens = min(capacity, self.tokens + (now - self.updated) * rate)
+            self.updated = now
+            if self.tokens < 1:
+                wait = (1 - self.tokens) / rate
+            # Tokens may go negative: later callers queue up behind this reservation.
+            self.tokens -= 1
+
+        wait = max(wait, self.next_allowed - now)
+        self.next_allowed = now + wait + self.policy.min_interval_seconds
+        return wait
+
+
+class HostRateLimiter:
+    """Per-host token buckets shared by every fetch path of a crawl.
+
+    Hosts without a configured policy are never delayed, so friendly career pages run
+    at full speed and only the platforms that need it are throttled.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._policies: dict[str, RatePolicy] = {}
+        self._buckets: dict[str, _TokenBucket] = {}
+
+    def configure(self, url: str, policy: RatePolicy) -> None:
+        if policy.unlimited:
+            return
+        host = host_of(url)
+        with self._lock:
+            current = self._policies.get(host)
+            # Several sources may share a host; the strictest policy wins.
+            if current is None or policy.is_stricter_than(current):
+                self._policies[host] = policy
+                self._buckets.pop(host, None)
+
+    def reserve(self, url: str) -> float:
+        """Claim the next request slot for ``url``'s host and return the delay to honour."""
+        host = host_of(url)
+        with self._lock:
+            policy = self._policies.get(host)
+            if policy is None:
+                return 0.0
+            now = self._clock()
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = _TokenBucket(policy, now)
+                self._buckets[host] = bucket
+            return bucket.reserve(now)
+
+    def wait(self, url: str) -> float:
+        delay = self.reserve(url)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+
+def build_rate_limiter(sources: list[SourceConfig]) -> HostRateLimiter:
+    limiter = HostRateLimiter()
+    for source in sources:
+        policy = RatePolicy(**source.rate_limit.model_dump())
+        for url in source.entry_urls:
+            limiter.configure(url, policy)
+    return limiter
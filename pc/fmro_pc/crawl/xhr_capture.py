@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from fmro_pc.crawl.fetcher import CapturedResponse
+
+CAPTURED_RESOURCE_TYPES = {"xhr", "fetch"}
+
+
+class ResponseCapture:
+    """Records JSON bodies of XHR/fetch responses whose URL contains one of the patterns.
+
+    Installed once per Playwright page; call ``reset`` before each navigation.
+    """
+
+    def __init__(self) -> None:
+        self.patterns: tuple[str, ...] = ()
+        self.page_url = ""
+        self.responses: list[CapturedResponse] = []
+
+    def install(self, page) -> None:
+        page.on("response", self._on_response)
+
+    def reset(self, page_url: str, patterns: tuple[str, ...] = ()) -> None:
+        self.page_url = page_url
+        self.patterns = tuple(patterns)
+        self.responses = []
+
+    def take(self) -> list[CapturedResponse]:
+        responses, self.responses = self.responses, []
+        return responses
+
+    def _on_response(self, response) -> None:
+        if not self.patterns or response.request.resource_type not in CAPTURED_RESOURCE_TYPES:
+            return
+        if not any(pattern in response.url for pattern in self.patterns):
+            return
+        if response.status >= 400:
+            return
+        try:
+            payload = response.json()
+        except Exception:  # noqa: BLE001
+            # Not JSON, or the body was already discarded by a navigation.
+            return
+        self.responses.append(
+            CapturedResponse(url=response.url, page_url=self.page_url, payload=payload)
+        )
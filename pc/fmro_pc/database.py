@@ -4,6 +4,7 @@ from contextlib import contextmanager
 from functools import lru_cache
 from pathlib import Path
 
+from sqlalchemy import inspect, text
 from sqlmodel import Session, SQLModel, create_engine
 
 DEFAULT_DB_NAME = "fmro_pc.db"
@@ -32,6 +33,22 @@ def init_db(path: str | Path | None = None) -> None:
 
     engine = get_engine(path)
     SQLModel.metadata.create_all(engine)
+    _add_missing_columns(engine)
+
+
+def _add_missing_columns(engine) -> None:
+    """create_all never alters existing tables; add nullable columns added since."""
+    inspector = inspect(engine)
+    with engine.begin() as conn:
+        for table in SQLModel.metadata.sorted_tables:
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing or not column.nullable:
+                    continue
+                column_type = column.type.compile(dialect=engine.dialect)
+                conn.execute(
+                    text(f'ALTER TABLE "{table.name}" ADD COLUMN "{column.name}" {column_type}')
+                )
 
 
 @contextmanager
@@ -39,3 +56,21 @@ def session_scope(path: str | Path | None = None):
     engine = get_engine(path)
     with Session(engine) as session:
         yield session
+
+
+@contextmanager
+def read_only_session(path: str | Path | None = None):
+    """Session on an existing database, opened read-only: no file creation, no migrations.
+
+    Yields ``None`` when the database file does not exist yet.
+    """
+    db_path = resolve_db_path(path)
+    if not db_path.is_file():
+        yield None
+        return
+    engine = create_engine(f"sqlite:///file:{db_path.resolve()}?mode=ro&uri=true")
+    try:
+        with Session(engine) as session:
+            yield session
+    finally:
+        engine.dispose()
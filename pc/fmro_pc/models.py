@@ -44,3 +44,66 @@ class JobPosting(SQLModel, table=True):
     last_seen_at: datetime = Field(default_factory=utcnow, index=True)
     created_at: datetime = Field(default_factory=utcnow)
     updated_at: datetime = Field(default_factory=utcnow, index=True)
+
+
+class EngineStat(SQLModel, table=True):
+    """Per source/host outcome counters for each fetch engine."""
+
+    __tablename__ = "engine_stats"
+    __table_args__ = (
+        UniqueConstraint("source_key", "host", "engine", name="uq_engine_stats_source_host"),
+    )
+
+    id: int | None = Field(default=None, primary_key=True)
+
+    source_key: str = Field(index=True)
+    host: str
+    engine: str
+
+    attempts: int = 0
+    successes: int = 0
+    failures: int = 0
+    blocks: int = 0
+    consecutive_failures: int = 0
+    total_latency_ms: float = 0.0
+
+    last_success_at: datetime | None = None
+    last_used_at: datetime | None = None
+    updated_at: datetime = Field(default_factory=utcnow)
+
+
+class PageCacheEntry(SQLModel, table=True):
+    """HTTP validators and extracted fingerprints for one entry URL."""
+
+    __tablename__ = "page_cache"
+    __table_args__ = (UniqueConstraint("url", name="uq_page_cache_url"),)
+
+    id: int | None = Field(default=None, primary_key=True)
+
+    url: str = Field(index=True)
+    source_key: str = Field(index=True)
+    etag: str | None = None
+    last_modified: str | None = None
+    content_hash: str | None = None
+    config_digest: str | None = None
+    fingerprints: str = "[]"
+
+    updated_at: datetime = Field(default_factory=utcnow)
+
+
+class SourceCooldown(SQLModel, table=True):
+    """Circuit-breaker state per source/host after repeated anti-bot blocks."""
+
+    __tablename__ = "source_cooldowns"
+    __table_args__ = (UniqueConstraint("source_key", "host", name="uq_source_cooldowns_host"),)
+
+    id: int | None = Field(default=None, primary_key=True)
+
+    source_key: str = Field(index=True)
+    host: str
+    trips: int = 0
+    open_until: datetime | None = None
+    last_reason: str | None = None
+    last_tripped_at: datetime | None = None
+
+    updated_at: datetime = Field(default_factory=utcnow)
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import re
 from html import unescape
 
-CITIES = ["北京", "上海", "深圳", "杭州", "广州", "成都", "苏州", "南京", "武汉", "西安"]
+from fmro_pc.parsers.gazetteer import find_city
 
 BAD_TITLE_TOKENS = [
     "登录",
@@ -51,33 +52,38 @@ def clean_text(value: str | None) -> str:
 
 
 def infer_city(text: str | None) -> str | None:
-    target = clean_text(text)
-    for city in CITIES:
-        if city in target:
-            return city
-    return None
+    return find_city(clean_text(text))
 
 
-def _has_private_use_chars(text: str) -> bool:
-    return any("\ue000" <= ch <= "\uf8ff" for ch in text)
+def _alternation(tokens: list[str]) -> str:
+    return "|".join(re.escape(token) for token in sorted(set(tokens), key=len, reverse=True))
 
 
-def looks_like_job_title(text: str | None) -> bool:
-    title = clean_text(text)
-    if len(title) < 4 or len(title) > 80:
-        return False
+# Built once at import: one regex scan per (lower-cased) title instead of a substring
+# test per token, so the token lists can keep growing.
+_REJECT_RE = re.compile(f"[\ue000-\uf8ff□�]|&#|{_alternation(BAD_TITLE_TOKENS)}")
+_HINT_RE = re.compile(_alternation(JOB_HINT_TOKENS))
 
-    if _has_private_use_chars(title):
-        return False
 
-    if "□" in title or "�" in title:
+def _classify(title: str) -> bool:
+    if len(title) < 4 or len(title) > 80:
         return False
-
     lower = title.lower()
-    if any(token in lower for token in BAD_TITLE_TOKENS):
-        return False
+    return _REJECT_RE.search(lower) is None and _HINT_RE.search(lower) is not None
 
-    if "&#" in title:
-        return False
 
-    return any(token in lower for token in JOB_HINT_TOKENS)
+def looks_like_job_title(text: str | None) -> bool:
+    return _classify(clean_text(text))
+
+
+def classify_titles(titles: list[str | None]) -> list[bool]:
+    """``looks_like_job_title`` for all candidates of a page; repeated titles are checked once."""
+    verdicts: dict[str, bool] = {}
+    results: list[bool] = []
+    for text in titles:
+        title = clean_text(text)
+        verdict = verdicts.get(title)
+        if verdict is None:
+            verdict = verdicts[title] = _classify(title)
+        results.append(verdict)
+    return results
@@ -20,6 +20,8 @@ class ParsedJob:
     salary_text: str | None = None
     description_text: str | None = None
     tags: list[str] = field(default_factory=list)
+    # Set by parsers of multi-company listings; defaults to the source's company.
+    company_name: str | None = None
 
 
 class Parser(Protocol):
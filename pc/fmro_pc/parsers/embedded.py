@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import json
+import re
+from collections.abc import Iterator
+from typing import Any
+from urllib.parse import urljoin
+
+from fmro_pc.config import SourceConfig
+from fmro_pc.parsers._common import clean_text, infer_city, looks_like_job_title
+from fmro_pc.parsers.base import ParsedJob
+from fmro_pc.parsers.json_api import parse_api_datetime
+
+# Cheap substring checks before any regex runs; most pages have none of these.
+_MARKERS = ("ld+json", "__NEXT_DATA__", "__INITIAL_STATE__")
+_BLOB_START = re.compile(
+    r"""<script\b[^>]*?(?:type\s*=\s*["']?application/ld\+json|id\s*=\s*["']?__NEXT_DATA__)"""
+    r"""[^>]*>|window\.__INITIAL_STATE__\s*=\s*""",
+    re.IGNORECASE,
+)
+_TAGS = re.compile(r"<[^>]+>")
+_DECODER = json.JSONDecoder()
+
+# Keys job records use in SSR state blobs (first match wins). JSON-LD uses the same names
+# as the first entries, so one mapping covers both.
+TITLE_KEYS = ("title", "jobName", "jobTitle", "positionName", "job_name", "postName")
+LINK_KEYS = ("url", "link", "jobUrl", "applyUrl", "detailUrl", "positionUrl", "jobLink", "href")
+POSTED_KEYS = ("datePosted", "publishTime", "postedAt", "refreshTime", "publishDate", "createTime")
+DEADLINE_KEYS = ("validThrough", "deadline", "endTime", "endtime", "expireTime")
+SALARY_KEYS = ("baseSalary", "salary", "salaryDesc", "salaryText", "salary_text")
+LOCATION_KEYS = ("jobLocation", "city", "cityName", "workCity", "location", "dq")
+COMPANY_KEYS = ("hiringOrganization", "companyName", "compName", "brandName", "company_name")
+EMPLOYMENT_KEYS = ("employmentType", "jobType")
+
+
+def iter_embedded_json(html: str) -> Iterator[tuple[str, Any]]:
+    """``(kind, payload)`` for every JSON-LD, ``__NEXT_DATA__`` and ``__INITIAL_STATE__`` blob.
+
+    Works on the raw HTML without building a tree; blobs that are not valid JSON are skipped.
+    """
+    if not any(marker in html for marker in _MARKERS):
+        return
+    for match in _BLOB_START.finditer(html):
+        start = match.end()
+        if match.group().startswith("window."):
+            payload = _decode_state(html, start)
+            if payload is not None:
+                yield "initial_state", payload
+            continue
+        end = html.find("</script", start)
+        if end < 0:
+            continue
+        try:
+            payload = json.loads(html[start:end])
+        except ValueError:
+            continue
+        kind = "next_data" if "__NEXT_DATA__" in match.group() else "json_ld"
+        yield kind, payload
+
+
+def _decode_state(html: str, start: int) -> Any:
+    try:
+        if html.startswith("JSON.parse(", start):
+            # window.__INITIAL_STATE__ = JSON.parse("...") embeds the JSON as a string literal.
+            text, _ = _DECODER.raw_decode(html, start + len("JSON.parse("))
+            return json.loads(text) if isinstance(text, str) else None
+        payload, _ = _DECODER.raw_decode(html, start)
+    except ValueError:
+        return None
+    return payload
+
+
+def _first(record: dict[str, Any], keys: tuple[str, ...]) -> Any:
+    for key in keys:
+        value = record.get(key)
+        if value not in (None, "", [], {}):
+            return value
+    return None
+
+
+def _name(value: Any) -> str:
+    """Text of a string, an ``{"name": ...}`` object or the first usable list item."""
+    if isinstance(value, list):
+        return next((text for item in value if (text := _name(item))), "")
+    if isinstance(value, dict):
+        value = value.get("name")
+    return clean_text(str(value)) if value not in (None, "") else ""
+
+
+def _place(value: Any) -> str:
+    """City-ish text of a location string or a schema.org Place / PostalAddress."""
+    if isinstance(value, list):
+        return next((text for item in value if (text := _place(item))), "")
+    if isinstance(value, dict):
+        address = value.get("address")
+        if address:
+            return _place(address)
+        return _name(value.get("addressLocality") or value.get("addressRegion") or value)
+    return _name(value)
+
+
+def _number(value: Any) -> str:
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return clean_text(str(value))
+
+
+def _salary(value: Any) -> str | None:
+    if not isinstance(value, dict):
+        return _name(value) or None
+    # schema.org MonetaryAmount: {"currency", "value": QuantitativeValue | number}
+    amount = value.get("value")
+    unit = ""
+    if isinstance(amount, dict):
+        unit = clean_text(str(amount.get("unitText") or ""))
+        low, high = amount.get("minValue"), amount.get("maxValue")
+        amount = f"{_number(low)}-{_number(high)}" if low and high else amount.get("value")
+    if amount in (None, ""):
+        return None
+    text = " ".join(part for part in (_number(amount), value.get("currency") or "") if part)
+    return f"{text}/{unit}" if unit else text
+
+
+def _is_job_posting(record: dict[str, Any]) -> bool:
+    kind = record.get("@type")
+    kinds = kind if isinstance(kind, list) else [kind]
+    return "JobPosting" in kinds
+
+
+def _job_from_record(
+    record: dict[str, Any], page_url: str, source: SourceConfig, *, json_ld: bool
+) -> ParsedJob | None:
+    title = _first(record, TITLE_KEYS) or (record.get("name") if json_ld else None)
+    title = clean_text(title) if isinstance(title, str) else ""
+    if not title:
+        return None
+    link = _first(record, LINK_KEYS)
+    location = _place(_first(record, LOCATION_KEYS))
+    posted = _first(record, POSTED_KEYS)
+    deadline = _first(record, DEADLINE_KEYS)
+    salary = _first(record, SALARY_KEYS)
+    if not json_ld and (
+        not isinstance(link, str) or not (salary or location or looks_like_job_title(title))
+    ):
+        # SSR state is full of {title, url, date} menus and news items; a job record also
+        # has a salary, a place or a job-like title.
+        return None
+
+    description = record.get("description")
+    # The source's company_name stays authoritative (it is part of the fingerprint); the
+    # hiring organization only goes into the description text.
+    company = _name(_first(record, COMPANY_KEYS))
+    description = clean_text(_TAGS.sub(" ", description)) if isinstance(description, str) else ""
+    description_text = " ".join(part for part in (company, description) if part)
+    return ParsedJob(
+        title=title,
+        apply_url=urljoin(page_url, link) if isinstance(link, str) else page_url,
+        source_url=page_url,
+        location=infer_city(location) or location or None,
+        employment_type=_name(_first(record, EMPLOYMENT_KEYS)) or None,
+        posted_at=parse_api_datetime(posted),
+        deadline_at=parse_api_datetime(deadline),
+        salary_text=_salary(salary),
+        description_text=description_text or None,
+        tags=[source.platform],
+    )
+
+
+def parse_embedded_jobs(html: str, page_url: str, source: SourceConfig) -> list[ParsedJob]:
+    """Jobs from the page's structured-data blobs, or ``[]`` so the caller parses the DOM."""
+    jobs: list[ParsedJob] = []
+    seen: set[tuple[str, str]] = set()
+    for kind, payload in iter_embedded_json(html):
+        json_ld = kind == "json_ld"
+        stack = [payload]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, list):
+                stack.extend(reversed(node))
+                continue
+            if not isinstance(node, dict):
+                continue
+            if not json_ld or _is_job_posting(node):
+                job = _job_from_record(node, page_url, source, json_ld=json_ld)
+                if job is not None:
+                    key = (job.title, job.apply_url)
+                    if key not in seen:
+                        seen.add(key)
+                        jobs.append(job)
+                    # A job's nested objects are its own attributes, not more jobs.
+                    continue
+            stack.extend(reversed(list(node.values())))
+    return jobs
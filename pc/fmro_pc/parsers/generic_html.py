@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-from urllib.parse import urljoin
-
 from fmro_pc.config import SourceConfig
 from fmro_pc.crawl.fetcher import FetchedPage
 from fmro_pc.parsers.base import ParsedJob
@@ -14,22 +12,21 @@ class GenericHtmlParser:
         jobs: list[ParsedJob] = []
         seen: set[tuple[str, str]] = set()
 
-        for anchor in page.soup.find_all("a", href=True):
-            title = " ".join(anchor.get_text(" ", strip=True).split())
+        for anchor in page.anchors:
+            title = anchor.text
             if len(title) < 3:
                 continue
 
-            href = anchor["href"].strip()
-            if href.startswith("javascript:"):
+            if anchor.href.startswith("javascript:"):
                 continue
 
-            apply_url = urljoin(page.url, href)
+            apply_url = anchor.url
             key = (title.lower(), apply_url)
             if key in seen:
                 continue
             seen.add(key)
 
-            container_text = " ".join(anchor.parent.get_text(" ", strip=True).split())
+            container_text = anchor.parent_text
             jobs.append(
                 ParsedJob(
                     title=title,
@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+from urllib.parse import urljoin
+
+from fmro_pc.config import SourceConfig
+from fmro_pc.crawl.fetcher import CapturedResponse
+from fmro_pc.parsers._common import clean_text, infer_city
+from fmro_pc.parsers.base import ParsedJob
+
+_COMPACT_DATETIME = re.compile(r"^\d{8}(\d{6})?$")
+
+
+def parse_api_datetime(value: Any) -> datetime | None:
+    """Parse the date formats job APIs use: epoch s/ms, ``YYYYMMDD[HHMMSS]`` or ISO.
+
+    Values that look like dates but are not valid ones give ``None``.
+    """
+    if value in (None, "", 0):
+        return None
+    if isinstance(value, int | float) or (isinstance(value, str) and value.isdigit()):
+        text = str(value)
+        try:
+            if _COMPACT_DATETIME.match(text) and text.startswith(("19", "20")):
+                layout = "%Y%m%d%H%M%S" if len(text) == 14 else "%Y%m%d"
+                return datetime.strptime(text, layout).replace(tzinfo=UTC)
+            number = float(value)
+            if number > 1e12:
+                number /= 1000
+            return datetime.fromtimestamp(number, tz=UTC)
+        except (ValueError, OverflowError, OSError):
+            # "20261399", epochs out of the platform's range, NaN ...
+            return None
+    if isinstance(value, str):
+        try:
+            parsed = datetime.fromisoformat(value.strip().replace("/", "-"))
+        except ValueError:
+            return None
+        return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+    return None
+
+
+def _dig(payload: Any, *path: str) -> Any:
+    for key in path:
+        if not isinstance(payload, dict):
+            return None
+        payload = payload.get(key)
+    return payload
+
+
+def _as_list(value: Any) -> list[Any]:
+    return value if isinstance(value, list) else []
+
+
+def _join(*values: Any) -> str | None:
+    parts = [clean_text(str(value)) for value in values if value not in (None, "")]
+    return " ".join(part for part in parts if part) or None
+
+
+def _labels(*values: Any) -> list[str]:
+    tags: list[str] = []
+    for value in values:
+        for item in value if isinstance(value, list) else [value]:
+            text = clean_text(str(item)) if item not in (None, "") else ""
+            if text:
+                tags.append(text)
+    return tags
+
+
+@dataclass(frozen=True)
+class JsonListParser:
+    """Turns captured job-list API payloads of one platform into ``ParsedJob`` items."""
+
+    url_patterns: tuple[str, ...]
+    parse_payload: Callable[[Any, str, SourceConfig], list[ParsedJob]]
+
+    def matches(self, url: str) -> bool:
+        return any(pattern in url for pattern in self.url_patterns)
+
+    def parse(self, responses: Iterable[CapturedResponse], source: SourceConfig) -> list[ParsedJob]:
+        jobs: list[ParsedJob] = []
+        seen: set[str] = set()
+        for response in responses:
+            if not self.matches(response.url):
+                continue
+            for job in self.parse_payload(response.payload, response.page_url, source):
+                if job.apply_url in seen:
+                    continue
+                seen.add(job.apply_url)
+                jobs.append(job)
+        return jobs
+
+
+def _parse_boss(payload: Any, page_url: str, source: SourceConfig) -> list[ParsedJob]:
+    jobs: list[ParsedJob] = []
+    for item in _as_list(_dig(payload, "zpData", "jobList")):
+        if not isinstance(item, dict):
+            continue
+        title = clean_text(item.get("jobName"))
+        job_id = item.get("encryptJobId")
+        if not title or not job_id:
+            continue
+        location = _join(
+            item.get("cityName"), item.get("areaDistrict"), item.get("businessDistrict")
+        )
+        jobs.append(
+            ParsedJob(
+                title=title,
+                apply_url=urljoin("https://www.zhipin.com/", f"/job_detail/{job_id}.html"),
+                source_url=page_url,
+                location=location or infer_city(item.get("cityName")),
+                salary_text=clean_text(item.get("salaryDesc")) or None,
+                description_text=_join(
+                    item.get("brandName"),
+                    item.get("jobExperience"),
+                    item.get("jobDegree"),
+                    " ".join(_labels(item.get("skills"))),
+                ),
+                tags=[source.platform, *_labels(item.get("jobLabels"))],
+            )
+        )
+    return jobs
+
+
+def _parse_liepin(payload: Any, page_url: str, source: SourceConfig) -> list[ParsedJob]:
+    jobs: list[ParsedJob] = []
+    cards = _dig(payload, "data", "data", "jobCardList") or _dig(payload, "data", "jobCardList")
+    for card in _as_list(cards):
+        job = _dig(card, "job")
+        comp = _dig(card, "comp")
+        if not isinstance(job, dict):
+            continue
+        if not isinstance(comp, dict):
+            comp = {}
+        title = clean_text(job.get("title"))
+        link = job.get("link")
+        if not title or not link:
+            continue
+        jobs.append(
+            ParsedJob(
+                title=title,
+                apply_url=urljoin("https://www.liepin.com/", link),
+                source_url=page_url,
+                location=clean_text(job.get("dq")) or None,
+                posted_at=parse_api_datetime(job.get("refreshTime")),
+                salary_text=clean_text(job.get("salary")) or None,
+                description_text=_join(
+                    comp.get("compName"),
+                    job.get("requireWorkYears"),
+                    job.get("requireEduLevel"),
+                ),
+                tags=[source.platform, *_labels(job.get("labels"))],
+            )
+        )
+    return jobs
+
+
+def _shixiseng_salary(item: dict[str, Any]) -> str | None:
+    low, high = item.get("minsal"), item.get("maxsal")
+    if low and high:
+        return f"{low}-{high}/天"
+    return clean_text(item.get("salary")) or None
+
+
+def _parse_shixiseng(payload: Any, page_url: str, source: SourceConfig) -> list[ParsedJob]:
+    items = _dig(payload, "msg", "data") or _dig(payload, "msg") or _dig(payload, "data")
+    jobs: list[ParsedJob] = []
+    for item in _as_list(items):
+        if not isinstance(item, dict):
+            continue
+        title = clean_text(item.get("name") or item.get("job_name"))
+        uuid = item.get("uuid")
+        if not title or not uuid:
+            continue
+        jobs.append(
+            ParsedJob(
+                title=title,
+                apply_url=urljoin("https://www.shixiseng.com/", f"/intern/{uuid}"),
+                source_url=page_url,
+                location=clean_text(item.get("city")) or None,
+                employment_type="intern",
+                posted_at=parse_api_datetime(item.get("refresh_time") or item.get("update_time")),
+                deadline_at=parse_api_datetime(item.get("endtime") or item.get("deadline")),
+                salary_text=_shixiseng_salary(item),
+                description_text=_join(
+                    item.get("company_name") or item.get("cname"),
+                    item.get("day") and f"{item['day']}天/周",
+                    item.get("month") and f"{item['month']}个月",
+                ),
+                tags=[source.platform, *_labels(item.get("industry"))],
+            )
+        )
+    return jobs
+
+
+JSON_PARSERS: dict[str, JsonListParser] = {
+    "boss_zhipin": JsonListParser(("/wapi/zpgeek/search/joblist",), _parse_boss),
+    "liepin": JsonListParser(("pc-search-job", "/api/com.liepin.searchfront4c"), _parse_liepin),
+    "shixiseng": JsonListParser(("/interns/", "/intern/search"), _parse_shixiseng),
+}
+
+
+def capture_patterns(parser: str) -> tuple[str, ...]:
+    json_parser = JSON_PARSERS.get(parser)
+    return json_parser.url_patterns if json_parser else ()
+
+
+def parse_captured_json(
+    responses: Iterable[CapturedResponse], source: SourceConfig
+) -> list[ParsedJob]:
+    """Jobs from captured API responses, or ``[]`` so the caller falls back to the DOM."""
+    json_parser = JSON_PARSERS.get(source.parser)
+    if json_parser is None:
+        return []
+    return json_parser.parse(responses, source)
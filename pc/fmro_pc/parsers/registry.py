@@ -4,6 +4,7 @@ from fmro_pc.parsers.base import Parser
 from fmro_pc.parsers.boss_zhipin import BossZhipinParser
 from fmro_pc.parsers.generic_html import GenericHtmlParser
 from fmro_pc.parsers.liepin import LiepinParser
+from fmro_pc.parsers.selector import SelectorParser
 from fmro_pc.parsers.shixiseng import ShiXiSengParser
 
 PARSER_REGISTRY: dict[str, Parser] = {
@@ -11,6 +12,7 @@ PARSER_REGISTRY: dict[str, Parser] = {
     "boss_zhipin": BossZhipinParser(),
     "liepin": LiepinParser(),
     "shixiseng": ShiXiSengParser(),
+    "selectors": SelectorParser(),
 }
 
 
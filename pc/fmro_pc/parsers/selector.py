@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from urllib.parse import urljoin
+
+import soupsieve
+from bs4.element import Tag
+from soupsieve import SoupSieve
+
+from fmro_pc.config import SelectorConfig, SourceConfig
+from fmro_pc.crawl.fetcher import FetchedPage
+from fmro_pc.parsers._common import clean_text, infer_city
+from fmro_pc.parsers.base import ParsedJob
+
+
+@dataclass(frozen=True)
+class CompiledSelectors:
+    card: SoupSieve
+    title: SoupSieve | None
+    link: SoupSieve | None
+    company: SoupSieve | None
+    location: SoupSieve | None
+    salary: SoupSieve | None
+    next_page: SoupSieve | None
+
+
+def _compile(selector: str | None) -> SoupSieve | None:
+    return soupsieve.compile(selector) if selector else None
+
+
+@lru_cache(maxsize=256)
+def compile_selectors(config: SelectorConfig) -> CompiledSelectors:
+    """Compiled once per distinct selectors block and reused for every page of the run."""
+    return CompiledSelectors(
+        card=soupsieve.compile(config.card),
+        title=_compile(config.title),
+        link=_compile(config.link),
+        company=_compile(config.company),
+        location=_compile(config.location),
+        salary=_compile(config.salary),
+        next_page=_compile(config.next_page),
+    )
+
+
+def _text(card: Tag, selector: SoupSieve | None) -> str:
+    if selector is None:
+        return ""
+    node = selector.select_one(card)
+    return clean_text(node.get_text(" ", strip=True)) if node is not None else ""
+
+
+def _anchor(node: Tag | None) -> Tag | None:
+    """``node`` itself if it is a followable link, else its first ``<a href>``."""
+    if node is not None and node.name != "a":
+        node = node.find("a", href=True)
+    if node is None:
+        return None
+    href = node.get("href")
+    if not isinstance(href, str) or not href.strip() or href.startswith("javascript:"):
+        return None
+    return node
+
+
+def next_page_url(page: FetchedPage, config: SelectorConfig) -> str | None:
+    """The resolved ``next_page`` link of ``page``, or ``None`` on the last page."""
+    selector = compile_selectors(config).next_page
+    if selector is None:
+        return None
+    anchor = _anchor(selector.select_one(page.soup))
+    if anchor is None:
+        return None
+    url = urljoin(page.url, anchor["href"].strip())
+    return url if url != page.url else None
+
+
+class SelectorParser:
+    """Extracts one job per ``selectors.card`` match; the rest of the page is ignored."""
+
+    def parse(self, page: FetchedPage, source: SourceConfig) -> list[ParsedJob]:
+        if source.selectors is None:
+            raise ValueError(f"source '{source.key}' has no selectors block")
+        compiled = compile_selectors(source.selectors)
+        jobs: list[ParsedJob] = []
+        seen: set[str] = set()
+
+        for card in compiled.card.select(page.soup):
+            anchor = _anchor(compiled.link.select_one(card) if compiled.link else card)
+            if anchor is None:
+                continue
+
+            title = (
+                _text(card, compiled.title)
+                or clean_text(anchor.get("title"))
+                or clean_text(anchor.get_text(" ", strip=True))
+            )
+            if not title:
+                continue
+
+            apply_url = urljoin(page.url, anchor["href"].strip())
+            if apply_url in seen:
+                continue
+            seen.add(apply_url)
+
+            location_text = _text(card, compiled.location)
+            jobs.append(
+                ParsedJob(
+                    title=title,
+                    apply_url=apply_url,
+                    source_url=page.url,
+                    location=infer_city(location_text) or location_text or None,
+                    salary_text=_text(card, compiled.salary) or None,
+                    description_text=clean_text(card.get_text(" ", strip=True)) or None,
+                    tags=[source.platform],
+                    company_name=_text(card, compiled.company) or None,
+                )
+            )
+
+        return jobs
@@ -1,12 +1,9 @@
 from __future__ import annotations
 
-from urllib.parse import urljoin
-
-from bs4.element import Tag
-
 from fmro_pc.config import SourceConfig
+from fmro_pc.crawl.anchors import AnchorRecord
 from fmro_pc.crawl.fetcher import FetchedPage
-from fmro_pc.parsers._common import clean_text, infer_city, looks_like_job_title
+from fmro_pc.parsers._common import classify_titles, clean_text, infer_city
 from fmro_pc.parsers.base import ParsedJob
 
 
@@ -15,24 +12,24 @@ class ShiXiSengParser:
         jobs: list[ParsedJob] = []
         seen: set[str] = set()
 
-        for anchor in page.soup.find_all("a", href=True):
-            href = anchor.get("href", "").strip()
-            if not href:
-                continue
+        candidates: list[tuple[AnchorRecord, str | None]] = []
+        for anchor in page.anchors:
+            href = anchor.href
             if "/intern/" not in href and "shixiseng.com/intern/" not in href:
                 continue
+            candidates.append((anchor, self._pick_title(anchor)))
 
-            title = self._pick_title(anchor)
-            if not looks_like_job_title(title):
+        titles = [title for _, title in candidates]
+        for (anchor, title), is_job in zip(candidates, classify_titles(titles), strict=True):
+            if not is_job:
                 continue
 
-            apply_url = urljoin(page.url, href)
+            apply_url = anchor.url
             if apply_url in seen:
                 continue
             seen.add(apply_url)
 
-            parent_text = anchor.parent.get_text(" ", strip=True) if anchor.parent else ""
-            container_text = clean_text(parent_text)
+            container_text = clean_text(anchor.parent_text)
             location = self._pick_location(anchor)
             jobs.append(
                 ParsedJob(
@@ -48,25 +45,24 @@ class ShiXiSengParser:
 
         return jobs
 
-    def _pick_title(self, anchor: Tag) -> str | None:
+    def _pick_title(self, anchor: AnchorRecord) -> str | None:
         candidates = [
-            clean_text(anchor.get("title")),
-            clean_text(anchor.get("aria-label")),
-            clean_text(anchor.get("data-title")),
-            clean_text(anchor.get("data-name")),
+            clean_text(anchor.attr("title")),
+            clean_text(anchor.attr("aria-label")),
+            clean_text(anchor.attr("data-title")),
+            clean_text(anchor.attr("data-name")),
         ]
 
         for value in candidates:
             if value and not self._has_bad_chars(value):
                 return value
 
-        return clean_text(anchor.get_text(" ", strip=True))
+        return clean_text(anchor.text)
 
     def _has_bad_chars(self, value: str) -> bool:
         return any("\ue000" <= ch <= "\uf8ff" for ch in value) or "�" in value or "□" in value
 
-    def _pick_location(self, anchor: Tag) -> str | None:
-        parent = anchor.parent
-        if parent is None:
-            return None
-        return infer_city(parent.get_text(" ", strip=True))
+    def _pick_location(self, anchor: AnchorRecord) -> str | None:
+        # Cards often keep the city in a sibling block of the title link's wrapper, so the
+        # whole card is searched when the link's parent names no city.
+        return infer_city(anchor.parent_text) or infer_city(anchor.card_text)
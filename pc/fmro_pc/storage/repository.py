@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import csv
+import json
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
@@ -9,8 +10,12 @@ from typing import Literal
 from sqlalchemy import or_
 from sqlmodel import Session, select
 
+from fmro_pc.crawl.circuit_breaker import BreakerRecord
+from fmro_pc.crawl.engine_memory import EngineRecord
 from fmro_pc.crawl.normalize import NormalizedJob
-from fmro_pc.models import JobPosting
+from fmro_pc.crawl.page_cache import CachedPage
+from fmro_pc.crawl.profile import CrawlProfile
+from fmro_pc.models import EngineStat, JobPosting, PageCacheEntry, SourceCooldown
 
 
 def utcnow() -> datetime:
@@ -23,6 +28,7 @@ class UpsertStats:
     updated: int = 0
     deactivated: int = 0
     duplicates_skipped: int = 0
+    refreshed: int = 0
 
 
 JobSortField = Literal["posted_at", "updated_at"]
@@ -35,10 +41,42 @@ def upsert_jobs(
     *,
     source_key: str,
     seen_at: datetime | None = None,
+    carried_fingerprints: set[str] | None = None,
+    profile: CrawlProfile | None = None,
 ) -> UpsertStats:
+    """Insert/update ``jobs`` and deactivate the source's jobs that were not seen.
+
+    ``carried_fingerprints`` are jobs from pages that did not change since the last run
+    (e.g. HTTP 304): they only get ``last_seen_at`` refreshed (and are reactivated if a
+    failed run deactivated them).
+    """
     timestamp = seen_at or utcnow()
     stats = UpsertStats()
+    profile = profile or CrawlProfile()
+
+    with profile.stage("upsert"):
+        fingerprints = _write_jobs(session, jobs, timestamp=timestamp, stats=stats)
+    with profile.stage("deactivate"):
+        _deactivate_unseen(
+            session,
+            source_key=source_key,
+            seen_fingerprints=set(fingerprints),
+            carried_fingerprints=carried_fingerprints or set(),
+            timestamp=timestamp,
+            stats=stats,
+        )
+    with profile.stage("commit"):
+        session.commit()
+    return stats
 
+
+def _write_jobs(
+    session: Session,
+    jobs: list[NormalizedJob],
+    *,
+    timestamp: datetime,
+    stats: UpsertStats,
+) -> list[str]:
     unique_jobs: dict[str, NormalizedJob] = {}
     for job in jobs:
         if job.fingerprint in unique_jobs:
@@ -89,24 +127,183 @@ def upsert_jobs(
         )
         stats.inserted += 1
 
-    active_rows = session.exec(
+    return fingerprints
+
+
+def _deactivate_unseen(
+    session: Session,
+    *,
+    source_key: str,
+    seen_fingerprints: set[str],
+    carried_fingerprints: set[str],
+    timestamp: datetime,
+    stats: UpsertStats,
+) -> None:
+    carried = carried_fingerprints - seen_fingerprints
+    # Carried rows may have been deactivated by an earlier run whose fetch failed; the
+    # unchanged page still lists them, so they are reactivated along with the refresh.
+    rows = session.exec(
         select(JobPosting).where(
             JobPosting.source_company_key == source_key,
-            JobPosting.is_active.is_(True),
+            or_(JobPosting.is_active.is_(True), JobPosting.fingerprint.in_(carried)),
         )
     ).all()
 
-    seen_fingerprints = set(fingerprints)
-    for row in active_rows:
+    for row in rows:
         if row.fingerprint in seen_fingerprints:
             continue
+        if row.fingerprint in carried:
+            if not row.is_active:
+                row.is_active = True
+                row.updated_at = timestamp
+            row.last_seen_at = timestamp
+            session.add(row)
+            stats.refreshed += 1
+            continue
         row.is_active = False
         row.updated_at = timestamp
         session.add(row)
         stats.deactivated += 1
 
+
+def _as_utc(value: datetime | None) -> datetime | None:
+    # SQLite drops tzinfo on the way back; everything we store is UTC.
+    if value is None or value.tzinfo is not None:
+        return value
+    return value.replace(tzinfo=UTC)
+
+
+_ENGINE_COUNTERS = (
+    "attempts",
+    "successes",
+    "failures",
+    "blocks",
+    "consecutive_failures",
+    "total_latency_ms",
+)
+
+
+def load_engine_records(session: Session) -> list[EngineRecord]:
+    rows = session.exec(select(EngineStat)).all()
+    return [
+        EngineRecord(
+            source_key=row.source_key,
+            host=row.host,
+            engine=row.engine,
+            **{name: getattr(row, name) for name in _ENGINE_COUNTERS},
+            last_success_at=_as_utc(row.last_success_at),
+            last_used_at=_as_utc(row.last_used_at),
+        )
+        for row in rows
+    ]
+
+
+def save_engine_records(session: Session, records: list[EngineRecord]) -> None:
+    if not records:
+        return
+
+    rows = session.exec(select(EngineStat)).all()
+    existing = {(row.source_key, row.host, row.engine): row for row in rows}
+    timestamp = utcnow()
+    for record in records:
+        key = (record.source_key, record.host, record.engine)
+        row = existing.get(key)
+        if row is None:
+            row = EngineStat(source_key=record.source_key, host=record.host, engine=record.engine)
+        for name in _ENGINE_COUNTERS:
+            setattr(row, name, getattr(record, name))
+        row.last_success_at = record.last_success_at
+        row.last_used_at = record.last_used_at
+        row.updated_at = timestamp
+        session.add(row)
+
+    session.commit()
+
+
+def load_breaker_records(session: Session) -> list[BreakerRecord]:
+    rows = session.exec(select(SourceCooldown)).all()
+    return [
+        BreakerRecord(
+            source_key=row.source_key,
+            host=row.host,
+            trips=row.trips,
+            open_until=_as_utc(row.open_until),
+            last_reason=row.last_reason,
+            last_tripped_at=_as_utc(row.last_tripped_at),
+        )
+        for row in rows
+    ]
+
+
+def save_breaker_records(session: Session, records: list[BreakerRecord]) -> None:
+    if not records:
+        return
+
+    rows = session.exec(select(SourceCooldown)).all()
+    existing = {(row.source_key, row.host): row for row in rows}
+    timestamp = utcnow()
+    for record in records:
+        row = existing.get((record.source_key, record.host))
+        if row is None:
+            row = SourceCooldown(source_key=record.source_key, host=record.host)
+        row.trips = record.trips
+        row.open_until = record.open_until
+        row.last_reason = record.last_reason
+        row.last_tripped_at = record.last_tripped_at
+        row.updated_at = timestamp
+        session.add(row)
+
+    session.commit()
+
+
+def load_cached_pages(
+    session: Session, urls: list[str], source_keys: list[str] | None = None
+) -> dict[str, CachedPage]:
+    """Cache entries for ``urls``, plus every page cached for ``source_keys``."""
+    if not urls and not source_keys:
+        return {}
+    rows = session.exec(
+        select(PageCacheEntry).where(
+            or_(
+                PageCacheEntry.url.in_(urls),
+                PageCacheEntry.source_key.in_(source_keys or []),
+            )
+        )
+    ).all()
+    return {
+        row.url: CachedPage(
+            url=row.url,
+            source_key=row.source_key,
+            etag=row.etag,
+            last_modified=row.last_modified,
+            content_hash=row.content_hash,
+            fingerprints=json.loads(row.fingerprints or "[]"),
+            config_digest=row.config_digest,
+        )
+        for row in rows
+    }
+
+
+def save_cached_pages(session: Session, pages: list[CachedPage]) -> None:
+    if not pages:
+        return
+
+    urls = [page.url for page in pages]
+    rows = session.exec(select(PageCacheEntry).where(PageCacheEntry.url.in_(urls))).all()
+    existing = {row.url: row for row in rows}
+    timestamp = utcnow()
+    for page in pages:
+        row = existing.get(page.url) or PageCacheEntry(url=page.url, source_key=page.source_key)
+        row.source_key = page.source_key
+        row.etag = page.etag
+        row.last_modified = page.last_modified
+        row.content_hash = page.content_hash
+        row.config_digest = page.config_digest
+        row.fingerprints = json.dumps(sorted(set(page.fingerprints)))
+        row.updated_at = timestamp
+        session.add(row)
+
     session.commit()
-    return stats
 
 
 def list_jobs(
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+@dataclass
+class LocalSite:
+    """Tiny in-process HTTP server used to exercise the crawl runner offline."""
+
+    base_url: str
+    # Text is served as UTF-8; bytes are served as they are.
+    pages: dict[str, str | bytes] = field(default_factory=dict)
+    etags: dict[str, str] = field(default_factory=dict)
+    content_types: dict[str, str] = field(default_factory=dict)
+    # Error statuses served (one per hit, in order) before the page itself.
+    errors: dict[str, list[int]] = field(default_factory=dict)
+    hits: list[str] = field(default_factory=list)
+    not_modified_hits: list[str] = field(default_factory=list)
+
+    def url(self, path: str) -> str:
+        return f"{self.base_url}{path}"
+
+
+@pytest.fixture
+def local_site() -> Iterator[LocalSite]:
+    site = LocalSite(base_url="")
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802
+            site.hits.append(self.path)
+            if site.errors.get(self.path):
+                self.send_response(site.errors[self.path].pop(0))
+                self.send_header("Retry-After", "0")
+                self.end_headers()
+                return
+            html = site.pages.get(self.path)
+            if html is None:
+                self.send_response(404)
+                self.end_headers()
+                return
+            etag = site.etags.get(self.path)
+            if etag and self.headers.get("If-None-Match") == etag:
+                site.not_modified_hits.append(self.path)
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+            body = html if isinstance(html, bytes) else html.encode("utf-8")
+            self.send_response(200)
+            content_type = site.content_types.get(self.path, "text/html; charset=utf-8")
+            self.send_header("Content-Type", content_type)
+            if etag:
+                self.send_header("ETag", etag)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args) -> None:  # noqa: A002
+            return
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    site.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield site
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+import threading
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from fmro_pc.config import ResourcePolicyConfig
+from fmro_pc.crawl.browser import (
+    RSS_CHECK_EVERY,
+    PlaywrightFetcher,
+    playwright_driver_pids,
+    process_tree_rss_mb,
+)
+from fmro_pc.crawl.resource_policy import TYPICAL_RESOURCE_BYTES, ResourcePolicy
+
+SUBRESOURCES = [
+    ("https://cdn.example.com/logo.png", "image"),
+    ("https://hm.baidu.com/hm.js", "script"),
+    ("https://example.com/app.js", "script"),
+]
+
+
+class _FakeRoute:
+    def __init__(self, url: str, resource_type: str) -> None:
+        self.request = types.SimpleNamespace(url=url, resource_type=resource_type)
+        self.outcome: str | None = None
+
+    def abort(self, error_code: str = "failed") -> None:
+        self.outcome = "abort"
+
+    def continue_(self) -> None:
+        self.outcome = "continue"
+
+
+BOSS_API_URL = "https://www.zhipin.com/wapi/zpgeek/search/joblist.json?query=slam"
+
+
+class _FakeResponse:
+    def __init__(self, url: str, resource_type: str, payload) -> None:
+        self.url = url
+        self.status = 200
+        self.request = types.SimpleNamespace(resource_type=resource_type)
+        self._payload = payload
+
+    def json(self):
+        if self._payload is None:
+            raise ValueError("not json")
+        return self._payload
+
+
+class _FakePage:
+    def __init__(self, context: _FakeContext) -> None:
+        self.context = context
+        self.url = ""
+        self.headers: dict[str, str] = {}
+        self.listeners: dict[str, list] = {}
+
+    def set_extra_http_headers(self, headers: dict[str, str]) -> None:
+        self.headers = headers
+
+    def goto(self, url: str, **kwargs):
+        self.url = url
+        for resource_url, resource_type in SUBRESOURCES:
+            route = _FakeRoute(resource_url, resource_type)
+            for handler in self.context.handlers:
+                handler(route)
+        for handler in self.listeners.get("response", []):
+            handler(_FakeResponse(BOSS_API_URL, "xhr", {"zpData": {"jobList": []}}))
+            handler(_FakeResponse("https://example.com/app.js", "script", None))
+        return types.SimpleNamespace(status=200)
+
+    def on(self, event: str, handler) -> None:
+        self.listeners.setdefault(event, []).append(handler)
+
+    def evaluate(self, script: str, arg=None) -> int:
+        return 0
+
+    def content(self) -> str:
+        return f"<html><body>{self.url} {self.headers.get('Cookie', '')}</body></html>"
+
+
+class _FakeContext:
+    def __init__(self, browser: _FakeBrowser) -> None:
+        self.browser = browser
+        self.closed = False
+        self.handlers = []
+
+    def route(self, pattern: str, handler) -> None:
+        self.handlers.append(handler)
+
+    def new_page(self) -> _FakePage:
+        return _FakePage(self)
+
+    def close(self) -> None:
+        self.closed = True
+        self.browser.stats["contexts_closed"] += 1
+
+
+class _FakeBrowser:
+    def __init__(self, stats: dict[str, int]) -> None:
+        self.stats = stats
+
+    def is_connected(self) -> bool:
+        return True
+
+    def new_context(self) -> _FakeContext:
+        self.stats["contexts"] += 1
+        return _FakeContext(self)
+
+    def close(self) -> None:
+        self.stats["closed"] += 1
+
+
+@pytest.fixture
+def fake_playwright(monkeypatch):
+    stats = {"launches": 0, "contexts": 0, "contexts_closed": 0, "closed": 0, "threads": set()}
+
+    class _Chromium:
+        def launch(self, **kwargs) -> _FakeBrowser:
+            stats["launches"] += 1
+            stats["threads"].add(threading.current_thread().name)
+            return _FakeBrowser(stats)
+
+    class _Manager:
+        def __enter__(self):
+            return types.SimpleNamespace(chromium=_Chromium())
+
+        def __exit__(self, *exc) -> None:
+            return None
+
+    sync_api = types.ModuleType("playwright.sync_api")
+    sync_api.sync_playwright = _Manager
+    package = types.ModuleType("playwright")
+    package.sync_api = sync_api
+    monkeypatch.setitem(sys.modules, "playwright", package)
+    monkeypatch.setitem(sys.modules, "playwright.sync_api", sync_api)
+    return stats
+
+
+def test_browser_is_launched_once_and_contexts_recycled(fake_playwright) -> None:
+    with PlaywrightFetcher(max_scroll_rounds=0, pages_per_context=3, max_rss_mb=None) as fetcher:
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            pages = list(
+                pool.map(
+                    lambda index: fetcher.fetch(f"https://example.com/{index}"),
+                    range(7),
+                )
+            )
+
+    assert [page.url for page in pages] == [f"https://example.com/{index}" for index in range(7)]
+    assert all(page.dynamic for page in pages)
+    assert fake_playwright["launches"] == 1
+    assert fake_playwright["threads"] == {"fmro-browser-0"}
+    assert fake_playwright["contexts"] == 3
+    assert fake_playwright["closed"] == 1
+
+
+def test_each_source_gets_its_own_context(fake_playwright) -> None:
+    with PlaywrightFetcher(max_scroll_rounds=0, max_rss_mb=None) as fetcher:
+        first = fetcher.fetch("https://a.example/1", session_key="acme")
+        again = fetcher.fetch("https://a.example/2", session_key="acme")
+        other = fetcher.fetch("https://b.example/1", session_key="beta")
+        back = fetcher.fetch("https://a.example/3", session_key="acme")
+
+    assert [page.url for page in (first, again, other, back)] == [
+        "https://a.example/1",
+        "https://a.example/2",
+        "https://b.example/1",
+        "https://a.example/3",
+    ]
+    # acme's two pages share a context; beta, and acme after it, start from a clean one.
+    assert fake_playwright["contexts"] == 3
+    # The last one goes down with the browser.
+    assert fake_playwright["contexts_closed"] == 2
+
+
+def test_headers_are_applied_per_fetch(fake_playwright) -> None:
+    with PlaywrightFetcher(max_scroll_rounds=0) as fetcher:
+        first = fetcher.fetch("https://example.com/a", headers={"Cookie": "a=1"})
+        second = fetcher.fetch("https://example.com/b")
+
+    assert "a=1" in first.html
+    assert "a=1" not in second.html
+
+
+def test_process_tree_rss_counts_child_processes() -> None:
+    if process_tree_rss_mb() is None:
+        pytest.skip("/proc is not available")
+    child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(5)"])
+    try:
+        assert process_tree_rss_mb() > 0
+    finally:
+        child.kill()
+        child.wait()
+
+
+def test_resource_policy_blocks_types_domains_and_patterns() -> None:
+    policy = ResourcePolicy.from_config(
+        ResourcePolicyConfig(
+            block_resource_types=["image", "font"],
+            block_domains=["baidu.com"],
+            block_url_patterns=[r"/track\b"],
+        )
+    )
+
+    assert policy.should_block("https://cdn.example.com/a.png", "image")
+    assert policy.should_block("https://hm.baidu.com/hm.js", "script")
+    assert policy.should_block("https://example.com/track?id=1", "xhr")
+    assert not policy.should_block("https://example.com/app.js", "script")
+    assert not policy.should_block("https://notbaidu.com/x.js", "script")
+    assert not policy.should_block("https://cdn.example.com/page", "document")
+
+
+def test_pooled_fetch_reports_blocked_requests(fake_playwright) -> None:
+    policy = ResourcePolicy.from_config(ResourcePolicyConfig(block_domains=["baidu.com"]))
+    with PlaywrightFetcher(max_scroll_rounds=0) as fetcher:
+        page = fetcher.fetch("https://example.com/jobs", resource_policy=policy)
+        unfiltered = fetcher.fetch("https://example.com/jobs")
+
+    assert page.requests_blocked == 2
+    assert page.bytes_saved == TYPICAL_RESOURCE_BYTES["image"] + TYPICAL_RESOURCE_BYTES["script"]
+    assert unfiltered.requests_blocked == 0
+
+
+def test_pooled_fetch_captures_matching_api_json(fake_playwright) -> None:
+    with PlaywrightFetcher(max_scroll_rounds=0) as fetcher:
+        page = fetcher.fetch(
+            "https://www.zhipin.com/web/geek/job?query=slam",
+            capture_url_patterns=("/wapi/zpgeek/search/joblist",),
+        )
+        plain = fetcher.fetch("https://www.zhipin.com/web/geek/job?query=slam")
+
+    assert [item.url for item in page.captured_json] == [BOSS_API_URL]
+    assert page.captured_json[0].page_url == "https://www.zhipin.com/web/geek/job?query=slam"
+    assert plain.captured_json == []
+
+
+def test_relaunch_budget_counts_only_the_workers_own_browser() -> None:
+    if process_tree_rss_mb() is None:
+        pytest.skip("/proc is not available")
+    sleep = "import time; time.sleep(5)"
+    # A fake driver with a "browser" child, and an idle one that started nothing.
+    busy = subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            f"import subprocess, sys; subprocess.run([sys.executable, '-c', {sleep!r}])",
+            "run-driver",
+        ]
+    )
+    idle = subprocess.Popen([sys.executable, "-c", sleep, "run-driver"])
+    fetcher = PlaywrightFetcher(max_rss_mb=1)
+    try:
+        for _ in range(50):
+            if process_tree_rss_mb(busy.pid):
+                break
+            time.sleep(0.05)
+
+        assert {busy.pid, idle.pid} <= playwright_driver_pids()
+        assert fetcher._should_relaunch(RSS_CHECK_EVERY, {busy.pid})
+        assert not fetcher._should_relaunch(RSS_CHECK_EVERY, {idle.pid})
+        assert not fetcher._should_relaunch(RSS_CHECK_EVERY, set())
+    finally:
+        for child in (busy, idle):
+            child.kill()
+            child.wait()
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from fmro_pc.crawl.charset import CharsetDetector, charset_from_content_type, charset_from_meta
+
+GBK_PAGE = "<html><head><meta charset='gbk'></head><body>机器人实习生 北京</body></html>"
+# An undeclared GBK page whose first 20 KB are an ASCII inline script.
+SCRIPT_HEAD_GBK_PAGE = (
+    "<html><head><script>" + "var x = 1;" * 2048 + "</script></head>"
+    "<body>机器人实习生 北京</body></html>"
+).encode("gbk")
+
+
+def test_header_and_meta_charsets_are_normalized() -> None:
+    assert charset_from_content_type("text/html; charset=UTF-8") == "utf-8"
+    assert charset_from_content_type('text/html; charset="GB2312"') == "gb18030"
+    assert charset_from_content_type("text/html") is None
+    assert charset_from_meta(GBK_PAGE.encode("gbk")) == "gb18030"
+    assert charset_from_meta(b'<meta http-equiv="Content-Type" content="text/html; charset=big5">')
+    assert charset_from_meta(b"<meta charset='no-such-codec'>") is None
+
+
+def test_detect_prefers_declarations_and_skips_wrong_ones() -> None:
+    detector = CharsetDetector()
+    body = GBK_PAGE.encode("gbk")
+
+    # The header lies (utf-8); the prefix check rejects it and the meta tag wins.
+    assert detector.detect(body, host="a.example", content_type="text/html; charset=utf-8") == (
+        "gb18030"
+    )
+    assert detector.decode(body, host="a.example").count("机器人实习生") == 1
+
+
+def test_detect_uses_host_cache_before_trial_decoding() -> None:
+    detector = CharsetDetector()
+    big5 = "<html><body>機器人工程師</body></html>".encode("big5")
+
+    assert detector.detect(big5, host="tw.example", content_type="text/html; charset=big5") == (
+        "big5"
+    )
+    assert detector.cached("tw.example") == "big5"
+    # Later undeclared pages from the host reuse it ahead of the gb18030 trial decode.
+    assert detector.detect(big5, host="tw.example") == "big5"
+    assert detector.detect("<p>机器人</p>".encode(), host="cn.example") == "utf-8"
+
+
+def test_trial_decode_tolerates_a_character_cut_at_the_prefix_end() -> None:
+    detector = CharsetDetector()
+    body = ("<p>" + "机" * 10_000 + "</p>").encode()
+
+    assert detector.detect(body, host="long.example") == "utf-8"
+
+
+def test_ascii_head_does_not_decide_the_encoding() -> None:
+    detector = CharsetDetector()
+
+    assert detector.detect(SCRIPT_HEAD_GBK_PAGE, host="gbk.example") == "gb18030"
+    assert "机器人实习生" in detector.decode(SCRIPT_HEAD_GBK_PAGE, host="gbk.example")
+    assert detector.cached("gbk.example") == "gb18030"
+
+    # A guess from an all-ASCII body is not remembered for the host.
+    assert detector.detect(b"<html><body>ok</body></html>", host="ascii.example") == "utf-8"
+    assert detector.cached("ascii.example") is None
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+from fmro_pc.crawl.circuit_breaker import (
+    BASE_COOLDOWN,
+    MAX_COOLDOWN,
+    CircuitBreaker,
+    cooldown_for,
+)
+
+
+def test_breaker_trips_after_consecutive_blocks_only() -> None:
+    breaker = CircuitBreaker(trip_after=3)
+
+    assert breaker.record_block("liepin", "www.liepin.com", "HTTP 403") is None
+    assert breaker.record_block("liepin", "www.liepin.com", "HTTP 403") is None
+    breaker.record_success("liepin", "www.liepin.com")
+    assert breaker.record_block("liepin", "www.liepin.com", "captcha page") is None
+    assert breaker.record_block("liepin", "www.liepin.com", "captcha page") is None
+    record = breaker.record_block("liepin", "www.liepin.com", "captcha page")
+
+    assert record is not None and record.trips == 1
+    assert breaker.open_record("liepin", "www.liepin.com") is record
+    assert breaker.open_record("liepin", "other.example") is None
+    assert breaker.changed_records() == [record]
+
+
+def test_cooldown_doubles_per_trip_and_is_capped() -> None:
+    assert cooldown_for(1) == BASE_COOLDOWN
+    assert cooldown_for(3) == BASE_COOLDOWN * 4
+    assert cooldown_for(50) == MAX_COOLDOWN
+
+
+def test_success_after_cooldown_resets_backoff() -> None:
+    breaker = CircuitBreaker(trip_after=1)
+    record = breaker.record_block("boss", "www.zhipin.com", "HTTP 429")
+    assert record is not None
+    record.open_until -= timedelta(days=3)
+    assert breaker.record_block("boss", "www.zhipin.com", "HTTP 429").trips == 2
+
+    record.open_until -= timedelta(days=3)
+    breaker.record_success("boss", "www.zhipin.com")
+    assert (record.trips, record.open_until) == (0, None)
@@ -0,0 +1,44 @@
+from fmro_pc.crawl.content_hash import page_content_hash
+
+PAGE = """
+<html><head>
+<meta name="csrf-token" content="{token}">
+<script>window.__ts = {ts};</script>
+</head><body>
+<input type="hidden" name="_csrf" value="{token}">
+<p>Updated at 2026-10-{day}T08:00:00Z</p>
+<link rel="stylesheet" href="/app.css?t={ts}">
+<ul><li><a href="/job/1">{title}</a></li></ul>
+</body></html>
+"""
+
+
+def test_hash_ignores_scripts_tokens_and_timestamps() -> None:
+    first = PAGE.format(token="abc", ts=1760000000, day="16", title="Robotics Intern")
+    second = PAGE.format(token="xyz", ts=1760086400, day="17", title="Robotics Intern")
+
+    assert page_content_hash(first) == page_content_hash(second)
+
+
+def test_hash_changes_when_listing_changes() -> None:
+    first = PAGE.format(token="abc", ts=1, day="16", title="Robotics Intern")
+    second = PAGE.format(token="abc", ts=1, day="16", title="SLAM Engineer")
+
+    assert page_content_hash(first) != page_content_hash(second)
+
+
+def test_hash_keeps_embedded_job_data() -> None:
+    shell = '<html><body><div id="app"></div><script type="application/ld+json">{}</script>'
+    first = shell.format('{"@type": "JobPosting", "title": "Robotics Intern"}')
+    second = shell.format('{"@type": "JobPosting", "title": "SLAM Engineer"}')
+
+    assert page_content_hash(first) != page_content_hash(second)
+
+
+def test_hash_keeps_job_ids_that_look_like_epochs() -> None:
+    first = PAGE.format(token="abc", ts=1, day="16", title="Robotics Intern").replace(
+        "/job/1", "/job/1960000001.shtml"
+    )
+    second = first.replace("/job/1960000001.shtml", "/job/1960000002.shtml")
+
+    assert page_content_hash(first) != page_content_hash(second)
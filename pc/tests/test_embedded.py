@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime
+
+from fmro_pc.config import SourceConfig
+from fmro_pc.parsers.embedded import iter_embedded_json, parse_embedded_jobs
+
+PAGE_URL = "https://careers.example.com/jobs"
+
+
+def _source() -> SourceConfig:
+    return SourceConfig(
+        key="acme",
+        company_name="ACME",
+        platform="career_page",
+        entry_urls=[PAGE_URL],
+    )
+
+
+def test_json_ld_job_postings() -> None:
+    posting = {
+        "@context": "https://schema.org",
+        "@graph": [
+            {"@type": "WebPage", "name": "Careers"},
+            {
+                "@type": "JobPosting",
+                "title": "机器人运动控制工程师",
+                "url": "/jobs/42",
+                "datePosted": "2026-09-01",
+                "validThrough": "2026-12-31T23:59:59+08:00",
+                "employmentType": ["FULL_TIME"],
+                "hiringOrganization": {"@type": "Organization", "name": "星海机器人"},
+                "jobLocation": {
+                    "@type": "Place",
+                    "address": {"@type": "PostalAddress", "addressLocality": "上海市浦东新区"},
+                },
+                "baseSalary": {
+                    "@type": "MonetaryAmount",
+                    "currency": "CNY",
+                    "value": {"minValue": 30000.0, "maxValue": 50000, "unitText": "MONTH"},
+                },
+                "description": "<p>负责 <b>SLAM</b> 算法</p>",
+            },
+        ],
+    }
+    html = (
+        "<html><head><script type='application/ld+json'>"
+        f"{json.dumps(posting, ensure_ascii=False)}</script>"
+        "<script type=application/ld+json>{broken</script></head><body></body></html>"
+    )
+
+    (job,) = parse_embedded_jobs(html, PAGE_URL, _source())
+
+    assert job.title == "机器人运动控制工程师"
+    assert job.apply_url == "https://careers.example.com/jobs/42"
+    assert job.location == "上海"
+    assert job.company_name is None
+    assert job.employment_type == "FULL_TIME"
+    assert job.posted_at == datetime(2026, 9, 1, tzinfo=UTC)
+    assert job.deadline_at is not None and job.deadline_at.year == 2026
+    assert job.salary_text == "30000-50000 CNY/MONTH"
+    assert job.description_text == "星海机器人 负责 SLAM 算法"
+
+
+def test_ssr_state_blobs_need_a_job_attribute() -> None:
+    next_data = {
+        "props": {
+            "pageProps": {
+                "menu": [{"title": "关于我们", "url": "/about"}],
+                "news": [{"title": "年度发布会回顾", "url": "/news/1", "publishTime": 1767225600}],
+                "jobs": [
+                    {
+                        "jobName": "SLAM 算法实习生",
+                        "jobUrl": "/jobs/7",
+                        "cityName": "深圳",
+                        "salaryDesc": "300/天",
+                        "publishTime": 1767225600000,
+                        "company": {"title": "nested", "url": "/c/1", "city": "北京"},
+                    }
+                ],
+            }
+        }
+    }
+    state = {"list": [{"title": "感知算法工程师", "link": "/jobs/8", "endTime": "20261130"}]}
+    html = (
+        f'<script id="__NEXT_DATA__" type="application/json">{json.dumps(next_data)}</script>'
+        f"<script>window.__INITIAL_STATE__ = JSON.parse({json.dumps(json.dumps(state))});"
+        "</script>"
+    )
+
+    assert [kind for kind, _ in iter_embedded_json(html)] == ["next_data", "initial_state"]
+    jobs = parse_embedded_jobs(html, PAGE_URL, _source())
+
+    assert [(job.title, job.apply_url) for job in jobs] == [
+        ("SLAM 算法实习生", "https://careers.example.com/jobs/7"),
+        ("感知算法工程师", "https://careers.example.com/jobs/8"),
+    ]
+    assert jobs[0].location == "深圳"
+    assert jobs[0].salary_text == "300/天"
+    assert jobs[0].posted_at == datetime(2026, 1, 1, tzinfo=UTC)
+    assert jobs[1].deadline_at == datetime(2026, 11, 30, tzinfo=UTC)
+
+
+def test_pages_without_blobs_fall_back_to_the_dom() -> None:
+    html = "<script>window.__INITIAL_STATE__ = {menu: undefined};</script><a href='/x'>x</a>"
+
+    assert parse_embedded_jobs(html, PAGE_URL, _source()) == []
+    assert parse_embedded_jobs("<html></html>", PAGE_URL, _source()) == []
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from fmro_pc.crawl.engine_memory import DEMOTE_AFTER_FAILURES, EngineSelector
+from fmro_pc.database import init_db, session_scope
+from fmro_pc.storage.repository import load_engine_records, save_engine_records
+
+CHAIN = ["dynamic", "scrapling", "static"]
+
+
+def test_last_working_fallback_goes_first_after_the_configured_engine() -> None:
+    selector = EngineSelector()
+    assert selector.order("acme", "acme.com", CHAIN) == CHAIN
+
+    selector.record_success("acme", "acme.com", "static", latency_ms=120)
+
+    assert selector.order("acme", "acme.com", CHAIN) == ["dynamic", "static", "scrapling"]
+    assert selector.order("acme", "acme.com", ["scrapling", "static"]) == ["scrapling", "static"]
+    assert selector.order("other", "acme.com", CHAIN) == CHAIN
+
+
+def test_one_failure_does_not_displace_the_configured_engine() -> None:
+    selector = EngineSelector()
+    selector.record_failure("acme", "acme.com", "dynamic")
+    selector.record_success("acme", "acme.com", "scrapling")
+
+    assert selector.order("acme", "acme.com", CHAIN) == CHAIN
+
+
+def test_repeatedly_failing_engine_is_demoted() -> None:
+    selector = EngineSelector()
+    for _ in range(DEMOTE_AFTER_FAILURES):
+        selector.record_failure("acme", "acme.com", "dynamic")
+
+    assert selector.order("acme", "acme.com", CHAIN) == ["scrapling", "static", "dynamic"]
+
+    selector.record_success("acme", "acme.com", "dynamic")
+    assert selector.order("acme", "acme.com", CHAIN)[0] == "dynamic"
+
+
+def test_engine_records_round_trip_through_db(tmp_path: Path) -> None:
+    db_path = tmp_path / "engines.db"
+    init_db(db_path)
+
+    selector = EngineSelector()
+    selector.record_success("acme", "acme.com", "static", latency_ms=100)
+    selector.record_block("acme", "acme.com", "static")
+    for _ in range(DEMOTE_AFTER_FAILURES):
+        selector.record_failure("acme", "acme.com", "scrapling")
+
+    with session_scope(db_path) as session:
+        save_engine_records(session, selector.changed_records())
+        save_engine_records(session, selector.changed_records())
+        records = load_engine_records(session)
+
+    by_engine = {record.engine: record for record in records}
+    assert set(by_engine) == {"static", "scrapling"}
+    assert by_engine["static"].attempts == 2
+    assert by_engine["static"].block_rate == 0.5
+    assert by_engine["static"].avg_latency_ms == 100
+
+    restored = EngineSelector(records)
+    assert restored.order("acme", "acme.com", ["scrapling", "static"]) == ["static", "scrapling"]
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from fmro_pc.crawl.fetcher import (
+    FetchedPage,
+    ScraplingFetcher,
+    StaticFetcher,
+    UnsupportedPageError,
+    resolve_soup_backend,
+)
+
+
+def test_scrapling_fetcher_reuses_one_session_per_host_and_thread(local_site) -> None:
+    local_site.pages["/a"] = "<html><body><a href='/jobs/1'>Robotics Intern</a></body></html>"
+    local_site.pages["/b"] = "<html><body>b</body></html>"
+
+    with ScraplingFetcher() as fetcher:
+        first = fetcher.fetch(local_site.url("/a"))
+        second = fetcher.fetch(local_site.url("/b"))
+        session = fetcher._session(local_site.url("/a"))
+
+        other: list[object] = []
+        worker = threading.Thread(
+            target=lambda: other.append(fetcher._session(local_site.url("/a")))
+        )
+        worker.start()
+        worker.join()
+
+        assert first.status_code == 200
+        assert "Robotics Intern" in first.html
+        assert second.html.startswith("<html>")
+        assert fetcher._session(local_site.url("/b")) is session
+        assert other[0] is not session
+        assert len(fetcher._managers) == 2
+
+    assert fetcher._managers == []
+
+
+def test_static_fetcher_streams_and_decodes_long_pages(local_site) -> None:
+    rows = "".join(f"<li><a href='/jobs/{n}'>机器人实习生 {n}</a></li>" for n in range(2000))
+    local_site.pages["/list"] = f"<html><body><ul>{rows}</ul></body></html>"
+
+    with StaticFetcher() as fetcher:
+        page = fetcher.fetch(local_site.url("/list"), max_bytes=1_000_000)
+
+    assert page.encoding == "utf-8"
+    assert "机器人实习生 1999" in page.html
+    assert "\ufffd" not in page.html
+    assert page.bytes_downloaded == len(page.html.encode())
+
+
+def test_static_fetcher_waits_past_an_ascii_head_before_picking_the_charset(
+    local_site,
+) -> None:
+    head = "<script>" + "var x = 1;" * 2048 + "</script>"
+    local_site.pages["/gbk"] = f"<html><head>{head}</head><body>机器人实习生</body></html>".encode(
+        "gbk"
+    )
+    local_site.content_types["/gbk"] = "text/html"
+
+    with StaticFetcher() as fetcher:
+        page = fetcher.fetch(local_site.url("/gbk"))
+
+    assert page.encoding == "gb18030"
+    assert "机器人实习生" in page.html
+
+
+def test_static_fetcher_rejects_non_html_and_oversized_pages(local_site) -> None:
+    local_site.pages["/brochure.pdf"] = "%PDF-1.7"
+    local_site.content_types["/brochure.pdf"] = "application/pdf"
+    local_site.pages["/huge"] = "<html>" + "x" * 50_000 + "</html>"
+
+    with StaticFetcher() as fetcher:
+        with pytest.raises(UnsupportedPageError, match="application/pdf"):
+            fetcher.fetch(local_site.url("/brochure.pdf"))
+        with pytest.raises(UnsupportedPageError, match="byte cap"):
+            fetcher.fetch(local_site.url("/huge"), max_bytes=10_000)
+        assert fetcher.fetch(local_site.url("/huge")).status_code == 200
+
+
+def test_fetched_page_builds_soup_lazily_and_can_drop_html() -> None:
+    html = "<html><body><a href='/jobs/1'>Robotics Intern</a></body></html>"
+    page = FetchedPage(url="https://example.com/", html=html, status_code=200)
+
+    assert page._soup is None
+    assert page.soup.find("a")["href"] == "/jobs/1"
+    assert page.soup is page.soup
+    assert page.html == html
+
+    lean = FetchedPage(
+        url="https://example.com/",
+        html=html,
+        status_code=200,
+        soup_backend="html.parser",
+        keep_html=False,
+    )
+    assert lean.html == html
+    assert lean.soup.get_text() == "Robotics Intern"
+    assert lean.html == ""
+
+
+def test_resolve_soup_backend() -> None:
+    assert resolve_soup_backend("html.parser") == "html.parser"
+    assert resolve_soup_backend("auto") in {"lxml", "html.parser"}
+    with pytest.raises(ValueError):
+        resolve_soup_backend("html5lib")
+
+
+def test_anchor_index_resolves_urls_and_shares_card_text() -> None:
+    page = FetchedPage(
+        url="https://example.com/list/",
+        html=(
+            "<ul><li class='job-card'><div><a href='/job/1' title=' 算法工程师 '>"
+            "<i></i></a><span>上海</span></div><a href='detail?id=2'>Apply</a></li>"
+            "<a href=' '>empty</a><a>no href</a></ul>"
+        ),
+        status_code=200,
+    )
+
+    anchors = page.anchors
+
+    assert page.anchors is anchors
+    assert [anchor.url for anchor in anchors] == [
+        "https://example.com/job/1",
+        "https://example.com/list/detail?id=2",
+    ]
+    first, second = anchors
+    assert first.attr("title") == "算法工程师"
+    assert first.attr("aria-label") == ""
+    assert first.text == ""
+    assert first.parent_text == "上海"
+    assert first.card_text == second.card_text == second.parent_text == "上海 Apply"
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import sqlite3
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
-from fmro_pc.database import init_db, session_scope
+from fmro_pc.database import init_db, read_only_session, session_scope
 from fmro_pc.models import JobPosting
 from fmro_pc.storage.repository import (
     export_jobs_markdown,
@@ -140,3 +141,37 @@ def test_export_markdown_shape(tmp_path: Path) -> None:
     assert "## ACME - Robotics Intern" in content
     assert "## Beta Labs - Perception Engineer" in content
     assert "- Note: Reach out to recruiter" in content
+
+
+def test_init_db_adds_columns_missing_from_older_databases(tmp_path: Path) -> None:
+    db_path = tmp_path / "old.db"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TABLE page_cache (id INTEGER PRIMARY KEY, url VARCHAR NOT NULL,"
+            " source_key VARCHAR NOT NULL, etag VARCHAR, last_modified VARCHAR,"
+            " fingerprints VARCHAR NOT NULL, updated_at DATETIME NOT NULL)"
+        )
+
+    init_db(db_path)
+
+    with sqlite3.connect(db_path) as conn:
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(page_cache)")}
+    assert "content_hash" in columns
+
+
+def test_read_only_session_never_creates_or_migrates(tmp_path: Path) -> None:
+    missing = tmp_path / "missing.db"
+    with read_only_session(missing) as session:
+        assert session is None
+    assert not missing.exists()
+
+    old_path = tmp_path / "old.db"
+    with sqlite3.connect(old_path) as conn:
+        conn.execute("CREATE TABLE page_cache (id INTEGER PRIMARY KEY, url VARCHAR NOT NULL)")
+    before = old_path.read_bytes()
+
+    with read_only_session(old_path) as session:
+        assert session is not None
+        assert session.connection().exec_driver_sql("SELECT count(*) FROM page_cache").scalar() == 0
+
+    assert old_path.read_bytes() == before
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+from fmro_pc.config import SourceConfig
+from fmro_pc.crawl.fetcher import CapturedResponse
+from fmro_pc.parsers.json_api import parse_api_datetime, parse_captured_json
+
+
+def _source(parser: str) -> SourceConfig:
+    return SourceConfig(
+        key=f"{parser}_search",
+        company_name=parser,
+        platform=parser,
+        parser=parser,
+        entry_urls=["https://example.com/search"],
+    )
+
+
+def _captured(url: str, payload) -> list[CapturedResponse]:
+    return [CapturedResponse(url=url, page_url="https://example.com/search", payload=payload)]
+
+
+def test_boss_job_list_payload() -> None:
+    payload = {
+        "zpData": {
+            "jobList": [
+                {
+                    "jobName": "SLAM算法工程师",
+                    "encryptJobId": "abc123",
+                    "cityName": "上海",
+                    "areaDistrict": "浦东新区",
+                    "salaryDesc": "30-50K·15薪",
+                    "brandName": "星海机器人",
+                    "skills": ["C++", "ROS"],
+                    "jobLabels": ["3-5年", "硕士"],
+                },
+                {"jobName": "", "encryptJobId": "skip"},
+            ]
+        }
+    }
+    jobs = parse_captured_json(
+        _captured("https://www.zhipin.com/wapi/zpgeek/search/joblist.json?page=1", payload),
+        _source("boss_zhipin"),
+    )
+
+    assert len(jobs) == 1
+    job = jobs[0]
+    assert job.apply_url == "https://www.zhipin.com/job_detail/abc123.html"
+    assert job.location == "上海 浦东新区"
+    assert job.salary_text == "30-50K·15薪"
+    assert "ROS" in (job.description_text or "")
+    assert job.tags == ["boss_zhipin", "3-5年", "硕士"]
+
+
+def test_liepin_job_cards_keep_refresh_time_and_salary() -> None:
+    payload = {
+        "data": {
+            "data": {
+                "jobCardList": [
+                    {
+                        "job": {
+                            "title": "机器人运动控制工程师",
+                            "link": "https://www.liepin.com/job/1970001.shtml",
+                            "dq": "深圳-南山区",
+                            "salary": "25-40k·14薪",
+                            "refreshTime": "20260301093000",
+                            "labels": ["五险一金"],
+                        },
+                        "comp": {"compName": "灵犀智能"},
+                    }
+                ]
+            }
+        }
+    }
+    jobs = parse_captured_json(
+        _captured("https://api-c.liepin.com/api/com.liepin.searchfront4c.pc-search-job", payload),
+        _source("liepin"),
+    )
+
+    assert [job.title for job in jobs] == ["机器人运动控制工程师"]
+    assert jobs[0].posted_at == datetime(2026, 3, 1, 9, 30, tzinfo=UTC)
+    assert jobs[0].salary_text == "25-40k·14薪"
+
+
+def test_shixiseng_interns_and_unrelated_responses() -> None:
+    payload = {
+        "msg": {
+            "data": [
+                {
+                    "name": "具身智能算法实习",
+                    "uuid": "inn_x1",
+                    "city": "北京",
+                    "minsal": 200,
+                    "maxsal": 300,
+                    "refresh_time": 1767225600,
+                    "company_name": "云迹科技",
+                }
+            ]
+        }
+    }
+    responses = _captured("https://www.shixiseng.com/app/interns/search/v2", payload)
+    responses += _captured("https://www.shixiseng.com/api/user/info", {"msg": {"data": []}})
+    jobs = parse_captured_json(responses, _source("shixiseng"))
+
+    assert len(jobs) == 1
+    assert jobs[0].apply_url == "https://www.shixiseng.com/intern/inn_x1"
+    assert jobs[0].employment_type == "intern"
+    assert jobs[0].salary_text == "200-300/天"
+    assert jobs[0].posted_at == datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def test_non_object_list_items_are_skipped() -> None:
+    boss = {"zpData": {"jobList": [None, "x", {"jobName": "SLAM算法工程师", "encryptJobId": "a"}]}}
+    liepin = {"data": {"jobCardList": [None, {"job": None}, {"job": {"title": "t", "link": "/j"}}]}}
+    shixiseng = {"msg": {"data": [None, 3]}}
+
+    def parse(url: str, payload, parser: str) -> list:
+        return parse_captured_json(_captured(url, payload), _source(parser))
+
+    assert len(parse("https://www.zhipin.com/wapi/zpgeek/search/joblist", boss, "boss_zhipin")) == 1
+    assert len(parse("https://api-c.liepin.com/pc-search-job", liepin, "liepin")) == 1
+    assert parse("https://www.shixiseng.com/interns/search", shixiseng, "shixiseng") == []
+
+
+def test_unknown_parser_falls_back_to_dom() -> None:
+    assert parse_captured_json(_captured("https://x/api", {"a": 1}), _source("generic_html")) == []
+
+
+def test_parse_api_datetime_formats() -> None:
+    assert parse_api_datetime(1767225600000) == datetime(2026, 1, 1, tzinfo=UTC)
+    assert parse_api_datetime("20260102") == datetime(2026, 1, 2, tzinfo=UTC)
+    assert parse_api_datetime("2026-01-03 08:00:00") == datetime(2026, 1, 3, 8, tzinfo=UTC)
+    assert parse_api_datetime("昨天") is None
+    assert parse_api_datetime(None) is None
+    assert parse_api_datetime("20261399") is None
+    assert parse_api_datetime(10**20) is None
+    assert parse_api_datetime(float("nan")) is None
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from fmro_pc.config import SourceConfig
+from fmro_pc.crawl.fetcher import FetchedPage
+from fmro_pc.parsers import gazetteer
+from fmro_pc.parsers._common import classify_titles, infer_city, looks_like_job_title
+from fmro_pc.parsers.registry import get_parser
+
+TITLES = [
+    "机器人算法工程师",
+    "SLAM Engineer",
+    "LLM Agent 实习生",
+    "登录后查看算法工程师",
+    "App下载",
+    "\ue031\ue032算法工程师",
+    "算法□工程师",
+    "算法&amp;#12345;工程师",
+    "开发",
+    "关于我们 - 了解更多机器人",
+    "Marketing Manager",
+    "",
+    None,
+    "工程师" * 30,
+]
+
+
+def test_classify_titles_matches_single_title_check() -> None:
+    expected = [looks_like_job_title(title) for title in TITLES]
+
+    assert expected == [
+        True, True, True, False, False, False, False, False, False, False, False, False,
+        False, False,
+    ]  # fmt: skip
+    assert classify_titles(TITLES) == expected
+    assert classify_titles(list(reversed(TITLES))) == list(reversed(expected))
+    assert classify_titles([]) == []
+
+
+@pytest.mark.parametrize(
+    ("text", "city"),
+    [
+        ("合肥市 · 蜀山区", "合肥"),
+        ("东莞·松山湖 3-5年", "东莞"),
+        ("北京市", "北京"),
+        ("沪", "上海"),
+        ("海淀区 西二旗", "北京"),
+        ("吉林省长春市", "长春"),
+        ("朝阳区 望京", "北京"),
+        ("鼓楼区 宁波", "宁波"),
+        ("资深机器人工程师", None),
+        ("阿里巴巴", None),
+        (None, None),
+    ],
+)
+def test_infer_city_uses_gazetteer(text: str | None, city: str | None) -> None:
+    assert infer_city(text) == city
+
+
+def test_gazetteer_copy_in_automation_is_identical() -> None:
+    copy = Path(__file__).resolve().parents[2] / "automation/fmro_auto/core/gazetteer.py"
+    if not copy.exists():
+        pytest.skip("automation package not checked out")
+    assert copy.read_text(encoding="utf-8") == Path(gazetteer.__file__).read_text(encoding="utf-8")
+
+
+@pytest.mark.parametrize(
+    ("parser", "href"),
+    [
+        ("boss_zhipin", "/job_detail/abc.html"),
+        ("liepin", "/job/1960000001.shtml"),
+        ("shixiseng", "/intern/inn_x1"),
+    ],
+)
+def test_platform_parsers_take_the_city_from_the_card(parser: str, href: str) -> None:
+    html = (
+        f"<ul><li class='job-card'><div><a href='{href}'>SLAM算法工程师</a></div>"
+        "<div class='info'>深圳 南山区 3-5年</div></li>"
+        f"<li class='job-card'><div><a href='{href}?b'>感知算法工程师</a> 北京</div>"
+        "<div class='info'>上海</div></li></ul>"
+    )
+    page = FetchedPage(url="https://example.com/search", html=html, status_code=200)
+    source = SourceConfig(
+        key=parser, company_name=parser, platform=parser, parser=parser, entry_urls=[page.url]
+    )
+
+    jobs = get_parser(parser).parse(page, source)
+
+    # The card is searched only when the link's own wrapper names no city.
+    assert [job.location for job in jobs] == ["深圳", "北京"]
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from fmro_pc.crawl.pipeline import Stage, run_pipeline
+
+
+def test_pipeline_runs_every_item_through_all_stages() -> None:
+    seen: list[int] = []
+    run_pipeline(
+        range(20),
+        [
+            Stage("double", lambda item: item * 2, workers=3),
+            Stage("split", lambda item: [item, item + 1], workers=2, fan_out=True),
+        ],
+        seen.append,
+        queue_size=2,
+    )
+    assert sorted(seen) == sorted(value for item in range(20) for value in (item * 2, item * 2 + 1))
+
+
+def test_pipeline_bounded_queues_apply_backpressure() -> None:
+    lock = threading.Lock()
+    produced = 0
+    peak_in_flight = 0
+
+    def produce(item: int) -> int:
+        nonlocal produced, peak_in_flight
+        with lock:
+            produced += 1
+            peak_in_flight = max(peak_in_flight, produced - len(consumed))
+        return item
+
+    consumed: list[int] = []
+
+    def slow_sink(item: int) -> None:
+        time.sleep(0.005)
+        consumed.append(item)
+
+    run_pipeline(range(50), [Stage("produce", produce)], slow_sink, queue_size=2)
+
+    assert len(consumed) == 50
+    # Queue (2) + the item being handed over + the one in the sink.
+    assert peak_in_flight <= 4
+
+
+def test_pipeline_reraises_first_stage_error() -> None:
+    def explode(item: int) -> int:
+        if item == 3:
+            raise RuntimeError("boom")
+        return item
+
+    with pytest.raises(RuntimeError, match="boom"):
+        run_pipeline(range(100), [Stage("explode", explode, workers=2)], lambda item: None)
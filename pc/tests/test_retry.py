@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import pytest
+
+from fmro_pc.crawl.fetcher import FetchError, parse_retry_after
+from fmro_pc.crawl.retry import RetryPolicy, RetryStats
+
+
+def _flaky(*outcomes):
+    calls = list(outcomes)
+
+    def fetch():
+        outcome = calls.pop(0)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+    return fetch
+
+
+def test_retries_transient_errors_with_capped_backoff() -> None:
+    sleeps: list[float] = []
+    stats = RetryStats()
+    policy = RetryPolicy(max_attempts=3, base_delay_seconds=2.0, max_delay_seconds=3.0)
+    fetch = _flaky(FetchError("reset"), FetchError("busy", 503), "page")
+
+    assert policy.call(fetch, stats, sleep=sleeps.append) == "page"
+    assert stats.retries == 2
+    assert 0 <= sleeps[0] <= 2.0 and 0 <= sleeps[1] <= 3.0
+    assert stats.extra_seconds >= sum(sleeps)
+
+
+def test_gives_up_on_permanent_errors_and_exhausted_attempts() -> None:
+    policy = RetryPolicy(max_attempts=2, base_delay_seconds=0)
+    stats = RetryStats()
+
+    with pytest.raises(FetchError, match="gone"):
+        policy.call(_flaky(FetchError("gone", 404)), stats, sleep=lambda _: None)
+    with pytest.raises(FetchError, match="second"):
+        policy.call(
+            _flaky(FetchError("first", 502), FetchError("second", 502)),
+            stats,
+            sleep=lambda _: None,
+        )
+    assert stats.retries == 1
+
+
+def test_honors_retry_after_and_counts_a_prior_attempt() -> None:
+    sleeps: list[float] = []
+    policy = RetryPolicy(max_attempts=2, max_delay_seconds=10)
+    throttled = FetchError("slow down", 429, retry_after=7.0)
+
+    assert policy.call(_flaky("page"), RetryStats(), first_error=throttled, sleep=sleeps.append)
+    assert sleeps == [7.0]
+    # Asking for more than max_delay_seconds means we stop rather than sleep.
+    too_long = FetchError("slow down", 429, retry_after=600.0)
+    with pytest.raises(FetchError):
+        policy.call(_flaky("page"), RetryStats(), first_error=too_long, sleep=sleeps.append)
+
+
+def test_parse_retry_after() -> None:
+    now = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+    assert parse_retry_after("120") == 120.0
+    assert parse_retry_after("Thu, 01 Jan 2026 12:00:30 GMT", now=now) == 30.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
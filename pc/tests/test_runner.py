@@ -0,0 +1,393 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from sqlmodel import select
+
+from fmro_pc.config import CompaniesConfig
+from fmro_pc.crawl.runner import run_crawl
+from fmro_pc.database import init_db, session_scope
+from fmro_pc.models import JobPosting
+from fmro_pc.storage.repository import load_breaker_records
+
+
+def _listing(*titles: str) -> str:
+    items = "".join(
+        f'<li><a href="/jobs/{index}">{title}</a> Shanghai</li>'
+        for index, title in enumerate(titles)
+    )
+    return f"<html><body><ul>{items}</ul></body></html>"
+
+
+def _config(site, count: int) -> CompaniesConfig:
+    sources = []
+    for index in range(count):
+        sources.append(
+            {
+                "key": f"acme_{index}",
+                "company_name": f"ACME {index}",
+                "entry_urls": [site.url(f"/careers/{index}")],
+                "mode": "static",
+            }
+        )
+    return CompaniesConfig.model_validate({"sources": sources})
+
+
+def _db_path(tmp_path: Path, name: str) -> Path:
+    db_path = tmp_path / name
+    init_db(db_path)
+    return db_path
+
+
+def test_concurrent_crawl_matches_sequential_summaries(tmp_path: Path, local_site) -> None:
+    for index in range(4):
+        local_site.pages[f"/careers/{index}"] = _listing(
+            f"Robotics Intern {index}", f"SLAM Engineer {index}"
+        )
+    config = _config(local_site, 4)
+
+    results = {}
+    for workers in (1, 4):
+        db_path = _db_path(tmp_path, f"workers-{workers}.db")
+        with session_scope(db_path) as session:
+            summary = run_crawl(
+                session,
+                config,
+                engine="static",
+                workers=workers,
+                max_per_host=2,
+                parse_workers=workers,
+                normalize_workers=workers,
+                queue_size=1,
+            )
+        results[workers] = [
+            (item.source_key, item.pages_fetched, item.jobs_normalized, item.upsert.inserted)
+            for item in summary.sources
+        ]
+
+    assert results[1] == results[4]
+    assert [row[0] for row in results[4]] == ["acme_0", "acme_1", "acme_2", "acme_3"]
+    assert all(row[1:] == (1, 2, 2) for row in results[4])
+
+
+def test_process_parsing_matches_thread_parsing(tmp_path: Path, local_site) -> None:
+    for index in range(3):
+        local_site.pages[f"/careers/{index}"] = _listing(
+            f"Robotics Intern {index}", f"SLAM Engineer {index}", f"Motion Planning {index}"
+        )
+    config = _config(local_site, 3)
+
+    results = {}
+    for processes in (0, 2):
+        db_path = _db_path(tmp_path, f"processes-{processes}.db")
+        with session_scope(db_path) as session:
+            summary = run_crawl(session, config, engine="static", parse_processes=processes)
+        results[processes] = [
+            (item.source_key, item.jobs_extracted, item.jobs_normalized, item.upsert.inserted)
+            for item in summary.sources
+        ]
+
+    assert results[0] == results[2]
+    assert all(row[1:] == (3, 3, 3) for row in results[2])
+
+
+def test_async_engine_fetches_all_entry_urls(tmp_path: Path, local_site) -> None:
+    for index in range(3):
+        local_site.pages[f"/careers/{index}"] = _listing(f"Perception Engineer {index}")
+    config = CompaniesConfig.model_validate(
+        {
+            "sources": [
+                {
+                    "key": "acme",
+                    "company_name": "ACME",
+                    "entry_urls": [local_site.url(f"/careers/{index}") for index in range(4)],
+                    "mode": "static",
+                }
+            ]
+        }
+    )
+
+    with session_scope(_db_path(tmp_path, "async.db")) as session:
+        summary = run_crawl(session, config, engine="async")
+
+    [source_summary] = summary.sources
+    assert source_summary.pages_fetched == 3
+    assert source_summary.upsert.inserted == 3
+    assert source_summary.parse_failures == 1
+    assert any("async fetch failed" in error for error in source_summary.errors)
+
+
+def test_not_modified_pages_keep_jobs_without_reparsing(tmp_path: Path, local_site) -> None:
+    local_site.pages["/careers/0"] = _listing("Robotics Intern", "SLAM Engineer")
+    local_site.etags["/careers/0"] = '"v1"'
+    config = _config(local_site, 1)
+    db_path = _db_path(tmp_path, "etag.db")
+
+    with session_scope(db_path) as session:
+        first = run_crawl(session, config, engine="static").sources[0]
+        second = run_crawl(session, config, engine="static").sources[0]
+
+    assert first.upsert.inserted == 2
+    assert local_site.not_modified_hits == ["/careers/0"]
+    assert second.pages_not_modified == 1
+    assert second.jobs_extracted == 0
+    assert second.upsert.refreshed == 2
+    assert second.upsert.deactivated == 0
+
+
+def test_unchanged_content_reuses_previous_fingerprints(tmp_path: Path, local_site) -> None:
+    local_site.pages["/careers/0"] = _listing("Robotics Intern", "SLAM Engineer")
+    config = _config(local_site, 1)
+    db_path = _db_path(tmp_path, "hash.db")
+
+    with session_scope(db_path) as session:
+        run_crawl(session, config, engine="static")
+        local_site.pages["/careers/0"] += "<script>var nonce = 'changed';</script>"
+        unchanged = run_crawl(session, config, engine="static").sources[0]
+        local_site.pages["/careers/0"] = _listing("Robotics Intern")
+        changed = run_crawl(session, config, engine="static").sources[0]
+
+    assert unchanged.pages_unchanged == 1
+    assert unchanged.jobs_extracted == 0
+    assert unchanged.upsert.refreshed == 2
+    assert unchanged.upsert.deactivated == 0
+    assert changed.pages_unchanged == 0
+    assert changed.upsert.updated == 1
+    assert changed.upsert.deactivated == 1
+
+
+def test_profile_counts_stages_and_bytes(tmp_path: Path, local_site) -> None:
+    local_site.pages["/careers/0"] = _listing("Robotics Intern", "SLAM Engineer")
+    config = _config(local_site, 1)
+
+    with session_scope(_db_path(tmp_path, "profile.db")) as session:
+        summary = run_crawl(session, config, engine="static")
+
+    profile = summary.sources[0].profile
+    for stage in ("fetch:static", "block_check", "parse", "normalize", "filter", "upsert"):
+        assert profile.stages[stage].calls == 1
+        assert profile.stages[stage].wall_seconds >= 0
+    assert profile.bytes_downloaded > 0
+    assert profile.html_bytes == len(local_site.pages["/careers/0"].encode("utf-8"))
+    assert summary.profile.to_dict()["stages"]["deactivate"]["calls"] == 1
+
+
+def test_circuit_breaker_stops_blocked_source_and_persists_cooldown(
+    tmp_path: Path, local_site
+) -> None:
+    urls = []
+    for index in range(6):
+        local_site.pages[f"/search/{index}"] = "<html><body>请完成验证 captcha</body></html>"
+        urls.append(local_site.url(f"/search/{index}"))
+    config = CompaniesConfig.model_validate(
+        {
+            "sources": [
+                {"key": "blocked", "company_name": "Blocked", "entry_urls": urls, "mode": "static"}
+            ]
+        }
+    )
+    db_path = _db_path(tmp_path, "breaker.db")
+
+    with session_scope(db_path) as session:
+        first = run_crawl(session, config, engine="static")
+    assert local_site.hits == ["/search/0", "/search/1", "/search/2"]
+    assert first.sources[0].pages_skipped == 3
+    assert any("circuit breaker opened" in error for error in first.sources[0].errors)
+
+    # The cool-down is persisted, so the next run does not touch the site at all.
+    with session_scope(db_path) as session:
+        second = run_crawl(session, config, engine="static")
+        records = load_breaker_records(session)
+    assert len(local_site.hits) == 3
+    assert second.sources[0].pages_skipped == 6
+    assert [(record.source_key, record.trips) for record in records] == [("blocked", 1)]
+
+
+def test_transient_errors_are_retried_and_reported(tmp_path: Path, local_site) -> None:
+    local_site.pages["/careers/0"] = _listing("Robotics Intern")
+    local_site.errors["/careers/0"] = [503, 429]
+    payload = _config(local_site, 1).model_dump()
+    payload["sources"][0]["retry"] = {"max_attempts": 3, "base_delay_seconds": 0}
+    config = CompaniesConfig.model_validate(payload)
+
+    with session_scope(_db_path(tmp_path, "retry.db")) as session:
+        summary = run_crawl(session, config, engine="static")
+
+    assert local_site.hits == ["/careers/0"] * 3
+    assert summary.total_retries == 2
+    assert summary.total_retry_seconds > 0
+    assert summary.sources[0].jobs_normalized == 1
+    assert summary.sources[0].errors == []
+
+
+def _board(page: int, *titles: str, next_page: str | None = None) -> str:
+    cards = "".join(
+        f'<div class="job"><a href="/jobs/{page}-{index}">{title}</a>'
+        f'<span class="company">Vendor {index}</span></div>'
+        for index, title in enumerate(titles)
+    )
+    pager = f'<a class="next" href="{next_page}">next</a>' if next_page else ""
+    return f"<html><body><a href='/jobs/junk'>Robotics Intern</a>{cards}{pager}</body></html>"
+
+
+def test_selector_source_follows_next_page_up_to_crawl_depth(tmp_path: Path, local_site) -> None:
+    local_site.pages["/board"] = _board(1, "Robotics Intern", next_page="/board/2")
+    local_site.pages["/board/2"] = _board(2, "SLAM Engineer", next_page="/board/3")
+    local_site.pages["/board/3"] = _board(3, "Never Fetched")
+    local_site.etags["/board"] = '"v1"'
+    source = {
+        "key": "board",
+        "company_name": "Board",
+        "entry_urls": [local_site.url("/board")],
+        "mode": "static",
+        "parser": "selectors",
+        "crawl_depth": 2,
+        "selectors": {"card": "div.job", "company": ".company", "next_page": "a.next"},
+    }
+    config = CompaniesConfig.model_validate({"sources": [source]})
+
+    with session_scope(_db_path(tmp_path, "pages.db")) as session:
+        first = run_crawl(session, config, engine="static").sources[0]
+        second = run_crawl(session, config, engine="static").sources[0]
+        companies = sorted(job.company_name for job in session.exec(select(JobPosting)).all())
+
+    assert local_site.hits == ["/board", "/board/2"] * 2
+    assert local_site.not_modified_hits == []
+    assert first.pages_fetched == 2
+    assert first.upsert.inserted == 2
+    assert companies == ["Vendor 0", "Vendor 0"]
+    assert second.pages_unchanged == 2
+    assert second.upsert.refreshed == 2
+    assert second.upsert.deactivated == 0
+
+
+def test_embedded_job_data_skips_dom_parsing(tmp_path: Path, local_site) -> None:
+    posting = (
+        '{"@type": "JobPosting", "title": "Robotics Intern", "url": "/jobs/ld",'
+        ' "datePosted": "2026-09-01"}'
+    )
+    local_site.pages["/careers/0"] = _listing("SLAM Engineer").replace(
+        "<body>", f'<body><script type="application/ld+json">{posting}</script>'
+    )
+    config = _config(local_site, 1)
+
+    with session_scope(_db_path(tmp_path, "embedded.db")) as session:
+        summary = run_crawl(session, config, engine="static").sources[0]
+        jobs = session.exec(select(JobPosting)).all()
+
+    assert [(job.title, job.posted_at is not None) for job in jobs] == [("Robotics Intern", True)]
+    assert summary.profile.stages["parse_embedded"].calls == 1
+    assert "parse" not in summary.profile.stages
+
+
+def test_embedded_only_changes_are_not_treated_as_unchanged(tmp_path: Path, local_site) -> None:
+    def page(title: str) -> str:
+        posting = f'{{"@type": "JobPosting", "title": "{title}", "url": "/jobs/{len(title)}"}}'
+        return f'<html><body><script type="application/ld+json">{posting}</script></body></html>'
+
+    local_site.pages["/careers/0"] = page("Robotics Intern")
+    config = _config(local_site, 1)
+
+    with session_scope(_db_path(tmp_path, "embedded-hash.db")) as session:
+        run_crawl(session, config, engine="static")
+        local_site.pages["/careers/0"] = page("SLAM Engineer")
+        second = run_crawl(session, config, engine="static").sources[0]
+
+    assert second.pages_unchanged == 0
+    assert second.upsert.inserted == 1
+
+
+def test_embedded_parse_error_falls_back_to_dom(tmp_path: Path, local_site, monkeypatch) -> None:
+    def broken(*args, **kwargs):
+        raise ValueError("bad datePosted")
+
+    monkeypatch.setattr("fmro_pc.crawl.runner.parse_embedded_jobs", broken)
+    local_site.pages["/careers/0"] = _listing("Robotics Intern")
+    local_site.pages["/careers/1"] = _listing("SLAM Engineer")
+    config = _config(local_site, 2)
+
+    with session_scope(_db_path(tmp_path, "embedded-error.db")) as session:
+        result = run_crawl(session, config, engine="static")
+
+    assert [item.upsert.inserted for item in result.sources] == [1, 1]
+    assert "embedded data parse failed" in result.sources[0].errors[0]
+
+
+@pytest.mark.parametrize("etag", [None, '"v1"'])
+def test_carried_jobs_are_reactivated_after_a_failed_run(
+    tmp_path: Path, local_site, etag: str | None
+) -> None:
+    local_site.pages["/careers/0"] = _listing("Robotics Intern", "SLAM Engineer")
+    if etag:
+        local_site.etags["/careers/0"] = etag
+    payload = _config(local_site, 1).model_dump()
+    payload["sources"][0]["retry"] = {"max_attempts": 1, "base_delay_seconds": 0}
+    config = CompaniesConfig.model_validate(payload)
+
+    with session_scope(_db_path(tmp_path, "reactivate.db")) as session:
+        run_crawl(session, config, engine="static")
+        local_site.errors["/careers/0"] = [500]
+        failed = run_crawl(session, config, engine="static").sources[0]
+        recovered = run_crawl(session, config, engine="static").sources[0]
+        jobs = session.exec(select(JobPosting)).all()
+
+    assert failed.upsert.deactivated == 2
+    assert recovered.pages_not_modified + recovered.pages_unchanged == 1
+    assert recovered.upsert.refreshed == 2
+    assert [job.is_active for job in jobs] == [True, True]
+
+
+def test_risk_platform_warning_skips_pages_carried_from_last_run(
+    tmp_path: Path, local_site
+) -> None:
+    local_site.pages["/careers/0"] = _listing("Robotics Intern")
+    local_site.etags["/careers/0"] = '"v1"'
+    payload = _config(local_site, 1).model_dump()
+    payload["sources"][0]["platform"] = "liepin"
+    config = CompaniesConfig.model_validate(payload)
+
+    with session_scope(_db_path(tmp_path, "risk.db")) as session:
+        run_crawl(session, config, engine="static")
+        second = run_crawl(session, config, engine="static")
+        local_site.pages["/careers/0"] = "<html><body>请登录</body></html>"
+        local_site.etags.pop("/careers/0")
+        empty = run_crawl(session, config, engine="static")
+
+    assert second.sources[0].pages_not_modified == 1
+    assert second.sources[0].errors == []
+    assert second.total_failures == 0
+    assert "login Cookie" in empty.sources[0].errors[-1]
+
+
+@pytest.mark.parametrize("etag", [None, '"v1"'])
+def test_unchanged_page_is_reparsed_after_filter_config_changes(
+    tmp_path: Path, local_site, etag: str | None
+) -> None:
+    local_site.pages["/careers/0"] = (
+        "<html><body><ul><li><a href='/jobs/0'>Robotics Intern</a><span>上海</span></li>"
+        "<li><a href='/jobs/1'>SLAM Engineer</a><span>北京</span></li></ul></body></html>"
+    )
+    if etag:
+        local_site.etags["/careers/0"] = etag
+    payload = _config(local_site, 1).model_dump()
+    payload["sources"][0]["parser"] = "selectors"
+    payload["sources"][0]["selectors"] = {"card": "li", "location": "span"}
+    config = CompaniesConfig.model_validate(payload)
+    payload["sources"][0]["city_allowlist"] = ["上海"]
+    filtered = CompaniesConfig.model_validate(payload)
+
+    with session_scope(_db_path(tmp_path, "config-change.db")) as session:
+        first = run_crawl(session, config, engine="static").sources[0]
+        second = run_crawl(session, filtered, engine="static").sources[0]
+        third = run_crawl(session, filtered, engine="static").sources[0]
+        active = [job.title for job in session.exec(select(JobPosting)) if job.is_active]
+
+    assert first.upsert.inserted == 2
+    # The old validators are not sent, so the page comes back in full and is re-parsed.
+    assert second.pages_unchanged + second.pages_not_modified == 0
+    assert second.jobs_filtered_out == 1
+    assert second.upsert.deactivated == 1
+    assert third.pages_unchanged + third.pages_not_modified == 1
+    assert len(local_site.not_modified_hits) == (1 if etag else 0)
+    assert active == ["Robotics Intern"]
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from fmro_pc.crawl.scroll import list_item_selector, scroll_until_stable
+
+
+class _GrowingList:
+    """Fake page whose list grows by one batch per scroll for ``batches`` scrolls."""
+
+    def __init__(self, batches: int, batch_size: int = 10) -> None:
+        self.batches = batches
+        self.batch_size = batch_size
+        self.count = batch_size
+        self.scrolls = 0
+        self.selectors: list[str] = []
+        self.waits: list[int] = []
+
+    def evaluate(self, script: str, arg=None) -> int:
+        if isinstance(arg, dict):
+            self.selectors.append(arg["selector"])
+            self.waits.append(arg["waitMs"])
+            self.scrolls += 1
+            if self.scrolls <= self.batches:
+                self.count += self.batch_size
+        return self.count
+
+
+def test_short_list_stops_after_stable_rounds() -> None:
+    page = _GrowingList(batches=0)
+
+    assert scroll_until_stable(page, stable_rounds=2) == 10
+    assert page.scrolls == 2
+    # Only the first quiet round waits the full time; confirming it is quick.
+    assert sum(page.waits) < 1000
+    assert page.waits == [500, 150]
+
+
+def test_long_list_keeps_scrolling_until_it_stops_growing() -> None:
+    page = _GrowingList(batches=12)
+
+    assert scroll_until_stable(page, selector='a[href*="/job/"]', stable_rounds=2) == 130
+    assert page.scrolls == 14
+    assert set(page.selectors) == {'a[href*="/job/"]'}
+
+
+def test_scroll_respects_round_and_time_caps() -> None:
+    capped = _GrowingList(batches=100)
+    assert scroll_until_stable(capped, max_rounds=5) == 60
+
+    timed = _GrowingList(batches=100)
+    scroll_until_stable(timed, max_seconds=0)
+    assert timed.scrolls == 1
+
+
+def test_list_item_selector_defaults_to_anchors() -> None:
+    assert list_item_selector("boss_zhipin") == 'a[href*="/job_detail/"]'
+    assert list_item_selector("generic_html") == "a[href]"
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import pytest
+
+from fmro_pc.config import SourceConfig
+from fmro_pc.crawl.fetcher import FetchedPage
+from fmro_pc.parsers.selector import SelectorParser, compile_selectors, next_page_url
+
+BOARD = """
+<html><body>
+  <nav><a href="/about">关于我们</a><a href="/jobs/99">Robotics Intern (nav)</a></nav>
+  <div class="job">
+    <a class="title" href="/jobs/1">运动控制工程师</a>
+    <span class="company">宇树科技</span><span class="city">杭州市·滨江区</span>
+    <span class="pay">30-50K</span>
+  </div>
+  <div class="job"><a href="/jobs/2" title="SLAM 算法实习生"><i></i></a></div>
+  <div class="job"><span>no link</span></div>
+  <div class="pager"><a class="next" href="?page=2">下一页</a></div>
+</body></html>
+"""
+SELECTORS = {
+    "title": "a.title",
+    "company": ".company",
+    "location": ".city",
+    "salary": ".pay",
+    "next_page": "a.next",
+}
+
+
+def _source(**selectors) -> SourceConfig:
+    return SourceConfig.model_validate(
+        {
+            "key": "board",
+            "company_name": "Board",
+            "entry_urls": ["https://example.com/jobs"],
+            "parser": "selectors",
+            "selectors": {"card": "div.job", **selectors},
+        }
+    )
+
+
+def test_selector_parser_extracts_only_matched_cards() -> None:
+    source = _source(**SELECTORS)
+    page = FetchedPage(url="https://example.com/jobs", html=BOARD, status_code=200)
+
+    jobs = SelectorParser().parse(page, source)
+
+    assert [(job.title, job.apply_url) for job in jobs] == [
+        ("运动控制工程师", "https://example.com/jobs/1"),
+        ("SLAM 算法实习生", "https://example.com/jobs/2"),
+    ]
+    assert jobs[0].company_name == "宇树科技"
+    assert jobs[0].location == "杭州"
+    assert jobs[0].salary_text == "30-50K"
+    assert jobs[1].company_name is None
+    assert next_page_url(page, source.selectors) == "https://example.com/jobs?page=2"
+    # Equal selector blocks (e.g. the same source in a parse worker) share one compiled form.
+    assert compile_selectors(source.selectors) is compile_selectors(_source(**SELECTORS).selectors)
+
+
+def test_selectors_block_is_validated() -> None:
+    with pytest.raises(ValueError, match="invalid CSS selector"):
+        _source(title="a[")
+    with pytest.raises(ValueError, match="needs a selectors block"):
+        SourceConfig.model_validate(
+            {
+                "key": "board",
+                "company_name": "Board",
+                "entry_urls": ["https://example.com/jobs"],
+                "parser": "selectors",
+            }
+        )
@@ -0,0 +1,50 @@
+import pytest
+
+from fmro_pc.config import SourceConfig
+from fmro_pc.crawl.throttle import HostRateLimiter, RatePolicy, build_rate_limiter
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_token_bucket_allows_burst_then_spaces_requests() -> None:
+    clock = _Clock()
+    limiter = HostRateLimiter(clock=clock)
+    limiter.configure("https://www.liepin.com/zhaopin/", RatePolicy(requests_per_second=2, burst=2))
+
+    delays = [limiter.reserve("https://liepin.com/zhaopin/?key=ai") for _ in range(4)]
+    assert delays == [0.0, 0.0, 0.5, 1.0]
+
+    clock.now = 10.0
+    assert limiter.reserve("https://www.liepin.com/zhaopin/") == 0.0
+
+
+def test_unconfigured_hosts_are_not_throttled() -> None:
+    limiter = HostRateLimiter(clock=_Clock())
+    limiter.configure("https://www.zhipin.com/web", RatePolicy(min_interval_seconds=3))
+
+    assert limiter.reserve("https://careers.example.com/a") == 0.0
+    assert limiter.reserve("https://careers.example.com/b") == 0.0
+    assert limiter.reserve("https://www.zhipin.com/web/1") == 0.0
+    assert limiter.reserve("https://www.zhipin.com/web/2") == 3.0
+
+
+def test_build_rate_limiter_keeps_strictest_policy_per_host() -> None:
+    sources = [
+        SourceConfig(
+            key=key,
+            company_name=key,
+            entry_urls=["https://www.liepin.com/zhaopin/?key=" + key],
+            rate_limit={"requests_per_second": rate},
+        )
+        for key, rate in [("fast", 10.0), ("slow", 0.5)]
+    ]
+    limiter = build_rate_limiter(sources)
+
+    assert limiter.reserve("https://www.liepin.com/a") == 0.0
+    assert limiter.reserve("https://www.liepin.com/b") == pytest.approx(2.0, abs=0.1)